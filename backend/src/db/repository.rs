@@ -178,11 +178,17 @@ impl GameRepository {
         Ok(())
     }
 
-    /// Load all moves for a game
+    /// Load all moves for a game, in the order they were played
+    ///
+    /// Timestamps are whole seconds, so moves made within the same second
+    /// are ordered by their row id (insertion order).
     pub fn load_moves(&self, game_id: &str) -> Result<Vec<Move>, GameError> {
         let mut stmt = self
             .conn
-            .prepare("SELECT player, row, col, timestamp, source FROM moves WHERE game_id = ?1 ORDER BY timestamp ASC")
+            .prepare(
+                "SELECT player, row, col, timestamp, source FROM moves
+                 WHERE game_id = ?1 ORDER BY timestamp ASC, id ASC",
+            )
             .map_err(|e| GameError::DatabaseError {
                 message: e.to_string(),
             })?;
@@ -251,7 +257,8 @@ impl GameRepository {
         let mut stmt = self
             .conn
             .prepare(
-                "SELECT message, timestamp, source FROM taunts WHERE game_id = ?1 ORDER BY timestamp ASC",
+                "SELECT message, timestamp, source FROM taunts
+                 WHERE game_id = ?1 ORDER BY timestamp ASC, id ASC",
             )
             .map_err(|e| GameError::DatabaseError {
                 message: e.to_string(),
@@ -419,6 +426,42 @@ mod tests {
         assert_eq!(moves[1].col, 1);
     }
 
+    #[test]
+    fn test_load_moves_same_second_keeps_play_order() {
+        let repo = GameRepository::new_in_memory().unwrap();
+        let game = create_test_game();
+        let game_id = game.id.clone();
+
+        repo.save_game(&game).unwrap();
+
+        // Both moves land in the same second; the index orders ties by
+        // player/row/col unless the query breaks them by id
+        let first = Move {
+            player: Player::X,
+            row: 2,
+            col: 2,
+            timestamp: 1000,
+            source: Some(MoveSource::UI),
+        };
+        let second = Move {
+            player: Player::O,
+            row: 0,
+            col: 0,
+            timestamp: 1000,
+            source: Some(MoveSource::MCP),
+        };
+
+        repo.save_move(&game_id, &first).unwrap();
+        repo.save_move(&game_id, &second).unwrap();
+
+        let moves = repo.load_moves(&game_id).unwrap();
+        assert_eq!(moves.len(), 2);
+        assert_eq!(moves[0].player, Player::X);
+        assert_eq!((moves[0].row, moves[0].col), (2, 2));
+        assert_eq!(moves[1].player, Player::O);
+        assert_eq!((moves[1].row, moves[1].col), (0, 0));
+    }
+
     #[test]
     fn test_save_and_load_taunts() {
         let repo = GameRepository::new_in_memory().unwrap();
@@ -1,4 +1,4 @@
-use rusqlite::Connection;
+use rusqlite::{Connection, OptionalExtension};
 use shared::GameError;
 
 /// Initialize the database schema
@@ -56,6 +56,47 @@ pub fn init_schema(conn: &Connection) -> Result<(), GameError> {
         message: e.to_string(),
     })?;
 
+    // Covering indexes for the per-game lookups (load_moves, load_taunts,
+    // view_game_state deltas) and for scripts/game_stats.py, which streams
+    // moves in (game_id, timestamp, id) order without touching the table.
+    // Timestamps are whole seconds, so id must come right after timestamp:
+    // otherwise moves made in the same second come back ordered by
+    // player/row/col instead of the order they were played.
+    let existing: Option<String> = conn
+        .query_row(
+            "SELECT sql FROM sqlite_master WHERE type = 'index' AND name = 'idx_moves_game'",
+            [],
+            |row| row.get(0),
+        )
+        .optional()
+        .map_err(|e| GameError::DatabaseError {
+            message: e.to_string(),
+        })?;
+    if matches!(existing, Some(ref sql) if !sql.contains("timestamp, id,")) {
+        // Built by an older server without the id tiebreak; rebuild it once
+        conn.execute("DROP INDEX idx_moves_game", [])
+            .map_err(|e| GameError::DatabaseError {
+                message: e.to_string(),
+            })?;
+    }
+
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_moves_game
+            ON moves (game_id, timestamp, id, player, row, col, source)",
+        [],
+    )
+    .map_err(|e| GameError::DatabaseError {
+        message: e.to_string(),
+    })?;
+
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_taunts_game ON taunts (game_id, timestamp)",
+        [],
+    )
+    .map_err(|e| GameError::DatabaseError {
+        message: e.to_string(),
+    })?;
+
     // Table to track the current active game (singleton pattern)
     conn.execute(
         "CREATE TABLE IF NOT EXISTS current_game (
@@ -106,6 +147,57 @@ mod tests {
         assert_eq!(result.unwrap(), "taunts");
     }
 
+    #[test]
+    fn test_init_schema_creates_indexes() {
+        let conn = Connection::open_in_memory().unwrap();
+        init_schema(&conn).unwrap();
+
+        for name in ["idx_moves_game", "idx_taunts_game"] {
+            let result: Result<String, _> = conn.query_row(
+                "SELECT name FROM sqlite_master WHERE type='index' AND name=?1",
+                [name],
+                |row| row.get(0),
+            );
+            assert_eq!(result.unwrap(), name);
+        }
+
+        // load_moves is answered from the index alone
+        let plan: String = conn
+            .query_row(
+                "EXPLAIN QUERY PLAN SELECT player, row, col, timestamp, source FROM moves
+                 WHERE game_id = ?1 ORDER BY timestamp ASC, id ASC",
+                ["some-game"],
+                |row| row.get(3),
+            )
+            .unwrap();
+        assert!(plan.contains("COVERING INDEX idx_moves_game"), "{plan}");
+    }
+
+    #[test]
+    fn test_init_schema_rebuilds_index_without_id() {
+        let conn = Connection::open_in_memory().unwrap();
+        init_schema(&conn).unwrap();
+
+        // The index as created by older servers
+        conn.execute("DROP INDEX idx_moves_game", []).unwrap();
+        conn.execute(
+            "CREATE INDEX idx_moves_game ON moves (game_id, timestamp, player, row, col, source)",
+            [],
+        )
+        .unwrap();
+
+        init_schema(&conn).unwrap();
+
+        let sql: String = conn
+            .query_row(
+                "SELECT sql FROM sqlite_master WHERE type='index' AND name='idx_moves_game'",
+                [],
+                |row| row.get(0),
+            )
+            .unwrap();
+        assert!(sql.contains("timestamp, id,"), "{sql}");
+    }
+
     #[test]
     fn test_init_schema_idempotent() {
         let conn = Connection::open_in_memory().unwrap();
@@ -44,13 +44,28 @@ impl<'a> McpServer<'a> {
     /// Run the server loop, reading from stdin and writing to stdout
     pub fn run(&mut self) -> io::Result<()> {
         let stdin = io::stdin();
-        let mut stdout = io::stdout();
+        self.serve(stdin.lock(), io::stdout())
+    }
 
-        for line in stdin.lock().lines() {
+    /// Answer one request per input line until the input ends
+    ///
+    /// A line that is not valid UTF-8 gets a parse error response instead of
+    /// ending the loop, like any other malformed request.
+    pub fn serve<R: BufRead, W: Write>(&mut self, reader: R, mut writer: W) -> io::Result<()> {
+        for line in reader.split(b'\n') {
             let line = line?;
-            let response = self.handle_request(&line);
-            writeln!(stdout, "{}", response)?;
-            stdout.flush()?;
+            let line = line.strip_suffix(b"\r").unwrap_or(&line);
+
+            let response = match std::str::from_utf8(line) {
+                Ok(json) => self.handle_request(json),
+                Err(e) => JsonRpcResponse::error(
+                    Value::Null,
+                    JsonRpcError::parse_error(format!("Parse error: {}", e)),
+                )
+                .to_json(),
+            };
+            writeln!(writer, "{}", response)?;
+            writer.flush()?;
         }
 
         Ok(())
@@ -129,7 +144,23 @@ impl<'a> McpServer<'a> {
                     "description": "View the current tic-tac-toe game state including board, turn, status, and history",
                     "inputSchema": {
                         "type": "object",
-                        "properties": {}
+                        "properties": {
+                            "boardFormat": {
+                                "type": "string",
+                                "enum": ["cells", "compact"],
+                                "description": "Board encoding: nested cells (default) or a 9-character row-major string of 'X', 'O' and '.'"
+                            },
+                            "sinceMove": {
+                                "type": "integer",
+                                "description": "Only return moves after the first N (use the previous moveCount)",
+                                "minimum": 0
+                            },
+                            "sinceTaunt": {
+                                "type": "integer",
+                                "description": "Only return taunts after the first N (use the previous tauntCount)",
+                                "minimum": 0
+                            }
+                        }
                     }
                 },
                 {
@@ -157,6 +188,11 @@ impl<'a> McpServer<'a> {
                                 "description": "Column index (0-2)",
                                 "minimum": 0,
                                 "maximum": 2
+                            },
+                            "boardFormat": {
+                                "type": "string",
+                                "enum": ["cells", "compact"],
+                                "description": "Board encoding for the returned gameState (default: cells)"
                             }
                         },
                         "required": ["row", "col"]
@@ -181,15 +217,37 @@ impl<'a> McpServer<'a> {
                     "description": "Restart the game with a fresh board",
                     "inputSchema": {
                         "type": "object",
-                        "properties": {}
+                        "properties": {
+                            "boardFormat": {
+                                "type": "string",
+                                "enum": ["cells", "compact"],
+                                "description": "Board encoding for the returned gameState (default: cells)"
+                            }
+                        }
                     }
                 },
                 {
                     "name": "get_game_history",
-                    "description": "Get the complete history of moves made in the current game",
+                    "description": "Get the history of moves (or taunts) in the current game, optionally one page at a time",
                     "inputSchema": {
                         "type": "object",
-                        "properties": {}
+                        "properties": {
+                            "kind": {
+                                "type": "string",
+                                "enum": ["moves", "taunts"],
+                                "description": "Which history to return (default: moves)"
+                            },
+                            "cursor": {
+                                "type": "integer",
+                                "description": "Index of the first item to return (use the previous nextCursor)",
+                                "minimum": 0
+                            },
+                            "limit": {
+                                "type": "integer",
+                                "description": "Maximum number of items to return (default: all)",
+                                "minimum": 0
+                            }
+                        }
                     }
                 }
             ]
@@ -238,6 +296,23 @@ mod tests {
         assert!(response.contains(r#""code":-32700"#)); // PARSE_ERROR
     }
 
+    #[test]
+    fn test_serve_invalid_utf8_line() {
+        let mut server = create_test_server();
+        let mut input = b"{\"jsonrpc\":\"2.0\",\"id\":1,\"method\":\"\xff\xfe\",\"params\":{}}\n".to_vec();
+        input.extend_from_slice(b"{\"jsonrpc\":\"2.0\",\"id\":2,\"method\":\"get_turn\",\"params\":{}}\r\n");
+        let mut output = Vec::new();
+
+        server.serve(&input[..], &mut output).unwrap();
+
+        let output = String::from_utf8(output).unwrap();
+        let lines: Vec<&str> = output.lines().collect();
+        assert_eq!(lines.len(), 2);
+        assert!(lines[0].contains(r#""code":-32700"#)); // PARSE_ERROR
+        assert!(lines[1].contains(r#""id":2"#));
+        assert!(lines[1].contains(r#""result""#));
+    }
+
     #[test]
     fn test_handle_unknown_method() {
         let mut server = create_test_server();
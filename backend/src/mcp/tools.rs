@@ -3,17 +3,90 @@
 use super::protocol::JsonRpcError;
 use crate::game::manager::GameManager;
 use serde_json::{Value, json};
-use shared::{GameError, MoveSource};
+use shared::{Cell, GameError, MoveSource, Player};
+
+/// Encode the board as a 9-character row-major string ('X', 'O' or '.')
+pub fn compact_board(board: &[[Cell; 3]; 3]) -> String {
+    board
+        .iter()
+        .flatten()
+        .map(|cell| match cell {
+            Cell::Empty => '.',
+            Cell::Occupied(Player::X) => 'X',
+            Cell::Occupied(Player::O) => 'O',
+        })
+        .collect()
+}
+
+/// Parse the optional 'boardFormat' parameter, returning true for "compact"
+fn wants_compact_board(params: &Value) -> Result<bool, JsonRpcError> {
+    match params.get("boardFormat") {
+        None | Some(Value::Null) => Ok(false),
+        Some(value) => match value.as_str() {
+            Some("cells") => Ok(false),
+            Some("compact") => Ok(true),
+            _ => Err(JsonRpcError::invalid_params(
+                "Invalid 'boardFormat' parameter (expected 'cells' or 'compact')".to_string(),
+            )),
+        },
+    }
+}
+
+/// Encode the board either as nested cells or as a compact string
+fn board_value(board: &[[Cell; 3]; 3], compact: bool) -> Value {
+    if compact {
+        json!(compact_board(board))
+    } else {
+        json!(board)
+    }
+}
+
+/// Read an optional non-negative integer parameter
+fn optional_index(params: &Value, name: &str) -> Result<Option<usize>, JsonRpcError> {
+    match params.get(name) {
+        None | Some(Value::Null) => Ok(None),
+        Some(value) => value
+            .as_u64()
+            .map(|v| Some(v as usize))
+            .ok_or_else(|| JsonRpcError::invalid_params(format!("Invalid '{}' parameter", name))),
+    }
+}
+
+/// Read a required row/col parameter
+///
+/// Values that do not fit in a u8 are rejected here rather than truncated,
+/// which would turn e.g. row 256 into row 0.
+fn move_index(params: &Value, name: &str) -> Result<u8, JsonRpcError> {
+    let value = params[name].as_u64().ok_or_else(|| {
+        JsonRpcError::invalid_params(format!("Missing or invalid '{}' parameter", name))
+    })?;
+
+    u8::try_from(value).map_err(|_| {
+        JsonRpcError::invalid_params(format!("Move out of bounds: {} {} is not in 0-2", name, value))
+    })
+}
 
 /// Handle the view_game_state tool call
-pub fn view_game_state(manager: &mut GameManager, _params: Value) -> Result<Value, JsonRpcError> {
+///
+/// Optional params:
+/// - `boardFormat`: "cells" (default) or "compact"
+/// - `sinceMove`: only return moves after the first N (delta update)
+/// - `sinceTaunt`: only return taunts after the first N
+pub fn view_game_state(manager: &mut GameManager, params: Value) -> Result<Value, JsonRpcError> {
+    let compact = wants_compact_board(&params)?;
+    let since_move = optional_index(&params, "sinceMove")?.unwrap_or(0);
+    let since_taunt = optional_index(&params, "sinceTaunt")?.unwrap_or(0);
+
     let game = manager
         .get_game_state()
         .map_err(|e| JsonRpcError::internal_error(format!("Failed to get game state: {}", e)))?;
 
+    let moves = &game.move_history[since_move.min(game.move_history.len())..];
+    let taunts = &game.taunts[since_taunt.min(game.taunts.len())..];
+
     Ok(json!({
         "id": game.id,
-        "board": game.board,
+        "board": board_value(&game.board, compact),
         "currentTurn": match game.current_turn {
             shared::Player::X => "X",
             shared::Player::O => "O",
@@ -34,8 +107,10 @@ pub fn view_game_state(manager: &mut GameManager, _params: Value) -> Result<Valu
             },
             shared::GameStatus::Draw => "Draw",
         },
-        "moveHistory": game.move_history,
-        "taunts": game.taunts,
+        "moveHistory": moves,
+        "taunts": taunts,
+        "moveCount": game.move_history.len(),
+        "tauntCount": game.taunts.len(),
     }))
 }
 
@@ -59,13 +134,10 @@ pub fn get_turn(manager: &mut GameManager, _params: Value) -> Result<Value, Json
 
 /// Handle the make_move tool call
 pub fn make_move(manager: &mut GameManager, params: Value) -> Result<Value, JsonRpcError> {
-    let row = params["row"].as_u64().ok_or_else(|| {
-        JsonRpcError::invalid_params("Missing or invalid 'row' parameter".to_string())
-    })? as u8;
+    let compact = wants_compact_board(&params)?;
 
-    let col = params["col"].as_u64().ok_or_else(|| {
-        JsonRpcError::invalid_params("Missing or invalid 'col' parameter".to_string())
-    })? as u8;
+    let row = move_index(&params, "row")?;
+    let col = move_index(&params, "col")?;
 
     let game = manager
         .make_move(row, col, MoveSource::MCP)
@@ -86,7 +158,7 @@ pub fn make_move(manager: &mut GameManager, params: Value) -> Result<Value, Json
         "success": true,
         "gameState": {
             "id": game.id,
-            "board": game.board,
+            "board": board_value(&game.board, compact),
             "currentTurn": match game.current_turn {
                 shared::Player::X => "X",
                 shared::Player::O => "O",
@@ -124,7 +196,9 @@ pub fn taunt_player(manager: &mut GameManager, params: Value) -> Result<Value, J
 }
 
 /// Handle the restart_game tool call
-pub fn restart_game(manager: &mut GameManager, _params: Value) -> Result<Value, JsonRpcError> {
+pub fn restart_game(manager: &mut GameManager, params: Value) -> Result<Value, JsonRpcError> {
+    let compact = wants_compact_board(&params)?;
+
     let game = manager
         .restart_game()
         .map_err(|e| JsonRpcError::internal_error(format!("Failed to restart game: {}", e)))?;
@@ -133,7 +207,7 @@ pub fn restart_game(manager: &mut GameManager, _params: Value) -> Result<Value,
         "success": true,
         "gameState": {
             "id": game.id,
-            "board": game.board,
+            "board": board_value(&game.board, compact),
             "currentTurn": match game.current_turn {
                 shared::Player::X => "X",
                 shared::Player::O => "O",
@@ -152,14 +226,57 @@ pub fn restart_game(manager: &mut GameManager, _params: Value) -> Result<Value,
     }))
 }
 
+/// Return one page of `items` starting at `cursor`, plus the cursor of the next page
+fn paginate<T: serde::Serialize>(items: &[T], cursor: usize, limit: Option<usize>) -> (Value, Value) {
+    let start = cursor.min(items.len());
+    let end = limit.map_or(items.len(), |limit| start.saturating_add(limit).min(items.len()));
+    let next_cursor = if end < items.len() {
+        json!(end)
+    } else {
+        Value::Null
+    };
+    (json!(&items[start..end]), next_cursor)
+}
+
 /// Handle the get_game_history tool call
-pub fn get_game_history(manager: &mut GameManager, _params: Value) -> Result<Value, JsonRpcError> {
+///
+/// Optional params:
+/// - `kind`: "moves" (default) or "taunts"
+/// - `cursor`: index of the first item to return (default 0)
+/// - `limit`: maximum number of items to return (default: all)
+pub fn get_game_history(manager: &mut GameManager, params: Value) -> Result<Value, JsonRpcError> {
+    let cursor = optional_index(&params, "cursor")?.unwrap_or(0);
+    let limit = optional_index(&params, "limit")?;
+
+    let kind = match params.get("kind") {
+        None | Some(Value::Null) => "moves",
+        Some(value) => match value.as_str() {
+            Some("moves") => "moves",
+            Some("taunts") => "taunts",
+            _ => {
+                return Err(JsonRpcError::invalid_params(
+                    "Invalid 'kind' parameter (expected 'moves' or 'taunts')".to_string(),
+                ));
+            }
+        },
+    };
+
     let game = manager
         .get_game_state()
         .map_err(|e| JsonRpcError::internal_error(format!("Failed to get game state: {}", e)))?;
 
+    let (items, next_cursor, total) = if kind == "moves" {
+        let (items, next_cursor) = paginate(&game.move_history, cursor, limit);
+        (items, next_cursor, game.move_history.len())
+    } else {
+        let (items, next_cursor) = paginate(&game.taunts, cursor, limit);
+        (items, next_cursor, game.taunts.len())
+    };
+
     Ok(json!({
-        "moves": game.move_history
+        kind: items,
+        "nextCursor": next_cursor,
+        "total": total,
     }))
 }
 
@@ -204,6 +321,99 @@ mod tests {
         assert!(result.get("taunts").is_some());
     }
 
+    #[test]
+    fn test_view_game_state_compact_board() {
+        let mut manager = create_test_manager();
+        let game = make_move(&mut manager, json!({"row": 1, "col": 2})).unwrap();
+        let player = game["gameState"]["board"][1][2]["Occupied"]
+            .as_str()
+            .unwrap()
+            .to_string();
+
+        let result = view_game_state(&mut manager, json!({"boardFormat": "compact"})).unwrap();
+
+        assert_eq!(result["board"], format!(".....{}...", player));
+    }
+
+    #[test]
+    fn test_view_game_state_invalid_board_format() {
+        let mut manager = create_test_manager();
+        let result = view_game_state(&mut manager, json!({"boardFormat": "ascii"}));
+
+        assert!(result.is_err());
+        assert_eq!(
+            result.unwrap_err().code,
+            super::super::protocol::INVALID_PARAMS
+        );
+    }
+
+    #[test]
+    fn test_view_game_state_since_move_delta() {
+        let mut manager = create_test_manager();
+        make_move(&mut manager, json!({"row": 0, "col": 0})).unwrap();
+        make_move(&mut manager, json!({"row": 0, "col": 1})).unwrap();
+        make_move(&mut manager, json!({"row": 0, "col": 2})).unwrap();
+
+        let result = view_game_state(&mut manager, json!({"sinceMove": 2})).unwrap();
+        let moves = result["moveHistory"].as_array().unwrap();
+
+        assert_eq!(result["moveCount"], 3);
+        assert_eq!(moves.len(), 1);
+        assert_eq!(moves[0]["col"], 2);
+
+        // A cursor past the end yields an empty delta rather than an error
+        let result = view_game_state(&mut manager, json!({"sinceMove": 10})).unwrap();
+        assert_eq!(result["moveHistory"].as_array().unwrap().len(), 0);
+    }
+
+    #[test]
+    fn test_view_game_state_since_move_delta_same_second() {
+        let db_path = format!("/tmp/test-tools-{}.db", Uuid::new_v4());
+        let mut manager = GameManager::new(&db_path).unwrap();
+        make_move(&mut manager, json!({"row": 2, "col": 2})).unwrap();
+        make_move(&mut manager, json!({"row": 0, "col": 0})).unwrap();
+        make_move(&mut manager, json!({"row": 1, "col": 1})).unwrap();
+
+        // Timestamps are whole seconds; force all three moves into one so
+        // only the insertion order can tell them apart
+        rusqlite::Connection::open(&db_path)
+            .unwrap()
+            .execute("UPDATE moves SET timestamp = 1000", [])
+            .unwrap();
+
+        let cells = |value: &Value| -> Vec<(u64, u64)> {
+            value["moveHistory"]
+                .as_array()
+                .unwrap()
+                .iter()
+                .map(|m| (m["row"].as_u64().unwrap(), m["col"].as_u64().unwrap()))
+                .collect()
+        };
+
+        let full = view_game_state(&mut manager, json!({})).unwrap();
+        assert_eq!(cells(&full), vec![(2, 2), (0, 0), (1, 1)]);
+
+        // Each delta continues exactly where the previous cursor stopped
+        let delta = view_game_state(&mut manager, json!({"sinceMove": 1})).unwrap();
+        assert_eq!(cells(&delta), vec![(0, 0), (1, 1)]);
+        let delta = view_game_state(&mut manager, json!({"sinceMove": 2})).unwrap();
+        assert_eq!(cells(&delta), vec![(1, 1)]);
+    }
+
+    #[test]
+    fn test_view_game_state_since_taunt_delta() {
+        let mut manager = create_test_manager();
+        taunt_player(&mut manager, json!({"message": "One"})).unwrap();
+        taunt_player(&mut manager, json!({"message": "Two"})).unwrap();
+
+        let result = view_game_state(&mut manager, json!({"sinceTaunt": 1})).unwrap();
+        let taunts = result["taunts"].as_array().unwrap();
+
+        assert_eq!(result["tauntCount"], 2);
+        assert_eq!(taunts.len(), 1);
+        assert_eq!(taunts[0]["message"], "Two");
+    }
+
     // get_turn tests
     #[test]
     fn test_get_turn_success() {
@@ -265,6 +475,28 @@ mod tests {
         assert!(err.message.contains("out of bounds"));
     }
 
+    #[test]
+    fn test_make_move_out_of_u8_range() {
+        let mut manager = create_test_manager();
+
+        for params in [
+            json!({"row": 256, "col": 0}),
+            json!({"row": 0, "col": 258}),
+            json!({"row": u64::MAX, "col": 0}),
+        ] {
+            let result = make_move(&mut manager, params);
+
+            assert!(result.is_err());
+            let err = result.unwrap_err();
+            assert_eq!(err.code, super::super::protocol::INVALID_PARAMS);
+            assert!(err.message.contains("out of bounds"));
+        }
+
+        // Nothing was played (256 used to wrap around to row 0)
+        let state = view_game_state(&mut manager, json!({})).unwrap();
+        assert_eq!(state["moveHistory"].as_array().unwrap().len(), 0);
+    }
+
     #[test]
     fn test_make_move_cell_occupied() {
         let mut manager = create_test_manager();
@@ -363,6 +595,52 @@ mod tests {
         assert_eq!(moves.len(), 2);
     }
 
+    #[test]
+    fn test_get_game_history_pagination() {
+        let mut manager = create_test_manager();
+        make_move(&mut manager, json!({"row": 0, "col": 0})).unwrap();
+        make_move(&mut manager, json!({"row": 0, "col": 1})).unwrap();
+        make_move(&mut manager, json!({"row": 0, "col": 2})).unwrap();
+
+        let page1 = get_game_history(&mut manager, json!({"limit": 2})).unwrap();
+        assert_eq!(page1["moves"].as_array().unwrap().len(), 2);
+        assert_eq!(page1["nextCursor"], 2);
+        assert_eq!(page1["total"], 3);
+
+        let page2 = get_game_history(&mut manager, json!({"cursor": 2, "limit": 2})).unwrap();
+        let moves = page2["moves"].as_array().unwrap();
+        assert_eq!(moves.len(), 1);
+        assert_eq!(moves[0]["col"], 2);
+        assert!(page2["nextCursor"].is_null());
+    }
+
+    #[test]
+    fn test_get_game_history_taunts() {
+        let mut manager = create_test_manager();
+        taunt_player(&mut manager, json!({"message": "One"})).unwrap();
+        taunt_player(&mut manager, json!({"message": "Two"})).unwrap();
+
+        let result =
+            get_game_history(&mut manager, json!({"kind": "taunts", "cursor": 1})).unwrap();
+        let taunts = result["taunts"].as_array().unwrap();
+
+        assert_eq!(taunts.len(), 1);
+        assert_eq!(taunts[0]["message"], "Two");
+        assert!(result.get("moves").is_none());
+    }
+
+    #[test]
+    fn test_get_game_history_invalid_kind() {
+        let mut manager = create_test_manager();
+        let result = get_game_history(&mut manager, json!({"kind": "chat"}));
+
+        assert!(result.is_err());
+        assert_eq!(
+            result.unwrap_err().code,
+            super::super::protocol::INVALID_PARAMS
+        );
+    }
+
     #[test]
     fn test_get_game_history_order() {
         let mut manager = create_test_manager();
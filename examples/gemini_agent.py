@@ -5,35 +5,37 @@ Google Gemini agent that plays tic-tac-toe using the MCP HTTP server.
 Usage:
     export GOOGLE_API_KEY="your-api-key-here"
     python3 examples/gemini_agent.py
+
+    # Print every tool result in full
+    python3 examples/gemini_agent.py --verbose
+
+    # Let a local strategy pick the moves; the model only writes the taunts
+    python3 examples/gemini_agent.py --hybrid
 """
 
-import google.generativeai as genai
-import requests
-import json
 import os
+import sys
 
-# MCP server endpoint
-MCP_URL = "http://localhost:3000/mcp"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+from profiling import (phase, profile_run, add_profile_arguments, TurnTimer, summarize_turns,
+                       memory_checkpoint, memory_run)
+import agent_tools
+from agent_tools import dispatch, trim_result
 
-def call_mcp_tool(method, params=None):
-    """Call an MCP tool via HTTP."""
-    payload = {
-        "jsonrpc": "2.0",
-        "method": method,
-        "params": params or {},
-        "id": 1
-    }
-    response = requests.post(MCP_URL, json=payload)
-    result = response.json()
-    if "error" in result:
-        raise Exception(f"MCP Error: {result['error']}")
-    return result.get("result", {})
+# google.generativeai is imported on first use so that importing this
+# module (e.g. from scripts/agent_daemon.py) stays cheap.
+
+# The chat keeps every turn and resends it with each message: keep at most
+# MAX_HISTORY_CONTENTS entries (tool results are cut to their latest taunts
+# by agent_tools.trim_result)
+MAX_HISTORY_CONTENTS = 24
 
 # Define Gemini function declarations
 function_declarations = [
     {
         "name": "view_game_state",
-        "description": "View the current tic-tac-toe game state including board, turn, status, and move history",
+        "description": "View the current tic-tac-toe game state including board, turn, status, and move history. "
+                       "The board is a 9-character row-major string of 'X', 'O' and '.' (empty).",
         "parameters": {
             "type": "object",
             "properties": {}
@@ -89,26 +91,81 @@ function_declarations = [
     }
 ]
 
-def execute_function_call(function_call):
-    """Execute a function call by calling the MCP server."""
-    function_name = function_call.name
-    arguments = dict(function_call.args)
+def stream_turn(chat, prompt, timer):
+    """
+    Stream one model turn.
 
-    print(f"\n🎮 Calling {function_name} with args: {arguments}")
-    result = call_mcp_tool(function_name, arguments)
-    print(f"✅ Result: {json.dumps(result, indent=2)}")
-    return result
+    Gemini sends each function call whole in a single chunk; it is
+    dispatched to the MCP server as soon as that chunk arrives, while any
+    text after it is still streaming.
 
-def run_agent():
-    """Run the Gemini agent to play tic-tac-toe."""
-    genai.configure(api_key=os.environ.get("GOOGLE_API_KEY"))
+    Returns (text, function_call, result).
+    """
+    with phase("llm_wait"):
+        response = chat.send_message(prompt, stream=True)
+
+    text_parts = []
+    function_call = None
+    pending = None
+
+    with phase("llm_wait"):
+        for chunk in response:
+            timer.token()
+            if not chunk.candidates:
+                continue
+            for part in chunk.candidates[0].content.parts:
+                if part.function_call.name:
+                    # Like the non-streaming loop, act on the first call only
+                    if pending is None:
+                        function_call = part.function_call
+                        pending = dispatch(function_call.name, dict(function_call.args), timer)
+                elif part.text:
+                    if not text_parts:
+                        with phase("logging"):
+                            print("\n💬 Gemini says: ", end="")
+                    text_parts.append(part.text)
+                    with phase("logging"):
+                        print(part.text, end="", flush=True)
+
+    if text_parts:
+        print()
+
+    result = pending.result() if pending is not None else None
+    timer.finish()
+    return "".join(text_parts), function_call, result
+
+def trim_history(chat):
+    """
+    Drop the oldest turns from the chat, keeping the opening prompt.
+
+    The kept tail starts at a model entry, so user and model entries still
+    alternate and every function response follows its call.
+    """
+    history = chat.history
+    if len(history) <= MAX_HISTORY_CONTENTS:
+        return
+    start = len(history) - (MAX_HISTORY_CONTENTS - 1)
+    while start < len(history) and history[start].role != "model":
+        start += 1
+    chat.history = history[:1] + history[start:]
+
+def create_model():
+    """Create the Gemini model with function calling enabled (imports the SDK on first call)."""
+    import google.generativeai as genai
 
-    # Create model with function calling enabled
-    model = genai.GenerativeModel(
+    genai.configure(api_key=os.environ.get("GOOGLE_API_KEY"))
+    return genai.GenerativeModel(
         'gemini-pro',
         tools=function_declarations
     )
 
+def run_agent(model=None):
+    """Run the Gemini agent to play tic-tac-toe."""
+    import google.generativeai as genai
+
+    if model is None:
+        model = create_model()
+
     chat = model.start_chat(enable_automatic_function_calling=False)
 
     print("🤖 Starting Gemini agent...")
@@ -123,48 +180,79 @@ def run_agent():
 
     print(f"\n💬 User: {prompt}")
 
+    timers = []
+
     # Allow up to 15 turns
     for turn in range(15):
         print(f"\n--- Turn {turn + 1} ---")
 
-        response = chat.send_message(prompt)
-
-        # Check for function calls
-        if response.candidates[0].content.parts:
-            part = response.candidates[0].content.parts[0]
-
-            if hasattr(part, 'function_call'):
-                function_call = part.function_call
-                result = execute_function_call(function_call)
+        timer = TurnTimer()
+        timers.append(timer)
+        text, function_call, result = stream_turn(chat, prompt, timer)
+        print(f"⏱️  {timer.summary()}")
+        trim_history(chat)
 
-                # Send function response back
-                prompt = genai.protos.Content(
-                    parts=[genai.protos.Part(
-                        function_response=genai.protos.FunctionResponse(
-                            name=function_call.name,
-                            response={'result': result}
-                        )
-                    )]
-                )
+        if function_call is not None:
+            # Send function response back
+            prompt = genai.protos.Content(
+                parts=[genai.protos.Part(
+                    function_response=genai.protos.FunctionResponse(
+                        name=function_call.name,
+                        response={'result': trim_result(result)}
+                    )
+                )]
+            )
 
-            elif hasattr(part, 'text'):
-                # Model responded with text
-                print(f"\n💬 Gemini says: {part.text}")
+        elif text:
+            # Check if game is over
+            if any(word in text.lower() for word in ['game over', 'won', 'draw', 'tie']):
+                break
 
-                # Check if game is over
-                if any(word in part.text.lower() for word in ['game over', 'won', 'draw', 'tie']):
-                    break
-
-                prompt = "Continue playing."
+            prompt = "Continue playing."
 
         else:
             print("\n✅ No more actions from Gemini")
             break
 
     print("\n" + "=" * 60)
+    print(f"⏱️  {summarize_turns(timers)}")
     print("🎮 Game session complete!")
+    memory_checkpoint()
+    return timers
+
+def write_taunt(model, prompt):
+    """Ask Gemini for a single short taunt (function calling disabled)."""
+    with phase("llm_wait"):
+        response = model.generate_content(
+            prompt,
+            tool_config={"function_calling_config": {"mode": "NONE"}}
+        )
+    return response.text
+
+def run_hybrid(model=None, strategy="minimax", poll_interval=0.5):
+    """Play with a local strategy choosing the moves and Gemini writing the taunts."""
+    if model is None:
+        model = create_model()
+
+    return agent_tools.run_hybrid("Gemini", lambda prompt: write_taunt(model, prompt),
+                                  strategy=strategy, poll_interval=poll_interval)
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Gemini agent for Tic-Tac-Toe MCP Game")
+    parser.add_argument("--hybrid", action="store_true",
+                        help="Pick moves with a local strategy and only ask the model for taunts")
+    parser.add_argument("--strategy", choices=["random", "minimax"], default="minimax",
+                        help="Move selection strategy in hybrid mode (default: minimax)")
+    parser.add_argument("--poll-interval", type=float, default=0.5,
+                        help="Seconds between turn checks in hybrid mode (default: 0.5)")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="Print every tool result in full instead of a one-line summary")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    agent_tools.VERBOSE = args.verbose
+
     if not os.environ.get("GOOGLE_API_KEY"):
         print("❌ Error: GOOGLE_API_KEY environment variable not set")
         print("Usage: export GOOGLE_API_KEY='your-key' && python3 examples/gemini_agent.py")
@@ -172,7 +260,11 @@ if __name__ == "__main__":
         exit(1)
 
     try:
-        run_agent()
+        with profile_run(args.profile, args.profile_mode), memory_run(args.memory_every):
+            if args.hybrid:
+                run_hybrid(strategy=args.strategy, poll_interval=args.poll_interval)
+            else:
+                run_agent()
     except KeyboardInterrupt:
         print("\n\n👋 Game interrupted by user")
     except Exception as e:
@@ -5,35 +5,38 @@ OpenAI GPT-4 agent that plays tic-tac-toe using the MCP HTTP server.
 Usage:
     export OPENAI_API_KEY="your-api-key-here"
     python3 examples/openai_agent.py
+
+    # Print every tool result in full
+    python3 examples/openai_agent.py --verbose
+
+    # Let a local strategy pick the moves; the model only writes the taunts
+    python3 examples/openai_agent.py --hybrid
 """
 
-import openai
-import requests
-import json
 import os
+import sys
 
-# MCP server endpoint
-MCP_URL = "http://localhost:3000/mcp"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+from profiling import (phase, profile_run, add_profile_arguments, TurnTimer, summarize_turns,
+                       memory_checkpoint, memory_run)
+from mcp_codec import get_codec
+import agent_tools
+from agent_tools import dispatch, trim_result
 
-def call_mcp_tool(method, params=None):
-    """Call an MCP tool via HTTP."""
-    payload = {
-        "jsonrpc": "2.0",
-        "method": method,
-        "params": params or {},
-        "id": 1
-    }
-    response = requests.post(MCP_URL, json=payload)
-    result = response.json()
-    if "error" in result:
-        raise Exception(f"MCP Error: {result['error']}")
-    return result.get("result", {})
+# openai is imported on first use so that importing this module (e.g. from
+# scripts/agent_daemon.py) stays cheap.
+
+# Bound on the conversation sent with every request: the oldest turns are
+# dropped once it grows past MAX_HISTORY_MESSAGES (tool results are cut to
+# their latest taunts by agent_tools.trim_result)
+MAX_HISTORY_MESSAGES = 24
 
 # Define OpenAI function definitions
 functions = [
     {
         "name": "view_game_state",
-        "description": "View the current tic-tac-toe game state including board, turn, status, and move history",
+        "description": "View the current tic-tac-toe game state including board, turn, status, and move history. "
+                       "The board is a 9-character row-major string of 'X', 'O' and '.' (empty).",
         "parameters": {
             "type": "object",
             "properties": {},
@@ -96,16 +99,103 @@ functions = [
     }
 ]
 
-def execute_function(function_name, arguments):
-    """Execute a function call by calling the MCP server."""
-    print(f"\n🎮 Calling {function_name} with args: {arguments}")
-    result = call_mcp_tool(function_name, arguments)
-    print(f"✅ Result: {json.dumps(result, indent=2)}")
-    return result
+def parse_arguments(text):
+    """Parse function call arguments, or return None while they are incomplete."""
+    try:
+        with phase("json"):
+            return get_codec().loads(text or "{}")
+    except ValueError:
+        return None
+
+def stream_turn(client, messages, timer):
+    """
+    Stream one model turn.
+
+    Text is printed as it arrives. The function call, if any, is dispatched
+    to the MCP server as soon as its arguments form complete JSON, while the
+    rest of the stream is still being read.
+
+    Returns (text, function_name, raw_arguments, result).
+    """
+    with phase("llm_wait"):
+        stream = client.chat.completions.create(
+            model="gpt-4",
+            messages=messages,
+            functions=functions,
+            function_call="auto",
+            stream=True
+        )
+
+    text_parts = []
+    function_name = None
+    argument_parts = []
+    pending = None
+
+    with phase("llm_wait"):
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            timer.token()
+            delta = chunk.choices[0].delta
+
+            if delta.content:
+                if not text_parts:
+                    with phase("logging"):
+                        print("\n💬 GPT-4 says: ", end="")
+                text_parts.append(delta.content)
+                with phase("logging"):
+                    print(delta.content, end="", flush=True)
+
+            function_call = delta.function_call
+            if function_call:
+                if function_call.name:
+                    function_name = function_call.name
+                if function_call.arguments:
+                    argument_parts.append(function_call.arguments)
+                    # Arguments are a JSON object; it can only be complete after a "}"
+                    if pending is None and "}" in function_call.arguments:
+                        arguments = parse_arguments("".join(argument_parts))
+                        if arguments is not None:
+                            pending = dispatch(function_name, arguments, timer)
+
+    if text_parts:
+        print()
+
+    raw_arguments = "".join(argument_parts)
+    result = None
+    if function_name:
+        if pending is None:
+            # Argument-less calls (or arguments that never parsed) go out now
+            pending = dispatch(function_name, parse_arguments(raw_arguments) or {}, timer)
+        result = pending.result()
+    timer.finish()
+
+    return "".join(text_parts), function_name, raw_arguments or "{}", result
+
+def trim_messages(messages):
+    """
+    Keep the system and opening user messages plus the most recent turns.
+
+    The kept tail starts at an assistant message so that no function result
+    is left without the call it answers.
+    """
+    if len(messages) <= MAX_HISTORY_MESSAGES:
+        return
+    start = len(messages) - (MAX_HISTORY_MESSAGES - 2)
+    while start < len(messages) and messages[start]["role"] != "assistant":
+        start += 1
+    del messages[2:start]
 
-def run_agent():
+def create_client():
+    """Create the OpenAI client (imports the SDK on first call)."""
+    import openai
+
+    return openai.OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+
+def run_agent(client=None):
     """Run the OpenAI agent to play tic-tac-toe."""
-    client = openai.OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+    if client is None:
+        client = create_client()
 
     messages = [
         {
@@ -123,59 +213,94 @@ def run_agent():
     print("🤖 Starting OpenAI agent...")
     print("=" * 60)
 
+    timers = []
+
     # Allow up to 10 function calls
     for turn in range(10):
         print(f"\n--- Turn {turn + 1} ---")
 
-        response = client.chat.completions.create(
-            model="gpt-4",
-            messages=messages,
-            functions=functions,
-            function_call="auto"
-        )
-
-        message = response.choices[0].message
-
-        # Check if the model wants to call a function
-        if message.function_call:
-            function_name = message.function_call.name
-            arguments = json.loads(message.function_call.arguments)
-
-            # Execute the function
-            result = execute_function(function_name, arguments)
+        timer = TurnTimer()
+        timers.append(timer)
+        text, function_name, raw_arguments, result = stream_turn(client, messages, timer)
+        print(f"⏱️  {timer.summary()}")
 
+        # Check if the model called a function
+        if function_name:
             # Add function call and result to messages
             messages.append({
                 "role": "assistant",
-                "content": None,
+                "content": text or None,
                 "function_call": {
                     "name": function_name,
-                    "arguments": message.function_call.arguments
+                    "arguments": raw_arguments
                 }
             })
+            with phase("json"):
+                content = get_codec().dumps(trim_result(result))
             messages.append({
                 "role": "function",
                 "name": function_name,
-                "content": json.dumps(result)
+                "content": content
             })
 
         else:
-            # Model responded with text
-            print(f"\n💬 GPT-4 says: {message.content}")
-            messages.append({"role": "assistant", "content": message.content})
+            # Model responded with text only
+            messages.append({"role": "assistant", "content": text})
             break
 
+        trim_messages(messages)
+
     print("\n" + "=" * 60)
+    print(f"⏱️  {summarize_turns(timers)}")
     print("🎮 Game session complete!")
+    memory_checkpoint()
+    return timers
+
+def write_taunt(client, prompt):
+    """Ask GPT-4 for a single short taunt (no functions)."""
+    with phase("llm_wait"):
+        response = client.chat.completions.create(
+            model="gpt-4",
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=60
+        )
+    return response.choices[0].message.content
+
+def run_hybrid(client=None, strategy="minimax", poll_interval=0.5):
+    """Play with a local strategy choosing the moves and GPT-4 writing the taunts."""
+    if client is None:
+        client = create_client()
+
+    return agent_tools.run_hybrid("OpenAI", lambda prompt: write_taunt(client, prompt),
+                                  strategy=strategy, poll_interval=poll_interval)
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="OpenAI agent for Tic-Tac-Toe MCP Game")
+    parser.add_argument("--hybrid", action="store_true",
+                        help="Pick moves with a local strategy and only ask the model for taunts")
+    parser.add_argument("--strategy", choices=["random", "minimax"], default="minimax",
+                        help="Move selection strategy in hybrid mode (default: minimax)")
+    parser.add_argument("--poll-interval", type=float, default=0.5,
+                        help="Seconds between turn checks in hybrid mode (default: 0.5)")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="Print every tool result in full instead of a one-line summary")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    agent_tools.VERBOSE = args.verbose
+
     if not os.environ.get("OPENAI_API_KEY"):
         print("❌ Error: OPENAI_API_KEY environment variable not set")
         print("Usage: export OPENAI_API_KEY='your-key' && python3 examples/openai_agent.py")
         exit(1)
 
     try:
-        run_agent()
+        with profile_run(args.profile, args.profile_mode), memory_run(args.memory_every):
+            if args.hybrid:
+                run_hybrid(strategy=args.strategy, poll_interval=args.poll_interval)
+            else:
+                run_agent()
     except KeyboardInterrupt:
         print("\n\n👋 Game interrupted by user")
     except Exception as e:
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""Run the UI scenarios in parallel headless browser contexts.
+
+The scenarios are the checks from test_ui_firefox.py, screenshot_ui.py,
+test_thinking_indicator.py and test_mcp_thinking.py. Each scenario gets:
+
+- its own backend process (PORT set to a free port, GAME_DB_PATH=:memory:),
+  so scenarios cannot see each other's games
+- its own browser context in one shared headless browser
+
+There are no fixed sleeps: every step waits for a condition (a DOM state,
+the SSE stream being open, the backend answering /health) with a timeout.
+Suite wall time and per-scenario timings are reported at the end.
+
+Requires the release build (./scripts/build.sh: target/release/backend and
+frontend/dist) and Playwright (pip install playwright && playwright install firefox).
+
+Usage:
+    python3 run_ui_tests.py
+    python3 run_ui_tests.py --jobs 2 -k thinking
+    python3 run_ui_tests.py --browser chromium --screenshots /tmp/ui
+"""
+
+import asyncio
+import json
+import os
+import re
+import socket
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BACKEND = os.path.join(REPO_ROOT, "target", "release", "backend")
+
+# The frontend talks to this origin (frontend/src/api/client.rs); each
+# context reroutes it to its own backend
+FRONTEND_API_ORIGIN = "http://localhost:3000"
+
+# MCP_THINKING_DELAY_MS in frontend/src/lib.rs, plus margin
+THINKING_HIDE_TIMEOUT_MS = 5000
+
+
+def free_port():
+    """A TCP port that is free right now"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Backend:
+    """A backend process with an in-memory database on its own port"""
+
+    def __init__(self, binary):
+        self.binary = binary
+        self.port = free_port()
+        self.process = None
+
+    @property
+    def url(self):
+        return f"http://localhost:{self.port}"
+
+    async def start(self, timeout=10.0):
+        env = dict(os.environ, PORT=str(self.port), GAME_DB_PATH=":memory:",
+                   RUST_LOG=os.environ.get("RUST_LOG", "warn"))
+        # cwd matters: the backend serves frontend/dist relative to it
+        self.process = await asyncio.create_subprocess_exec(
+            self.binary, cwd=REPO_ROOT, env=env,
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.returncode is not None:
+                raise RuntimeError(f"backend exited with code {self.process.returncode}")
+            if await self._healthy():
+                return
+            await asyncio.sleep(0.02)
+        raise TimeoutError(f"backend on port {self.port} not ready after {timeout}s")
+
+    async def _healthy(self):
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        except OSError:
+            return False
+        try:
+            writer.write(f"GET /health HTTP/1.1\r\nHost: localhost:{self.port}\r\nConnection: close\r\n\r\n".encode())
+            await writer.drain()
+            status = await reader.readline()
+            return b" 200 " in status
+        finally:
+            writer.close()
+
+    async def stop(self):
+        if self.process and self.process.returncode is None:
+            self.process.kill()
+            await self.process.wait()
+
+
+class ScenarioContext:
+    """What a scenario gets: its page, its backend and a few helpers"""
+
+    def __init__(self, name, page, backend, screenshot_dir):
+        self.name = name
+        self.page = page
+        self.backend = backend
+        self.screenshot_dir = screenshot_dir
+        self.steps = []
+
+    async def open(self):
+        """Load the UI and wait until the game is shown and the SSE stream is open"""
+        async with self.page.expect_response(lambda r: "/api/events" in r.url) as sse:
+            await self.page.goto(self.backend.url, wait_until="domcontentloaded")
+        await sse.value
+        await self.page.locator(".game-info p").filter(has_text="You are").wait_for()
+
+    async def mcp(self, method, params=None):
+        """Call an MCP tool over HTTP, as an agent would"""
+        response = await self.page.request.post(
+            f"{self.backend.url}/mcp",
+            data={"jsonrpc": "2.0", "method": method, "params": params or {}, "id": 1})
+        body = await response.json()
+        if "error" in body:
+            raise AssertionError(f"{method} failed: {body['error']}")
+        return body["result"]
+
+    async def game(self):
+        """The current game as the REST API reports it"""
+        response = await self.page.request.get(f"{self.backend.url}/api/game")
+        return await response.json()
+
+    async def screenshot(self, name, full_page=False):
+        path = os.path.join(self.screenshot_dir, f"{name}.png")
+        await self.page.screenshot(path=path, full_page=full_page)
+        return path
+
+    def step(self, message):
+        self.steps.append(message)
+
+
+def board_marks(page):
+    return page.locator(".game-board .cell").filter(has_text=re.compile("^[XO]$"))
+
+
+async def ensure_human_turn(ctx):
+    """Hand the turn to the human by letting the agent move first if needed"""
+    game = await ctx.game()
+    if game["current_turn"] != game["human_player"]:
+        await ctx.mcp("make_move", {"row": 2, "col": 2})
+        ctx.step("agent moved first")
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+
+async def scenario_page_loads(ctx):
+    """test_ui_firefox.py: the page, board, status and trash talk panel render"""
+    from playwright.async_api import expect
+
+    page = ctx.page
+    await ctx.open()
+    await expect(page).to_have_title(re.compile("Tic Tac Toe"))
+    await expect(page.locator(".game-board .cell")).to_have_count(9)
+    await expect(page.locator(".taunt-display")).to_be_visible()
+    await expect(page.locator(".taunt-input")).to_be_visible()
+    await ctx.screenshot("ui_initial")
+
+
+async def scenario_human_move(ctx):
+    """test_ui_firefox.py: the human plays by dragging the mark onto the board"""
+    from playwright.async_api import expect
+
+    page = ctx.page
+    await ctx.open()
+    await ensure_human_turn(ctx)
+
+    marks = board_marks(page)
+    await expect(page.locator(".draggable-mark.enabled")).to_be_visible()
+    before = await marks.count()
+
+    await page.locator(".draggable-mark.enabled").drag_to(page.locator(".game-board .drop-target").first)
+    await expect(marks).to_have_count(before + 1)
+    await ctx.screenshot("ui_after_move")
+
+    game = await ctx.game()
+    assert any(move["source"] == "UI" for move in game["move_history"]), "move not recorded as a UI move"
+
+
+async def scenario_taunt(ctx):
+    """test_ui_firefox.py: a taunt typed in the panel shows up in the chat"""
+    from playwright.async_api import expect
+
+    page = ctx.page
+    await ctx.open()
+
+    await page.locator(".taunt-input").fill("Nice move... NOT!")
+    await page.locator(".taunt-input").press("Enter")
+    await expect(page.locator(".taunt-message .taunt-text").filter(has_text="Nice move... NOT!")).to_be_visible()
+    await expect(page.locator(".taunt-input")).to_have_value("")
+    await ctx.screenshot("ui_with_taunt")
+
+
+async def scenario_drag_drop_ui(ctx):
+    """screenshot_ui.py: draggable mark, drag hint and drop targets"""
+    from playwright.async_api import expect
+
+    page = ctx.page
+    await ctx.open()
+
+    game = await ctx.game()
+    mark = page.locator(".draggable-mark")
+    await expect(mark).to_have_text(game["human_player"])
+    if game["current_turn"] == game["human_player"]:
+        await expect(mark).to_have_class(re.compile(r"\benabled\b"))
+        await expect(page.locator(".drag-hint")).to_have_text(re.compile("Drag to board"))
+    else:
+        await expect(mark).to_have_class(re.compile(r"\bdisabled\b"))
+        await expect(page.locator(".drag-hint")).to_have_text(re.compile("Wait for your turn"))
+
+    await expect(page.locator(".game-board .drop-target")).to_have_count(9)
+    await ctx.screenshot("ui_with_dragdrop", full_page=True)
+
+
+async def scenario_mcp_thinking(ctx):
+    """test_mcp_thinking.py: an MCP call over HTTP shows the thinking indicator, which then hides"""
+    from playwright.async_api import expect
+
+    page = ctx.page
+    await ctx.open()
+    indicator = page.locator(".mcp-thinking-indicator")
+    await expect(indicator).to_have_count(0)
+    await ctx.screenshot("before_mcp_thinking")
+
+    await ctx.mcp("view_game_state")
+    await expect(indicator).to_be_visible()
+    await expect(indicator).to_contain_text("MCP Agent Thinking")
+    await ctx.screenshot("with_mcp_thinking_indicator")
+
+    await expect(indicator).to_have_count(0, timeout=THINKING_HIDE_TIMEOUT_MS)
+    await ctx.screenshot("after_mcp_thinking")
+
+
+async def scenario_mcp_move(ctx):
+    """
+    test_thinking_indicator.py: an agent's move reaches the board over SSE
+    with the thinking indicator. The original drove the stdio server on a
+    shared game.db, which never notifies the UI; here the agent uses /mcp.
+    """
+    from playwright.async_api import expect
+
+    page = ctx.page
+    await ctx.open()
+
+    game = await ctx.game()
+    if game["current_turn"] == game["human_player"]:
+        # Let the human (over the REST API) move first so it is the agent's turn
+        await page.request.post(f"{ctx.backend.url}/api/game/move", data={"row": 0, "col": 0})
+        await expect(board_marks(page)).to_have_count(1)
+        ctx.step("human moved first")
+
+    before = await board_marks(page).count()
+    await ctx.mcp("make_move", {"row": 1, "col": 1})
+    await expect(page.locator(".game-board .cell").nth(4)).to_have_text(game["ai_player"])
+    await expect(board_marks(page)).to_have_count(before + 1)
+    await expect(page.locator(".mcp-thinking-indicator")).to_be_visible()
+    await ctx.screenshot("with_thinking_indicator")
+
+    await expect(page.locator(".mcp-thinking-indicator")).to_have_count(0, timeout=THINKING_HIDE_TIMEOUT_MS)
+    await ctx.screenshot("after_thinking")
+
+
+SCENARIOS = {
+    "page_loads": scenario_page_loads,
+    "human_move": scenario_human_move,
+    "taunt": scenario_taunt,
+    "drag_drop_ui": scenario_drag_drop_ui,
+    "mcp_thinking": scenario_mcp_thinking,
+    "mcp_move": scenario_mcp_move,
+}
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+async def run_scenario(name, browser, backend_binary, screenshot_dir, timeout_ms, slots):
+    """Run one scenario in a fresh backend and browser context; return its result"""
+    result = {"name": name, "passed": False, "error": None}
+    async with slots:
+        started = time.perf_counter()
+        backend = Backend(backend_binary)
+        context = None
+        ctx = None
+        try:
+            await backend.start()
+            result["backendSeconds"] = round(time.perf_counter() - started, 3)
+
+            context = await browser.new_context(viewport={"width": 1280, "height": 900})
+            context.set_default_timeout(timeout_ms)
+            if backend.url != FRONTEND_API_ORIGIN:
+                await context.route(
+                    f"{FRONTEND_API_ORIGIN}/**",
+                    lambda route: route.continue_(url=route.request.url.replace(FRONTEND_API_ORIGIN, backend.url, 1)))
+
+            page = await context.new_page()
+            ctx = ScenarioContext(name, page, backend, screenshot_dir)
+            scenario_started = time.perf_counter()
+            await SCENARIOS[name](ctx)
+            result["scenarioSeconds"] = round(time.perf_counter() - scenario_started, 3)
+            result["passed"] = True
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"
+            if ctx is not None:
+                try:
+                    result["screenshot"] = await ctx.screenshot(f"failed_{name}", full_page=True)
+                except Exception:
+                    pass
+        finally:
+            if ctx is not None and ctx.steps:
+                result["steps"] = ctx.steps
+            if context is not None:
+                await context.close()
+            await backend.stop()
+            result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+async def run_suite(names, backend_binary, browser_name="firefox", jobs=4, screenshot_dir="screenshots",
+                    timeout_ms=10_000, headed=False):
+    """Run the named scenarios, at most jobs at a time; return the results and wall time"""
+    from playwright.async_api import async_playwright
+
+    os.makedirs(screenshot_dir, exist_ok=True)
+    started = time.perf_counter()
+    async with async_playwright() as p:
+        browser = await getattr(p, browser_name).launch(headless=not headed)
+        launched = time.perf_counter() - started
+        try:
+            slots = asyncio.Semaphore(jobs)
+            results = await asyncio.gather(*(
+                run_scenario(name, browser, backend_binary, screenshot_dir, timeout_ms, slots) for name in names
+            ))
+        finally:
+            await browser.close()
+
+    return {
+        "browser": browser_name,
+        "jobs": jobs,
+        "browserLaunchSeconds": round(launched, 3),
+        "wallSeconds": round(time.perf_counter() - started, 3),
+        "scenarios": results,
+    }
+
+
+def print_report(report, file=sys.stdout):
+    """Print per-scenario timings and the suite wall time"""
+    print(f"{'scenario':<16} {'result':<6} {'backend':>8} {'scenario':>9} {'total':>8}", file=file)
+    for result in report["scenarios"]:
+        print(f"{result['name']:<16} {'PASS' if result['passed'] else 'FAIL':<6} "
+              f"{result.get('backendSeconds', 0):>7.2f}s {result.get('scenarioSeconds', 0):>8.2f}s "
+              f"{result['seconds']:>7.2f}s", file=file)
+        if result["error"]:
+            print(f"  {result['error']}", file=file)
+            if result.get("screenshot"):
+                print(f"  screenshot: {result['screenshot']}", file=file)
+
+    passed = sum(result["passed"] for result in report["scenarios"])
+    serial = sum(result["seconds"] for result in report["scenarios"])
+    print(f"\n{passed}/{len(report['scenarios'])} passed in {report['wallSeconds']:.2f}s wall "
+          f"({serial:.2f}s of scenario time, {report['jobs']} jobs, {report['browser']} launch "
+          f"{report['browserLaunchSeconds']:.2f}s)", file=file)
+
+
+def main():
+    """Main entry point for the UI test runner"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the UI scenarios in parallel headless browser contexts")
+    parser.add_argument("-k", dest="pattern", default=None,
+                        help="Only run scenarios whose name contains this string")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 2,
+                        help="Scenarios run at once (default: one per CPU)")
+    parser.add_argument("--browser", choices=["firefox", "chromium", "webkit"], default="firefox",
+                        help="Browser engine (default: firefox)")
+    parser.add_argument("--backend", default=DEFAULT_BACKEND,
+                        help="Path to the backend binary (default: target/release/backend)")
+    parser.add_argument("--screenshots", default="screenshots",
+                        help="Screenshot directory (default: screenshots)")
+    parser.add_argument("--timeout", type=float, default=10.0,
+                        help="Seconds any single wait may take (default: 10)")
+    parser.add_argument("--headed", action="store_true",
+                        help="Show the browser window")
+    parser.add_argument("--list", action="store_true",
+                        help="List the scenarios and exit")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the report as JSON")
+
+    args = parser.parse_args()
+
+    names = [name for name in SCENARIOS if not args.pattern or args.pattern in name]
+    if args.list:
+        for name in names:
+            print(f"{name:<16} {SCENARIOS[name].__doc__.strip().splitlines()[0]}")
+        return
+    if not names:
+        parser.error(f"no scenario matches '{args.pattern}'")
+
+    if not os.path.exists(args.backend):
+        print(f"Error: backend not found at {args.backend} (./scripts/build.sh)", file=sys.stderr)
+        sys.exit(1)
+    if not os.path.isdir(os.path.join(REPO_ROOT, "frontend", "dist")):
+        print("Error: frontend/dist is missing (./scripts/build.sh)", file=sys.stderr)
+        sys.exit(1)
+    try:
+        import playwright  # noqa: F401
+    except ImportError:
+        print("Error: playwright is required (pip install playwright && playwright install firefox)",
+              file=sys.stderr)
+        sys.exit(1)
+
+    report = asyncio.run(run_suite(names, args.backend, args.browser, max(1, args.jobs), args.screenshots,
+                                   int(args.timeout * 1000), args.headed))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    sys.exit(0 if all(result["passed"] for result in report["scenarios"]) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Persistent AI Agent Daemon for Tic-Tac-Toe MCP Game
+
+Running ai_agent.py or one of the example agents starts a fresh interpreter,
+imports every SDK, spawns an MCP server and builds clients before the first
+move is made. This daemon pays those costs once: it keeps MCP transports,
+agents and provider clients warm and accepts "play a game" jobs over a local
+Unix socket.
+
+The `play` command is a thin client: it only imports the standard library
+modules needed to talk to the socket. The daemon itself imports ai_agent.py
+when it starts serving, and the LLM providers (and their SDKs) only when a
+job asks for them.
+
+Usage:
+    # Start the daemon (foreground, Ctrl+C to stop)
+    python3 scripts/agent_daemon.py serve
+
+    # Log memory growth every 100 games and list the growing allocation sites on exit
+    python3 scripts/agent_daemon.py serve --memory-every 100
+
+    # Play a game with the built-in agent over a warm stdio MCP server
+    python3 scripts/agent_daemon.py play
+
+    # Play three games in a row on the UI server's database (GAME_DB_PATH,
+    # else game.db); --db-path picks another one
+    python3 scripts/agent_daemon.py play --games 3 --db-path game.db
+
+    # A private in-memory database: nothing else can reach it to play the
+    # other side, so the job ends at --max-turns (smoke tests only)
+    python3 scripts/agent_daemon.py play --db-path :memory:
+
+    # Let an LLM provider play (uses the HTTP MCP endpoint)
+    python3 scripts/agent_daemon.py play --provider openai
+
+    # Or only let it taunt while the built-in strategy moves
+    python3 scripts/agent_daemon.py play --provider openai --hybrid --strategy minimax
+
+    # Inspect or stop the daemon
+    python3 scripts/agent_daemon.py status
+    python3 scripts/agent_daemon.py shutdown
+
+Protocol:
+    One JSON object per line in each direction. Requests carry an "action"
+    ("play", "status" or "shutdown"); responses carry "ok" and either the
+    action's result or an "error" message.
+"""
+
+import sys
+import os
+import json
+import socket
+from typing import Optional, Dict, Any
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPTS_DIR)
+EXAMPLES_DIR = os.path.join(REPO_ROOT, "examples")
+
+DEFAULT_SERVER = os.path.join(REPO_ROOT, "target", "release", "game-mcp-server")
+# The database the UI server plays on (same default as the backend). A
+# private ":memory:" database has no UI, so nobody could play the human side;
+# jobs only use one when asked to explicitly.
+DEFAULT_DB_PATH = os.environ.get("GAME_DB_PATH", "game.db")
+DEFAULT_SOCKET = os.environ.get(
+    "AGENT_DAEMON_SOCKET",
+    os.path.join(os.environ.get("XDG_RUNTIME_DIR", "/tmp"), f"ttt-agent-{os.getuid()}.sock"),
+)
+
+
+# ---------------------------------------------------------------------------
+# Client side (kept import-light on purpose)
+# ---------------------------------------------------------------------------
+
+def send_job(job: Dict[str, Any], socket_path: str = DEFAULT_SOCKET) -> Dict[str, Any]:
+    """Send a single job to the daemon and wait for its response"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall((json.dumps(job) + "\n").encode())
+        with sock.makefile("r", encoding="utf-8") as reader:
+            line = reader.readline()
+
+    if not line:
+        raise Exception("Daemon closed the connection without a response")
+    return json.loads(line)
+
+
+# ---------------------------------------------------------------------------
+# Daemon side
+# ---------------------------------------------------------------------------
+
+class StdioTransport:
+    """A long-lived game-mcp-server subprocess speaking JSON-RPC over stdio"""
+
+    def __init__(self, server_path: str, db_path: str):
+        import subprocess
+        import threading
+
+        env = dict(os.environ, GAME_DB_PATH=db_path, RUST_LOG=os.environ.get("RUST_LOG", "error"))
+        self.db_path = db_path
+        self.process = subprocess.Popen(
+            [server_path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            text=True,
+            bufsize=1,
+        )
+        # One MCP server has one current game, so jobs on it run one at a time
+        self.lock = threading.Lock()
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def close(self):
+        if self.alive():
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+
+
+class AgentDaemon:
+    """Keeps transports, agents and LLM providers warm between jobs"""
+
+    def __init__(self, server_path: str, verbose: bool = False):
+        import threading
+
+        self.server_path = server_path
+        self.verbose = verbose
+        self.transports: Dict[str, StdioTransport] = {}
+        self.agents: Dict[str, Any] = {}
+        self.providers: Dict[str, Any] = {}
+        self.lock = threading.Lock()
+        self.jobs_served = 0
+
+    def log(self, message: str):
+        """Log a message if verbose mode is enabled"""
+        if self.verbose:
+            print(f"[Daemon] {message}", file=sys.stderr)
+
+    def get_agent(self, db_path: str):
+        """Return a warm (transport, agent) pair for the given database path"""
+        from ai_agent import MCPClient, TicTacToeAgent
+
+        with self.lock:
+            transport = self.transports.get(db_path)
+            if transport is None or not transport.alive():
+                self.log(f"Starting MCP server for {db_path}")
+                transport = StdioTransport(self.server_path, db_path)
+                client = MCPClient(reader=transport.process.stdout, writer=transport.process.stdin)
+                self.transports[db_path] = transport
+                self.agents[db_path] = TicTacToeAgent(verbose=self.verbose, client=client)
+            return transport, self.agents[db_path]
+
+    def get_provider(self, name: str):
+        """Load an example LLM agent module and its client, once"""
+        import importlib.util
+
+        with self.lock:
+            if name in self.providers:
+                return self.providers[name]
+
+            path = os.path.join(EXAMPLES_DIR, f"{name}_agent.py")
+            if not os.path.exists(path):
+                raise ValueError(f"Unknown provider: {name}")
+
+            spec = importlib.util.spec_from_file_location(f"{name}_agent", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+            if name == "openai":
+                client = module.create_client()
+            else:
+                client = module.create_model()
+
+            self.log(f"Loaded provider {name}")
+            self.providers[name] = (module, client)
+            return self.providers[name]
+
+    def play(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Play one or more games and report how each one ended"""
+        import time
+
+        provider = job.get("provider", "builtin")
+        games = int(job.get("games", 1))
+        results = []
+
+        if provider == "builtin":
+            from ai_agent import STRATEGIES, Ponderer
+
+            transport, agent = self.get_agent(job.get("dbPath") or DEFAULT_DB_PATH)
+            with transport.lock:
+                agent.strategy = STRATEGIES[job.get("strategy", "random")]
+                agent.move_budget = job.get("moveBudget")
+                if not job.get("ponder"):
+                    agent.ponderer = None
+                elif agent.ponderer is None:
+                    agent.ponderer = Ponderer()  # its cache stays warm across jobs
+                for _ in range(games):
+                    started = time.perf_counter()
+                    if job.get("restart", True):
+                        agent.restart_game()
+                    agent.ai_player = None
+                    agent.last_status = None
+                    agent.move_stats.clear()
+                    agent.run(poll_interval=float(job.get("pollInterval", 1.0)),
+                              max_turns=int(job.get("maxTurns", 100)))
+                    results.append({
+                        "status": agent.last_status,
+                        "seconds": round(time.perf_counter() - started, 3),
+                    })
+        else:
+            module, client = self.get_provider(provider)
+            for _ in range(games):
+                started = time.perf_counter()
+                if job.get("hybrid"):
+                    status = module.run_hybrid(client, strategy=job.get("strategy", "minimax"),
+                                               poll_interval=float(job.get("pollInterval", 0.5)))
+                    results.append({"status": status, "seconds": round(time.perf_counter() - started, 3)})
+                else:
+                    module.run_agent(client)
+                    results.append({"seconds": round(time.perf_counter() - started, 3)})
+
+        self.jobs_served += 1
+        return {"provider": provider, "games": results}
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "jobsServed": self.jobs_served,
+            "transports": [db for db, t in self.transports.items() if t.alive()],
+            "providers": sorted(self.providers),
+        }
+
+    def handle(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch a job to the matching action"""
+        action = job.get("action")
+        if action == "play":
+            return self.play(job)
+        if action == "status":
+            return self.status()
+        raise ValueError(f"Unknown action: {action}")
+
+    def close(self):
+        for transport in self.transports.values():
+            transport.close()
+
+
+def serve(socket_path: str, server_path: str, verbose: bool = False, memory_every: Optional[int] = None):
+    """Run the daemon until interrupted or asked to shut down"""
+    import socketserver
+    import threading
+
+    # The built-in agent lives next to this script
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    import ai_agent  # noqa: F401 -- warm the agent module before the first job
+    from profiling import memory_run
+
+    daemon = AgentDaemon(server_path, verbose=verbose)
+
+    class JobHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            line = self.rfile.readline()
+            if not line:
+                return
+            try:
+                job = json.loads(line)
+                if job.get("action") == "shutdown":
+                    response = {"ok": True}
+                    threading.Thread(target=server.shutdown, daemon=True).start()
+                else:
+                    response = {"ok": True, **daemon.handle(job)}
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            self.wfile.write((json.dumps(response) + "\n").encode())
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    server = socketserver.ThreadingUnixStreamServer(socket_path, JobHandler)
+    server.daemon_threads = True
+    print(f"[Daemon] Listening on {socket_path}", file=sys.stderr)
+
+    try:
+        with memory_run(memory_every):
+            server.serve_forever()
+    except KeyboardInterrupt:
+        print("[Daemon] Interrupted by user", file=sys.stderr)
+    finally:
+        server.server_close()
+        daemon.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        print("[Daemon] Stopped.", file=sys.stderr)
+
+
+def main(argv: Optional[list] = None):
+    """Main entry point for the agent daemon and its client"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Persistent AI agent daemon for Tic-Tac-Toe MCP Game")
+    parser.add_argument("--socket", "-s", default=DEFAULT_SOCKET,
+                        help=f"Unix socket path (default: {DEFAULT_SOCKET})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="Run the daemon in the foreground")
+    serve_parser.add_argument("--server", default=DEFAULT_SERVER,
+                              help="Path to the game-mcp-server binary")
+    serve_parser.add_argument("--verbose", "-v", action="store_true",
+                              help="Enable verbose logging")
+    serve_parser.add_argument("--memory-every", metavar="N", type=int, default=None,
+                              help="Trace allocations and report memory growth every N games played")
+
+    play_parser = subparsers.add_parser("play", help="Submit a play job to the daemon")
+    play_parser.add_argument("--provider", default="builtin", choices=["builtin", "openai", "gemini"],
+                             help="Who picks the moves (default: builtin)")
+    play_parser.add_argument("--games", "-n", type=int, default=1,
+                             help="Number of games to play (default: 1)")
+    play_parser.add_argument("--db-path", default=DEFAULT_DB_PATH,
+                             help="GAME_DB_PATH for the built-in agent's MCP server; use the UI server's "
+                                  "database so someone can play the other side. ':memory:' gives the job "
+                                  f"a private database (default: {DEFAULT_DB_PATH})")
+    play_parser.add_argument("--poll-interval", "-p", type=float, default=1.0,
+                             help="Polling interval in seconds (default: 1.0)")
+    play_parser.add_argument("--max-turns", "-m", type=int, default=100,
+                             help="Maximum number of turns per game (default: 100)")
+    play_parser.add_argument("--strategy", default="random", choices=["random", "minimax"],
+                             help="Built-in agent's move selection strategy (default: random)")
+    play_parser.add_argument("--move-budget", "-b", type=float, default=None,
+                             help="Maximum seconds per AI turn (default: no limit)")
+    play_parser.add_argument("--ponder", action="store_true",
+                             help="Precompute replies while waiting for the opponent")
+    play_parser.add_argument("--hybrid", action="store_true",
+                             help="With an LLM provider: the strategy moves, the model only taunts")
+    play_parser.add_argument("--no-restart", action="store_true",
+                             help="Continue the current game instead of starting a new one")
+
+    subparsers.add_parser("status", help="Show daemon status")
+    subparsers.add_parser("shutdown", help="Stop the daemon")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.socket, args.server, verbose=args.verbose, memory_every=args.memory_every)
+        return
+
+    if args.command == "play":
+        job = {
+            "action": "play",
+            "provider": args.provider,
+            "games": args.games,
+            # The daemon may run in another directory than this client
+            "dbPath": args.db_path if args.db_path == ":memory:" else os.path.abspath(args.db_path),
+            "pollInterval": args.poll_interval,
+            "maxTurns": args.max_turns,
+            "strategy": args.strategy,
+            "moveBudget": args.move_budget,
+            "ponder": args.ponder,
+            "hybrid": args.hybrid,
+            "restart": not args.no_restart,
+        }
+    else:
+        job = {"action": args.command}
+
+    try:
+        response = send_job(job, args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"Error: no agent daemon listening on {args.socket}", file=sys.stderr)
+        print("Start one with: python3 scripts/agent_daemon.py serve", file=sys.stderr)
+        sys.exit(1)
+
+    print(json.dumps(response))
+    if not response.get("ok"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+MCP tool helpers shared by the example LLM agents.
+
+examples/openai_agent.py and examples/gemini_agent.py differ only in how
+they talk to their SDK: the function declarations, the streaming loop and
+the shape of the conversation. Calling the MCP server, running a tool
+call in the background while the model's reply is still streaming,
+printing and trimming tool results, and hybrid play are the same for
+both and live here.
+
+Usage (from an example agent, with scripts/ on sys.path):
+    import agent_tools
+    from agent_tools import dispatch, trim_result
+
+    agent_tools.VERBOSE = args.verbose
+    future = dispatch("view_game_state", {}, timer)
+    result = trim_result(future.result())
+"""
+
+import json
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, Callable
+
+from mcp_codec import get_codec
+from profiling import phase, TurnTimer
+
+# requests is imported on first use so that importing an example agent
+# (e.g. from scripts/agent_daemon.py) stays cheap.
+
+# MCP server endpoint
+MCP_URL = "http://localhost:3000/mcp"
+
+# Tool results sent back to the model carry only their latest taunts
+MAX_TAUNTS_IN_RESULT = 5
+
+# Print every tool result in full (--verbose); otherwise one summary line each
+VERBOSE = False
+
+# Tools that return a board; ask for the compact 9-character encoding, which
+# is both smaller on the wire and fewer tokens for the model to read
+COMPACT_BOARD_TOOLS = {"view_game_state", "make_move", "restart_game"}
+
+_session = None
+_dispatcher = None
+
+
+def http_session():
+    """Return a shared keep-alive HTTP session (imports requests on first call)."""
+    global _session
+    if _session is None:
+        import requests
+        _session = requests.Session()
+    return _session
+
+
+def call_mcp_tool(method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Call an MCP tool via HTTP."""
+    if method in COMPACT_BOARD_TOOLS:
+        params = {"boardFormat": "compact", **(params or {})}
+    payload = {
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": params or {},
+        "id": 1
+    }
+    codec = get_codec()
+    with phase("json"):
+        body = codec.dumps(payload)
+    with phase("mcp_io"):
+        response = http_session().post(MCP_URL, data=body, headers={"Content-Type": "application/json"})
+    with phase("json"):
+        result = codec.loads(response.content)
+    if "error" in result:
+        raise Exception(f"MCP Error: {result['error']}")
+    return result.get("result", {})
+
+
+def summarize_result(result: Any) -> str:
+    """One line for a tool result: its error, or the game status and board."""
+    if not isinstance(result, dict):
+        return str(result)
+    if "error" in result:
+        return f"error: {result['error']}"
+    state = result.get("gameState", result)
+    fields = [f"{key}={state[key]}" for key in ("status", "currentTurn", "board", "total")
+              if isinstance(state, dict) and key in state]
+    if "message" in result:
+        fields.append(f"message={result['message']}")
+    return ", ".join(fields) or ", ".join(sorted(result))
+
+
+def trim_result(result: Any) -> Any:
+    """Drop all but the latest taunts from a tool result (and its nested gameState)."""
+    if not isinstance(result, dict):
+        return result
+    trimmed = dict(result)
+    taunts = trimmed.get("taunts")
+    if isinstance(taunts, list) and len(taunts) > MAX_TAUNTS_IN_RESULT:
+        trimmed["taunts"] = taunts[-MAX_TAUNTS_IN_RESULT:]
+    if isinstance(trimmed.get("gameState"), dict):
+        trimmed["gameState"] = trim_result(trimmed["gameState"])
+    return trimmed
+
+
+def execute_tool(name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Execute a function call by calling the MCP server, printing the call and its result."""
+    with phase("logging"):
+        print(f"\n🎮 Calling {name} with args: {arguments}")
+    result = call_mcp_tool(name, arguments)
+    with phase("logging"):
+        if VERBOSE:
+            print(f"✅ Result: {json.dumps(result, indent=2)}")
+        else:
+            print(f"✅ Result: {summarize_result(result)}")
+    return result
+
+
+def dispatch(name: str, arguments: Dict[str, Any], timer: TurnTimer) -> Future:
+    """Start executing a function call in the background and return its future."""
+    global _dispatcher
+    if _dispatcher is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _dispatcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mcp-dispatch")
+    timer.dispatch()
+    return _dispatcher.submit(execute_tool, name, arguments)
+
+
+def run_hybrid(provider: str, write_taunt: Callable[[str], str], strategy: str = "minimax",
+               poll_interval: float = 0.5) -> str:
+    """Play with a local strategy choosing the moves and write_taunt asking the model for taunts."""
+    from ai_agent import STRATEGIES
+    from hybrid_play import HybridPlayer
+
+    print(f"🤖 Starting {provider} agent in hybrid mode...")
+    player = HybridPlayer(call_mcp_tool, write_taunt, strategy=STRATEGIES[strategy],
+                          poll_interval=poll_interval)
+    status = player.play()
+    print(f"🎮 {player.summary()}")
+    return status
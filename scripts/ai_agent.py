@@ -10,7 +10,7 @@ The agent follows this logic:
 2. If it's not the AI's turn, poll and wait
 3. If it's the AI's turn:
    - Get the current board state (view_game_state)
-   - Select a move (simple strategy: first available cell)
+   - Select a move (pluggable strategy, optionally under a per-move deadline)
    - Make the move (make_move)
    - Optionally taunt the opponent (taunt_player)
 4. Repeat until game is over
@@ -19,22 +19,360 @@ Usage:
     # Connect to MCP server via subprocess
     python3 scripts/ai_agent.py
 
+    # Play perfect moves but never take longer than 200 ms per turn
+    python3 scripts/ai_agent.py --strategy minimax --move-budget 0.2
+
+    # Play a policy learned by scripts/selfplay_trainer.py
+    python3 scripts/ai_agent.py --policy policy.json
+
     # Or test directly with the MCP server binary
     ./target/release/game-mcp-server < input.jsonl
 """
 
 import sys
 import json
+import math
 import time
 import random
-from typing import Optional, Dict, Any, List, Tuple
+import threading
+from collections import deque
+from typing import Optional, Dict, Any, List, Tuple, TextIO, Union, Iterator, Callable, Deque
+
+from profiling import phase, profile_run, add_profile_arguments, memory_checkpoint, memory_run
+from mcp_codec import EMPTY_BOARD, Codec, GameState, Move, Taunt, decode_board, get_codec
+
+# A board as returned by the MCP server: nested cells ("Empty" or
+# {"Occupied": "X"}) or, with boardFormat="compact", a 9-character
+# row-major string of "X", "O" and "."
+Board = Union[str, List[List[Any]]]
+
+
+WIN_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),  # rows
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),  # columns
+    (0, 4, 8), (2, 4, 6),             # diagonals
+)
+
+
+def winner(cells: str) -> Optional[str]:
+    """Return "X" or "O" if that player has three in a row on a compact board"""
+    for a, b, c in WIN_LINES:
+        if cells[a] != "." and cells[a] == cells[b] == cells[c]:
+            return cells[a]
+    return None
+
+
+class MoveSearch:
+    """
+    Shared state between the agent and a strategy running under a deadline.
+
+    Strategies call offer() whenever they have a move worth playing and
+    should poll expired() to stop early. When the deadline passes the agent
+    plays whatever was offered last, whether or not the strategy returned.
+    """
+
+    def __init__(self, deadline: float = math.inf):
+        """
+        Args:
+            deadline: time.monotonic() value by which a move is needed
+        """
+        self.deadline = deadline
+        self.started = time.monotonic()
+        self.best_move: Optional[Tuple[int, int]] = None
+        self.depth = 0
+        self.timed_out = False
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline"""
+        return max(0.0, self.deadline - time.monotonic())
+
+    def expired(self) -> bool:
+        """True once the deadline has passed (or the agent gave up waiting)"""
+        return self.timed_out or time.monotonic() >= self.deadline
+
+    def offer(self, move: Tuple[int, int], depth: int = 0):
+        """Record the best move found so far and how deep the search went"""
+        with self._lock:
+            self.best_move = move
+            self.depth = depth
+
+    def result(self) -> Tuple[Optional[Tuple[int, int]], int]:
+        with self._lock:
+            return self.best_move, self.depth
+
+
+# A strategy receives the compact board, the player to move and the search
+# it reports into. It may return its final move or None (use the last offer).
+Strategy = Callable[[str, str, MoveSearch], Optional[Tuple[int, int]]]
+
+
+def random_strategy(cells: str, player: str, search: MoveSearch) -> Optional[Tuple[int, int]]:
+    """Pick a random empty cell"""
+    empty = [index for index, cell in enumerate(cells) if cell == "."]
+    return divmod(random.choice(empty), 3) if empty else None
+
+
+class _SearchTimeout(Exception):
+    pass
+
+
+def _negamax(cells: str, player: str, depth: int, alpha: int, beta: int, search: MoveSearch) -> int:
+    """Score a position for the player to move; 0 at the depth horizon"""
+    if search.expired():
+        raise _SearchTimeout()
+
+    opponent = "O" if player == "X" else "X"
+    empty = [index for index, cell in enumerate(cells) if cell == "."]
+
+    # Only the previous mover can have just completed a line
+    if winner(cells) == opponent:
+        return -(10 + len(empty))  # prefer quicker wins / slower losses
+    if not empty or depth == 0:
+        return 0
+
+    best = -math.inf
+    for index in empty:
+        child = cells[:index] + player + cells[index + 1:]
+        score = -_negamax(child, opponent, depth - 1, -beta, -alpha, search)
+        if score > best:
+            best = score
+        alpha = max(alpha, score)
+        if alpha >= beta:
+            break
+    return best
+
+
+def minimax_strategy(cells: str, player: str, search: MoveSearch) -> Optional[Tuple[int, int]]:
+    """
+    Iterative-deepening negamax with alpha-beta pruning.
+
+    Each completed depth is offered to the search, so the best move found so
+    far is always available when the deadline cuts the search short.
+    """
+    empty = [index for index, cell in enumerate(cells) if cell == "."]
+    if not empty:
+        return None
+
+    opponent = "O" if player == "X" else "X"
+    best_index = 4 if 4 in empty else empty[0]
+
+    for depth in range(1, len(empty) + 1):
+        # Search the previous depth's best move first for better pruning
+        ordered = [best_index] + [index for index in empty if index != best_index]
+        depth_best, alpha = None, -math.inf
+        try:
+            for index in ordered:
+                child = cells[:index] + player + cells[index + 1:]
+                score = -_negamax(child, opponent, depth - 1, -math.inf, -alpha, search)
+                if depth_best is None or score > alpha:
+                    depth_best, alpha = index, score
+        except _SearchTimeout:
+            break
+
+        best_index = depth_best
+        search.offer(divmod(best_index, 3), depth)
+
+    return divmod(best_index, 3)
+
+
+def relative_index(cells: str, player: str) -> int:
+    """
+    Encode a compact board as seen by the player to move.
+
+    Cell i contributes 3**i times 0 (empty), 1 (the mover's mark) or 2 (the
+    opponent's), so a position and its colour-swapped twin share an index.
+    """
+    index = 0
+    weight = 1
+    for cell in cells:
+        if cell != ".":
+            index += weight if cell == player else 2 * weight
+        weight *= 3
+    return index
+
+
+class PolicyStrategy:
+    """
+    Plays the moves of a policy file written by selfplay_trainer.py.
+
+    The file maps every relative_index() to the cell to play ("-" where the
+    trainer never chose one); positions it has no move for fall back to the
+    agent's random choice.
+    """
+
+    FORMAT = "tictactoe-policy"
+
+    def __init__(self, path: str):
+        with open(path) as f:
+            policy = json.load(f)
+        if policy.get("format") != self.FORMAT or policy.get("version") != 1:
+            raise ValueError(f"{path} is not a version 1 {self.FORMAT} file")
+        self.path = path
+        self.moves: str = policy["moves"]
+
+    def __call__(self, cells: str, player: str, search: MoveSearch) -> Optional[Tuple[int, int]]:
+        choice = self.moves[relative_index(cells, player)]
+        if not choice.isdigit() or cells[int(choice)] != ".":
+            return None
+        move = divmod(int(choice), 3)
+        search.offer(move)
+        return move
+
+
+STRATEGIES: Dict[str, Strategy] = {
+    "random": random_strategy,
+    "minimax": minimax_strategy,
+}
+
+
+class Ponderer:
+    """
+    Thinks about the AI's reply while the opponent is still deciding.
+
+    For the current position a background thread plays each possible
+    opponent move and runs the strategy on the result, caching the reply by
+    position. When the opponent has moved, the agent looks the new position
+    up and can answer without searching.
+    """
+
+    # Positions repeat across games, but keep the cache bounded
+    MAX_CACHE_SIZE = 50_000
+
+    def __init__(self):
+        self.strategy: Optional[Strategy] = None
+        self.cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], int]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._position: Optional[Tuple[str, str]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._search: Optional[MoveSearch] = None
+        self._stop = threading.Event()
+
+    def start(self, cells: str, ai_player: str, strategy: Strategy):
+        """Start pondering the replies to every opponent move from this position"""
+        if (self._position == (cells, ai_player) and strategy is self.strategy
+                and self._thread and self._thread.is_alive()):
+            return
+
+        self.stop()
+        if strategy is not self.strategy:
+            self.cache.clear()
+            self.strategy = strategy
+        self._position = (cells, ai_player)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(cells, ai_player, strategy, self._stop),
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop pondering (the AI's turn has come, or the game is over)"""
+        self._stop.set()
+        search = self._search
+        if search is not None:
+            search.timed_out = True
+        self._position = None
+
+    def lookup(self, cells: str, ai_player: str) -> Optional[Tuple[Tuple[int, int], int]]:
+        """Return the pondered (move, depth) for this position, if any"""
+        result = self.cache.get((cells, ai_player))
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    @staticmethod
+    def _likely_replies(cells: str) -> List[int]:
+        """Opponent moves, most likely first: wins and blocks, then center, corners, edges"""
+        def completes_line(index: int) -> bool:
+            for line in WIN_LINES:
+                if index in line:
+                    a, b = (cells[i] for i in line if i != index)
+                    if a != "." and a == b:
+                        return True
+            return False
+
+        prior = [index for index in (4, 0, 2, 6, 8, 1, 3, 5, 7) if cells[index] == "."]
+        forced = [index for index in prior if completes_line(index)]
+        return forced + [index for index in prior if index not in forced]
+
+    def _run(self, cells: str, ai_player: str, strategy: Strategy, stop: threading.Event):
+        opponent = "O" if ai_player == "X" else "X"
+
+        for index in self._likely_replies(cells):
+            if stop.is_set():
+                return
+
+            child = cells[:index] + opponent + cells[index + 1:]
+            key = (child, ai_player)
+            if key in self.cache or winner(child) or "." not in child:
+                continue
+
+            search = MoveSearch()
+            self._search = search
+            if stop.is_set():
+                return
+            try:
+                with phase("strategy"):
+                    move = strategy(child, ai_player, search)
+            except Exception:
+                continue
+            if search.timed_out:
+                return  # interrupted mid-search; the result may be incomplete
+
+            move = move or search.result()[0]
+            if move is not None:
+                if len(self.cache) >= self.MAX_CACHE_SIZE:
+                    self.cache.clear()
+                self.cache[key] = (move, search.depth)
 
 
 class MCPClient:
     """Simple MCP (Model Context Protocol) client using JSON-RPC 2.0"""
 
-    def __init__(self):
+    def __init__(self, reader: Optional[TextIO] = None, writer: Optional[TextIO] = None,
+                 codec: Optional[Codec] = None):
+        """
+        Args:
+            reader: Stream the MCP server writes responses to (default: stdin)
+            writer: Stream the MCP server reads requests from (default: stdout)
+            codec: JSON codec (default: the fastest installed, see mcp_codec)
+        """
         self.request_id = 0
+        self.reader = reader
+        self.writer = writer
+        self.codec = codec or get_codec()
+        # Smoothed round-trip time, used to reserve time for make_move
+        self.avg_latency = 0.0
+
+    def _round_trip(self, method: str, params: Optional[Dict[str, Any]]) -> str:
+        """Send one request and return the raw response line"""
+        self.request_id += 1
+        request = {
+            "jsonrpc": "2.0",
+            "id": self.request_id,
+            "method": method,
+            "params": params or {}
+        }
+
+        started = time.monotonic()
+
+        with phase("json"):
+            request_json = self.codec.dumps(request)
+
+        with phase("mcp_io"):
+            # Send request to stdout (MCP server reads from stdin)
+            print(request_json, file=self.writer or sys.stdout, flush=True)
+
+            # Read response from stdin (MCP server writes to stdout)
+            response_line = (self.reader or sys.stdin).readline()
+        if not response_line:
+            raise Exception("No response from MCP server")
+
+        latency = time.monotonic() - started
+        self.avg_latency = latency if self.avg_latency == 0.0 else 0.8 * self.avg_latency + 0.2 * latency
+        return response_line
 
     def call_tool(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -47,40 +385,132 @@ class MCPClient:
         Returns:
             The result from the tool call
         """
-        self.request_id += 1
-        request = {
-            "jsonrpc": "2.0",
-            "id": self.request_id,
-            "method": method,
-            "params": params or {}
-        }
+        response_line = self._round_trip(method, params)
+        with phase("json"):
+            return self.codec.decode_result(response_line)
 
-        # Send request to stdout (MCP server reads from stdin)
-        request_json = json.dumps(request)
-        print(request_json, file=sys.stdout, flush=True)
+    def view_game_state(self, params: Optional[Dict[str, Any]] = None) -> GameState:
+        """Call view_game_state and decode the result into a GameState"""
+        response_line = self._round_trip("view_game_state", params)
+        with phase("json"):
+            return self.codec.decode_game_state(response_line)
 
-        # Read response from stdin (MCP server writes to stdout)
-        response_line = sys.stdin.readline()
-        if not response_line:
-            raise Exception("No response from MCP server")
 
-        response = json.loads(response_line)
+class GameView:
+    """
+    Client-side mirror of the current game, kept up to date with deltas.
+
+    Each refresh asks view_game_state for a compact board and only the moves
+    and taunts added since the previous refresh, so the payload stays small
+    however long the game and its taunt traffic get. The deltas are kept
+    undecoded until move_history or taunts is read, and only the last
+    MAX_TAUNTS taunts are kept, so a game that is taunted forever does not
+    grow the agent.
+    """
 
-        # Check for errors
-        if "error" in response:
-            error = response["error"]
-            raise Exception(f"MCP Error ({error.get('code')}): {error.get('message')}")
+    MAX_TAUNTS = 100
 
-        return response.get("result", {})
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget everything (e.g. after the game was restarted)"""
+        self.game_id: Optional[str] = None
+        self.board = EMPTY_BOARD
+        self.state: Optional[GameState] = None
+        self.move_count = 0
+        self.taunt_count = 0
+        self._moves: List[Move] = []
+        self._taunts: Deque[Taunt] = deque(maxlen=self.MAX_TAUNTS)
+        self._pending: List[GameState] = []
+
+    @property
+    def move_history(self) -> List[Move]:
+        self._flush()
+        return self._moves
+
+    @property
+    def taunts(self) -> Deque[Taunt]:
+        self._flush()
+        return self._taunts
+
+    def _flush(self):
+        for state in self._pending:
+            self._moves.extend(state.move_history)
+            self._taunts.extend(state.taunts)
+        self._pending.clear()
+
+    def request_params(self) -> Dict[str, Any]:
+        """Parameters for the next view_game_state call"""
+        return {
+            "boardFormat": "compact",
+            "sinceMove": self.move_count,
+            "sinceTaunt": self.taunt_count,
+        }
+
+    def apply(self, state: GameState, params: Dict[str, Any]) -> bool:
+        """
+        Merge a view_game_state response.
+
+        Returns:
+            False if the response has to be refetched in full because the
+            delta was cut against a different game
+        """
+        if state.id != self.game_id:
+            if params.get("sinceMove") or params.get("sinceTaunt"):
+                return False
+            self.reset()
+            self.game_id = state.id
+
+        if state.is_delta_capable:
+            # Polls that brought nothing new are not worth keeping
+            if state.move_count != self.move_count or state.taunt_count != self.taunt_count:
+                self._pending.append(state)
+                if len(self._pending) > self.MAX_TAUNTS:
+                    self._flush()  # fold old deltas into the bounded history
+            self.move_count = state.move_count
+            self.taunt_count = state.taunt_count
+        else:
+            # Older servers ignore the delta parameters and send everything
+            self._moves = list(state.move_history)
+            self._taunts = deque(state.taunts, maxlen=self.MAX_TAUNTS)
+            self._pending.clear()
+            self.move_count = len(self._moves)
+            self.taunt_count = len(state.taunts)
+
+        self.state = state
+        self.board = state.board
+        return True
 
 
 class TicTacToeAgent:
     """AI Agent that plays tic-tac-toe via MCP tools"""
 
-    def __init__(self, verbose: bool = True):
-        self.client = MCPClient()
+    # Per-move timings kept for the end-of-game summary; a warm agent that
+    # plays game after game only remembers the most recent ones
+    MAX_MOVE_STATS = 1000
+
+    def __init__(self, verbose: bool = True, client: Optional[MCPClient] = None,
+                 strategy: Strategy = random_strategy, move_budget: Optional[float] = None,
+                 ponder: bool = False):
+        """
+        Args:
+            verbose: Log to stderr
+            client: MCP client to use (default: stdin/stdout)
+            strategy: Move selection strategy (see STRATEGIES)
+            move_budget: Maximum seconds per AI turn, MCP round trips included
+                (default: no limit)
+            ponder: Precompute replies while waiting for the opponent
+        """
+        self.client = client or MCPClient()
         self.verbose = verbose
+        self.strategy = strategy
+        self.move_budget = move_budget
+        self.ponderer = Ponderer() if ponder else None
         self.ai_player = None
+        self.last_status = None
+        self.view = GameView()
+        self.move_stats: Deque[Dict[str, Any]] = deque(maxlen=self.MAX_MOVE_STATS)
         self.taunts = [
             "Is that the best you can do?",
             "Interesting move... I guess.",
@@ -93,19 +523,45 @@ class TicTacToeAgent:
     def log(self, message: str):
         """Log a message if verbose mode is enabled"""
         if self.verbose:
-            print(f"[Agent] {message}", file=sys.stderr)
+            with phase("logging"):
+                print(f"[Agent] {message}", file=sys.stderr)
 
     def get_turn_info(self) -> Dict[str, Any]:
         """Get information about whose turn it is"""
         return self.client.call_tool("get_turn")
 
-    def get_game_state(self) -> Dict[str, Any]:
-        """Get the current game state including the board"""
-        return self.client.call_tool("view_game_state")
+    def get_game_state(self) -> GameState:
+        """
+        Get the current game state including the board.
+
+        Only the moves and taunts added since the previous call are
+        transferred; the full history is kept in self.view.
+        """
+        params = self.view.request_params()
+        state = self.client.view_game_state(params)
+
+        if not self.view.apply(state, params):
+            self.view.reset()
+            params = self.view.request_params()
+            state = self.client.view_game_state(params)
+            self.view.apply(state, params)
+
+        return state
+
+    def get_game_history(self, kind: str = "moves", page_size: int = 50) -> Iterator[Union[Move, Taunt]]:
+        """Yield moves (or taunts, with kind="taunts") one page at a time"""
+        item_type = Taunt if kind == "taunts" else Move
+        cursor = 0
+        while cursor is not None:
+            page = self.client.call_tool("get_game_history",
+                                         {"kind": kind, "cursor": cursor, "limit": page_size})
+            for item in page.get(kind, []):
+                yield item_type.from_dict(item)
+            cursor = page.get("nextCursor")
 
     def make_move(self, row: int, col: int) -> Dict[str, Any]:
         """Make a move at the specified position"""
-        return self.client.call_tool("make_move", {"row": row, "col": col})
+        return self.client.call_tool("make_move", {"row": row, "col": col, "boardFormat": "compact"})
 
     def send_taunt(self, message: str) -> Dict[str, Any]:
         """Send a taunt message to the opponent"""
@@ -115,30 +571,25 @@ class TicTacToeAgent:
         """Restart the game"""
         return self.client.call_tool("restart_game")
 
-    def find_empty_cells(self, board: List[List[str]]) -> List[Tuple[int, int]]:
+    def find_empty_cells(self, board: Board) -> List[Tuple[int, int]]:
         """Find all empty cells on the board"""
-        empty_cells = []
-        for row_idx in range(3):
-            for col_idx in range(3):
-                cell = board[row_idx][col_idx]
-                if cell == "Empty" or (isinstance(cell, dict) and cell.get("Empty") is not None):
-                    empty_cells.append((row_idx, col_idx))
-        return empty_cells
-
-    def select_move(self, board: List[List[str]], ai_player: str) -> Optional[Tuple[int, int]]:
+        cells = decode_board(board)
+        return [divmod(index, 3) for index, cell in enumerate(cells) if cell == "."]
+
+    def select_move(self, board: Board, ai_player: str,
+                    deadline: Optional[float] = None) -> Optional[Tuple[int, int]]:
         """
-        Select the best move for the AI.
+        Select the best move for the AI using the configured strategy.
 
-        Simple strategy:
-        1. Try to win if possible
-        2. Block opponent from winning
-        3. Take center if available
-        4. Take a corner if available
-        5. Take any available cell
+        With a deadline the strategy runs in a worker thread and the agent
+        stops waiting when the deadline passes, playing the best move the
+        strategy offered so far (or a random empty cell if it offered none).
+        This bounds the response time whichever strategy is plugged in.
 
         Args:
             board: The current game board
             ai_player: The AI player marker ("X" or "O")
+            deadline: time.monotonic() value by which a move is needed
 
         Returns:
             (row, col) tuple for the selected move, or None if no moves available
@@ -148,9 +599,52 @@ class TicTacToeAgent:
         if not empty_cells:
             return None
 
-        # For now, use a simple strategy: random empty cell
-        # TODO: Implement smarter strategy (minimax, win detection, blocking)
-        return random.choice(empty_cells)
+        cells = decode_board(board)
+
+        if self.ponderer is not None:
+            pondered = self.ponderer.lookup(cells, ai_player)
+            if pondered is not None and pondered[0] in empty_cells:
+                move, depth = pondered
+                self.move_stats.append({"depth": depth, "seconds": 0.0, "timedOut": False, "pondered": True})
+                self.log(f"Ponder hit: depth {depth} reply ready")
+                return move
+
+        search = MoveSearch(deadline if deadline is not None else math.inf)
+        outcome: Dict[str, Any] = {}
+
+        def run_strategy():
+            try:
+                outcome["move"] = self.strategy(cells, ai_player, search)
+            except Exception as e:
+                outcome["error"] = e
+
+        with phase("strategy"):
+            if deadline is None:
+                run_strategy()
+            else:
+                worker = threading.Thread(target=run_strategy, daemon=True)
+                worker.start()
+                worker.join(search.remaining())
+                if worker.is_alive():
+                    search.timed_out = True  # tells a cooperative strategy to stop
+
+        if "error" in outcome:
+            self.log(f"Strategy failed: {outcome['error']}")
+
+        offered, depth = search.result()
+        move = outcome.get("move") or offered
+        if move not in empty_cells:
+            move = random.choice(empty_cells)
+
+        elapsed = time.monotonic() - search.started
+        self.move_stats.append({
+            "depth": depth,
+            "seconds": elapsed,
+            "timedOut": search.timed_out,
+        })
+        self.log(f"Search depth {depth} in {elapsed * 1000:.1f} ms"
+                 f"{' (deadline reached)' if search.timed_out else ''}")
+        return move
 
     def play_turn(self) -> bool:
         """
@@ -159,32 +653,45 @@ class TicTacToeAgent:
         Returns:
             True if game should continue, False if game is over
         """
+        # The move budget starts now, so it covers the MCP round trips below
+        turn_started = time.monotonic()
+
         # Check whose turn it is
         turn_info = self.get_turn_info()
         self.log(f"Turn info: {turn_info}")
 
         if not turn_info.get("isAiTurn"):
             self.log("Not AI's turn, waiting...")
+            if self.ponderer is not None:
+                return self.ponder()
             return True
 
+        if self.ponderer is not None:
+            self.ponderer.stop()
+
         # Get current game state
         game_state = self.get_game_state()
-        self.log(f"Game state: {game_state['status']}")
+        self.log(f"Game state: {game_state.status}")
 
         # Check if game is over
-        status = game_state.get("status", "InProgress")
+        status = game_state.status
         if status != "InProgress":
             self.log(f"Game is over: {status}")
+            self.last_status = status
             return False
 
         # Store AI player if not set
         if self.ai_player is None:
-            self.ai_player = game_state.get("aiPlayer")
+            self.ai_player = game_state.ai_player
             self.log(f"AI is playing as: {self.ai_player}")
 
-        # Select a move
-        board = game_state.get("board", [])
-        move = self.select_move(board, self.ai_player)
+        # Select a move, leaving time for the make_move round trip
+        deadline = None
+        if self.move_budget is not None:
+            deadline = turn_started + self.move_budget - self.client.avg_latency
+
+        board = self.view.board
+        move = self.select_move(board, self.ai_player, deadline)
 
         if move is None:
             self.log("No moves available")
@@ -204,10 +711,13 @@ class TicTacToeAgent:
                 self.send_taunt(taunt)
                 self.log(f"Sent taunt: {taunt}")
 
+            self.move_stats[-1]["turnSeconds"] = time.monotonic() - turn_started
+
             # Check if game is now over
             new_status = result.get("gameState", {}).get("status", "InProgress")
             if new_status != "InProgress":
                 self.log(f"Game ended: {new_status}")
+                self.last_status = new_status
                 return False
 
         except Exception as e:
@@ -216,6 +726,26 @@ class TicTacToeAgent:
 
         return True
 
+    def ponder(self) -> bool:
+        """
+        Start pondering the current position while the opponent thinks.
+
+        Returns:
+            True if game should continue, False if game is over
+        """
+        game_state = self.get_game_state()
+        status = game_state.status
+        if status != "InProgress":
+            self.log(f"Game is over: {status}")
+            self.last_status = status
+            self.ponderer.stop()
+            return False
+
+        ai_player = self.ai_player or game_state.ai_player
+        if ai_player:
+            self.ponderer.start(self.view.board, ai_player, self.strategy)
+        return True
+
     def run(self, poll_interval: float = 1.0, max_turns: int = 100):
         """
         Run the AI agent main loop.
@@ -236,7 +766,8 @@ class TicTacToeAgent:
                     break
 
                 # Wait before next check
-                time.sleep(poll_interval)
+                with phase("idle"):
+                    time.sleep(poll_interval)
                 turn_count += 1
 
             except KeyboardInterrupt:
@@ -249,7 +780,18 @@ class TicTacToeAgent:
         if turn_count >= max_turns:
             self.log(f"Reached maximum turns ({max_turns}), stopping.")
 
+        if self.move_stats:
+            slowest = max(stat.get("turnSeconds", stat["seconds"]) for stat in self.move_stats)
+            timeouts = sum(1 for stat in self.move_stats if stat["timedOut"])
+            self.log(f"Moves: {len(self.move_stats)}, slowest turn {slowest * 1000:.1f} ms, "
+                     f"{timeouts} cut short by the deadline")
+
+        if self.ponderer is not None:
+            self.ponderer.stop()
+            self.log(f"Ponder hits: {self.ponderer.hits}, misses: {self.ponderer.misses}")
+
         self.log("AI Agent finished.")
+        memory_checkpoint()
 
 
 def main():
@@ -263,12 +805,24 @@ def main():
                         help="Polling interval in seconds (default: 1.0)")
     parser.add_argument("--max-turns", "-m", type=int, default=100,
                         help="Maximum number of turns (default: 100)")
+    parser.add_argument("--strategy", "-s", choices=sorted(STRATEGIES), default="random",
+                        help="Move selection strategy (default: random)")
+    parser.add_argument("--policy", metavar="FILE", default=None,
+                        help="Play a policy trained by selfplay_trainer.py (overrides --strategy)")
+    parser.add_argument("--move-budget", "-b", type=float, default=None,
+                        help="Maximum seconds per AI turn including MCP round trips (default: no limit)")
+    parser.add_argument("--ponder", action="store_true",
+                        help="Precompute replies while waiting for the opponent")
+    add_profile_arguments(parser)
 
     args = parser.parse_args()
 
     # Create and run the agent
-    agent = TicTacToeAgent(verbose=args.verbose)
-    agent.run(poll_interval=args.poll_interval, max_turns=args.max_turns)
+    strategy = PolicyStrategy(args.policy) if args.policy else STRATEGIES[args.strategy]
+    agent = TicTacToeAgent(verbose=args.verbose, strategy=strategy,
+                           move_budget=args.move_budget, ponder=args.ponder)
+    with profile_run(args.profile, args.profile_mode), memory_run(args.memory_every):
+        agent.run(poll_interval=args.poll_interval, max_turns=args.max_turns)
 
 
 if __name__ == "__main__":
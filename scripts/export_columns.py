@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Columnar Export of Game History for Tic-Tac-Toe MCP Game
+
+Converts the games, moves and taunts tables of a game database into one
+NumPy .npy file per column, with small integer codes instead of strings:
+
+    games.id            S36     game UUID
+    games.status        uint8   STATUS_CODES
+    games.human_player  uint8   PLAYER_CODES
+    games.created_at    int64
+    games.updated_at    int64
+    games.move_offset   int64   moves of game i are [move_offset[i], move_offset[i+1])
+    games.taunt_offset  int64   same for taunts
+    moves.game          uint32  game index (row in the games.* arrays)
+    moves.ply           uint8   0-based move number within the game
+    moves.cell          uint8   row * 3 + col
+    moves.player        uint8   PLAYER_CODES
+    moves.source        uint8   SOURCE_CODES
+    moves.timestamp     int64
+    taunts.game         uint32
+    taunts.source       uint8
+    taunts.timestamp    int64
+    taunts.text         uint8   UTF-8 messages, concatenated
+    taunts.text_offset  int64   message i is text[text_offset[i]:text_offset[i+1]]
+
+Games are in insertion order and moves/taunts are grouped by game, so the
+offsets give every game's rows as a contiguous slice. meta.json records the
+row counts and code tables.
+
+The export streams the database in chunks into pre-sized memory-mapped
+files, inside one read transaction so the counts and rows agree; memory use
+does not grow with the database. load_columns() memory-maps the files back,
+so the loader is equally cheap. .npy is used rather than .npz because
+arrays inside a zip archive cannot be memory-mapped.
+
+Requires numpy.
+
+Usage:
+    python3 scripts/export_columns.py game.db export/
+
+    # In Python
+    from export_columns import load_columns
+    data = load_columns("export/")
+    opening_cells = data.moves["cell"][data.games["move_offset"][:-1]]
+"""
+
+import os
+import sys
+import json
+from typing import Optional, Dict, Any, List
+
+from game_stats import connect, DEFAULT_CHUNK_SIZE
+
+FORMAT_VERSION = 1
+
+STATUS_CODES = {"InProgress": 0, "Won_X": 1, "Won_O": 2, "Draw": 3}
+PLAYER_CODES = {"X": 0, "O": 1}
+SOURCE_CODES = {None: 0, "UI": 1, "MCP": 2}
+
+GAME_COLUMNS = {
+    "id": "S36",
+    "status": "uint8",
+    "human_player": "uint8",
+    "created_at": "int64",
+    "updated_at": "int64",
+}
+MOVE_COLUMNS = {
+    "game": "uint32",
+    "ply": "uint8",
+    "cell": "uint8",
+    "player": "uint8",
+    "source": "uint8",
+    "timestamp": "int64",
+}
+TAUNT_COLUMNS = {
+    "game": "uint32",
+    "source": "uint8",
+    "timestamp": "int64",
+}
+
+
+def _case(column: str, codes: Dict[Any, int]) -> str:
+    """SQL expression mapping a text column to its integer code"""
+    whens = " ".join(f"WHEN '{value}' THEN {code}" for value, code in codes.items() if value is not None)
+    return f"CASE {column} {whens} ELSE 0 END"
+
+
+# Every query walks games in rowid (insertion) order and LEFT JOINs the
+# child rows, so each game shows up at least once and the game index is a
+# running count of distinct g.rowid values. Child columns are -1 when a game
+# has no rows. The covering indexes serve the per-game lookups.
+GAMES_QUERY = f"""
+    SELECT g.id, {_case("g.status", STATUS_CODES)}, {_case("g.human_player", PLAYER_CODES)},
+           g.created_at, g.updated_at
+    FROM games g ORDER BY g.rowid
+"""
+MOVES_QUERY = f"""
+    SELECT g.rowid, COALESCE(m.row * 3 + m.col, -1),
+           COALESCE({_case("m.player", PLAYER_CODES)}, -1),
+           COALESCE({_case("m.source", SOURCE_CODES)}, -1),
+           COALESCE(m.timestamp, -1)
+    FROM games g LEFT JOIN moves m ON m.game_id = g.id
+    ORDER BY g.rowid, m.timestamp, m.id
+"""
+TAUNTS_QUERY = f"""
+    SELECT g.rowid, COALESCE({_case("t.source", SOURCE_CODES)}, -1),
+           COALESCE(t.timestamp, -1), t.message
+    FROM games g LEFT JOIN taunts t ON t.game_id = g.id
+    ORDER BY g.rowid, t.timestamp, t.id
+"""
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        print("Error: numpy is required for columnar export (pip install numpy)", file=sys.stderr)
+        sys.exit(1)
+    return numpy
+
+
+class _GroupCounter:
+    """Turns chunks of g.rowid values into game indices and per-game row numbers"""
+
+    def __init__(self, np):
+        self.np = np
+        self.last_rowid: Optional[int] = None
+        self.game = -1
+        self.ply = 0
+
+    def index(self, rowids):
+        np = self.np
+        n = len(rowids)
+        new = np.empty(n, dtype=bool)
+        new[0] = rowids[0] != self.last_rowid
+        new[1:] = rowids[1:] != rowids[:-1]
+
+        games = self.game + np.cumsum(new)
+        # Row number within the group: position minus the group's first position,
+        # continuing the last group of the previous chunk
+        positions = np.arange(n)
+        starts = np.maximum.accumulate(np.where(new, positions, -self.ply))
+        plies = positions - starts
+
+        self.last_rowid = int(rowids[-1])
+        self.game = int(games[-1])
+        self.ply = int(plies[-1]) + 1
+        return games, plies
+
+
+class ColumnarExporter:
+    """Streams one database into a directory of .npy columns"""
+
+    def __init__(self, db_path: str, out_dir: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 verbose: bool = False):
+        self.np = _import_numpy()
+        self.db_path = db_path
+        self.out_dir = out_dir
+        self.chunk_size = chunk_size
+        self.verbose = verbose
+
+    def log(self, message: str):
+        """Log a message if verbose mode is enabled"""
+        if self.verbose:
+            print(f"[Export] {message}", file=sys.stderr)
+
+    def _open(self, table: str, column: str, dtype: str, length: int):
+        path = os.path.join(self.out_dir, f"{table}.{column}.npy")
+        return self.np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(length,))
+
+    def _open_table(self, table: str, columns: Dict[str, str], length: int) -> Dict[str, Any]:
+        return {column: self._open(table, column, dtype, length) for column, dtype in columns.items()}
+
+    def run(self) -> Dict[str, Any]:
+        """Export everything and return the metadata written to meta.json"""
+        os.makedirs(self.out_dir, exist_ok=True)
+
+        conn = connect(self.db_path)
+        try:
+            # One read transaction: the counts below match the rows streamed after
+            conn.execute("BEGIN")
+            n_games = conn.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+            n_moves = conn.execute(
+                "SELECT COUNT(*) FROM moves m JOIN games g ON g.id = m.game_id").fetchone()[0]
+            n_taunts, n_text = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(CAST(t.message AS BLOB))), 0) "
+                "FROM taunts t JOIN games g ON g.id = t.game_id").fetchone()
+            self.log(f"{n_games} games, {n_moves} moves, {n_taunts} taunts")
+
+            self._export_games(conn, n_games)
+            self._export_moves(conn, n_games, n_moves)
+            self._export_taunts(conn, n_games, n_taunts, n_text)
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+        meta = {
+            "formatVersion": FORMAT_VERSION,
+            "source": os.path.abspath(self.db_path),
+            "counts": {"games": n_games, "moves": n_moves, "taunts": n_taunts},
+            "codes": {
+                "status": STATUS_CODES,
+                "player": PLAYER_CODES,
+                "source": {str(value): code for value, code in SOURCE_CODES.items()},
+            },
+        }
+        with open(os.path.join(self.out_dir, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+        return meta
+
+    def _export_games(self, conn, n_games: int):
+        np = self.np
+        out = self._open_table("games", GAME_COLUMNS, n_games)
+        cursor = conn.execute(GAMES_QUERY)
+        written = 0
+        while True:
+            rows = cursor.fetchmany(self.chunk_size)
+            if not rows:
+                break
+            ids, statuses, humans, created, updated = zip(*rows)
+            end = written + len(rows)
+            out["id"][written:end] = np.array(ids, dtype="S36")
+            out["status"][written:end] = statuses
+            out["human_player"][written:end] = humans
+            out["created_at"][written:end] = created
+            out["updated_at"][written:end] = updated
+            written = end
+        for array in out.values():
+            array.flush()
+
+    def _grouped_chunks(self, query: str, conn):
+        """Yield (game indices, row numbers, rows) for chunks of a LEFT JOIN query"""
+        np = self.np
+        counter = _GroupCounter(np)
+        cursor = conn.execute(query)
+        while True:
+            rows = cursor.fetchmany(self.chunk_size)
+            if not rows:
+                return
+            rowids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+            games, plies = counter.index(rowids)
+            yield games, plies, rows
+
+    def _export_moves(self, conn, n_games: int, n_moves: int):
+        np = self.np
+        out = self._open_table("moves", MOVE_COLUMNS, n_moves)
+        offsets = self._open("games", "move_offset", "int64", n_games + 1)
+        written = 0
+
+        for games, plies, rows in self._grouped_chunks(MOVES_QUERY, conn):
+            values = np.array([row[1:] for row in rows], dtype=np.int64).reshape(-1, 4)
+            present = values[:, 0] >= 0
+            games, plies, values = games[present], plies[present], values[present]
+
+            end = written + len(values)
+            out["game"][written:end] = games
+            out["ply"][written:end] = plies
+            out["cell"][written:end] = values[:, 0]
+            out["player"][written:end] = values[:, 1]
+            out["source"][written:end] = values[:, 2]
+            out["timestamp"][written:end] = values[:, 3]
+            np.add.at(offsets, games + 1, 1)
+            written = end
+
+        np.cumsum(offsets, out=offsets)
+        for array in (*out.values(), offsets):
+            array.flush()
+
+    def _export_taunts(self, conn, n_games: int, n_taunts: int, n_text: int):
+        np = self.np
+        out = self._open_table("taunts", TAUNT_COLUMNS, n_taunts)
+        text = self._open("taunts", "text", "uint8", n_text)
+        text_offset = self._open("taunts", "text_offset", "int64", n_taunts + 1)
+        offsets = self._open("games", "taunt_offset", "int64", n_games + 1)
+        written = 0
+        text_written = 0
+
+        for games, _, rows in self._grouped_chunks(TAUNTS_QUERY, conn):
+            present = [row[3] is not None for row in rows]
+            rows = [row for row, keep in zip(rows, present) if keep]
+            if not rows:
+                continue
+            games = games[np.array(present)]
+
+            end = written + len(rows)
+            out["game"][written:end] = games
+            out["source"][written:end] = [row[1] for row in rows]
+            out["timestamp"][written:end] = [row[2] for row in rows]
+
+            encoded = [row[3].encode() for row in rows]
+            lengths = np.fromiter((len(message) for message in encoded), dtype=np.int64, count=len(encoded))
+            text_end = text_written + int(lengths.sum())
+            text[text_written:text_end] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+            text_offset[written + 1:end + 1] = text_written + np.cumsum(lengths)
+
+            np.add.at(offsets, games + 1, 1)
+            written, text_written = end, text_end
+
+        np.cumsum(offsets, out=offsets)
+        for array in (*out.values(), text, text_offset, offsets):
+            array.flush()
+
+
+class Columns:
+    """A columnar export, memory-mapped"""
+
+    def __init__(self, meta: Dict[str, Any], games: Dict[str, Any], moves: Dict[str, Any],
+                 taunts: Dict[str, Any]):
+        self.meta = meta
+        self.games = games
+        self.moves = moves
+        self.taunts = taunts
+
+    def game_moves(self, game: int) -> slice:
+        """Slice of the moves.* arrays holding game i"""
+        offsets = self.games["move_offset"]
+        return slice(int(offsets[game]), int(offsets[game + 1]))
+
+    def game_taunts(self, game: int) -> slice:
+        """Slice of the taunts.* arrays holding game i"""
+        offsets = self.games["taunt_offset"]
+        return slice(int(offsets[game]), int(offsets[game + 1]))
+
+    def taunt_message(self, taunt: int) -> str:
+        offsets = self.taunts["text_offset"]
+        return bytes(self.taunts["text"][offsets[taunt]:offsets[taunt + 1]]).decode()
+
+
+def load_columns(directory: str, mmap: bool = True) -> Columns:
+    """
+    Load a columnar export.
+
+    Args:
+        directory: Directory written by ColumnarExporter
+        mmap: Memory-map the arrays (read-only) instead of reading them
+    """
+    np = _import_numpy()
+
+    with open(os.path.join(directory, "meta.json")) as f:
+        meta = json.load(f)
+    if meta.get("formatVersion") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported export format version: {meta.get('formatVersion')}")
+
+    def table(name: str, columns: List[str]) -> Dict[str, Any]:
+        return {column: np.load(os.path.join(directory, f"{name}.{column}.npy"),
+                                mmap_mode="r" if mmap else None)
+                for column in columns}
+
+    return Columns(
+        meta,
+        table("games", [*GAME_COLUMNS, "move_offset", "taunt_offset"]),
+        table("moves", list(MOVE_COLUMNS)),
+        table("taunts", [*TAUNT_COLUMNS, "text", "text_offset"]),
+    )
+
+
+def main():
+    """Main entry point for the columnar exporter"""
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Export a Tic-Tac-Toe game database to NumPy columns")
+    parser.add_argument("db_path", help="Path to the SQLite database (GAME_DB_PATH)")
+    parser.add_argument("out_dir", help="Directory to write the .npy columns and meta.json to")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Rows fetched and written per chunk (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="Enable verbose logging")
+
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    meta = ColumnarExporter(args.db_path, args.out_dir, chunk_size=args.chunk_size, verbose=args.verbose).run()
+    counts = meta["counts"]
+    print(f"Exported {counts['games']} games, {counts['moves']} moves, {counts['taunts']} taunts "
+          f"to {args.out_dir} in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Engine Annotation of Recorded Tic-Tac-Toe Games
+
+Replays every game in a game database (GAME_DB_PATH) or a game_archive.py
+archive and annotates every move with a perfect-play evaluation:
+
+- best: the engine's move in the position (fastest win, else a draw, else
+  the slowest loss)
+- before / after: the result the mover could force before the move and
+  after it ("win", "draw" or "loss")
+- blunder: the move threw away a forced result (after is worse than before)
+- distance: plies from the position after the move to the forced result
+  with perfect play
+
+Positions are the compact board strings the agents read from
+view_game_state (boardFormat="compact"), keyed by ai_agent.relative_index
+so a position and its colour-swapped twin share one entry. Tic-tac-toe has
+only a few thousand reachable positions, so each worker's memo fills within
+the first games and nearly every later lookup is a hit.
+
+Games are annotated by a process pool. Archives are split by compressed
+block and each worker reads its own blocks; database games are read by the
+parent in chunks of --chunk-size games. Results come back in input order
+and are streamed to the output; only a few chunks per worker are in flight
+at a time, so memory does not grow with the input.
+
+Games with an illegal move (an occupied cell, or a move after the game was
+decided) are annotated up to that move and counted as malformed.
+
+Usage:
+    python3 scripts/game_annotator.py game.db --out annotations.csv
+    python3 scripts/game_annotator.py games.ttta --out annotations.jsonl --workers 8
+    python3 scripts/game_annotator.py games.ttta --json
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+from collections import Counter
+from typing import Optional, Dict, Any, List, Tuple, Iterator
+
+from ai_agent import winner, relative_index
+from game_archive import MAGIC, ArchiveReader, iter_database
+
+RESULTS = {1: "win", 0: "draw", -1: "loss"}
+FIELDS = ("game_id", "ply", "player", "row", "col", "source", "best_row", "best_col",
+          "before", "after", "blunder", "distance")
+DEFAULT_CHUNK_SIZE = 2000
+
+# Per-process memo: relative_index -> (value, distance, best cell) for the
+# player to move; value is +1/0/-1 and distance counts plies to the result
+_MEMO: Dict[int, Tuple[int, int, int]] = {}
+_STATS = Counter()
+
+
+def solve(cells: str, player: str) -> Tuple[int, int, int]:
+    """Perfect-play (value, distance, best cell) for player to move on a compact board"""
+    key = relative_index(cells, player)
+    entry = _MEMO.get(key)
+    if entry is not None:
+        _STATS["hits"] += 1
+        return entry
+    _STATS["misses"] += 1
+
+    opponent = "O" if player == "X" else "X"
+    if winner(cells) is not None:
+        # Only the previous mover can have completed a line
+        entry = (-1, 0, -1)
+    elif "." not in cells:
+        entry = (0, 0, -1)
+    else:
+        best = None
+        for index, cell in enumerate(cells):
+            if cell != ".":
+                continue
+            value, distance, _ = solve(cells[:index] + player + cells[index + 1:], opponent)
+            value, distance = -value, distance + 1
+            # Win fast, lose slowly; draws all end when the board is full
+            rank = (value, -distance if value > 0 else distance)
+            if best is None or rank > best[0]:
+                best = (rank, value, distance, index)
+        entry = best[1:]
+    _MEMO[key] = entry
+    return entry
+
+
+def annotate_game(game_id: Optional[str], cells: Tuple[int, ...], players: Tuple[str, ...],
+                  sources: Optional[Tuple[Optional[str], ...]]) -> Tuple[List[tuple], bool]:
+    """Annotation rows (FIELDS order) for one game, and whether every move was legal"""
+    board = "." * 9
+    rows = []
+    for ply, (index, player) in enumerate(zip(cells, players)):
+        if board[index] != "." or winner(board) is not None:
+            return rows, False
+        before, _, best = solve(board, player)
+        board = board[:index] + player + board[index + 1:]
+        value, distance, _ = solve(board, "O" if player == "X" else "X")
+        after = -value
+        rows.append((game_id, ply, player, index // 3, index % 3, sources[ply] if sources else None,
+                     best // 3, best % 3, RESULTS[before], RESULTS[after], int(after < before), distance))
+    return rows, True
+
+
+def _annotate_games(games: List[tuple]) -> Tuple[List[tuple], Dict[str, int]]:
+    """Worker task: annotate (id, cells, players, sources) tuples"""
+    _STATS.clear()
+    rows = []
+    for game in games:
+        game_rows, legal = annotate_game(*game)
+        rows.extend(game_rows)
+        _STATS["games"] += 1
+        _STATS["malformed"] += not legal
+    return rows, dict(_STATS)
+
+
+def _annotate_block(task: Tuple[str, int]) -> Tuple[List[tuple], Dict[str, int]]:
+    """Worker task: annotate one archive block, read by the worker itself"""
+    path, block = task
+    with ArchiveReader(path) as reader:
+        games = [(game.id, game.cells, game.players, game.sources) for game in reader.iter_block(block)]
+    return _annotate_games(games)
+
+
+def is_archive(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _database_chunks(db_path: str, chunk_size: int) -> Iterator[List[tuple]]:
+    chunk = []
+    for game in iter_database(db_path):
+        chunk.append((game.id, game.cells, game.players, game.sources))
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class Summary:
+    """Totals over the annotated moves, for the end-of-run report"""
+
+    def __init__(self):
+        self.stats = Counter()
+        self.moves_by_source: Counter = Counter()
+        self.blunders_by_source: Counter = Counter()
+        self.blunders_by_ply: Counter = Counter()
+
+    def add(self, rows: List[tuple], stats: Dict[str, int]):
+        self.stats.update(stats)
+        for row in rows:
+            source = row[5] or "unknown"
+            self.moves_by_source[source] += 1
+            if row[10]:
+                self.blunders_by_source[source] += 1
+                self.blunders_by_ply[row[1]] += 1
+
+    def to_dict(self, seconds: float) -> Dict[str, Any]:
+        moves = sum(self.moves_by_source.values())
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "games": self.stats["games"],
+            "moves": moves,
+            "malformedGames": self.stats["malformed"],
+            "blunders": sum(self.blunders_by_source.values()),
+            "blunderRateBySource": {source: round(self.blunders_by_source[source] / count, 4)
+                                    for source, count in sorted(self.moves_by_source.items())},
+            "blundersByPly": {str(ply): count for ply, count in sorted(self.blunders_by_ply.items())},
+            "memoHitRate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+            "seconds": round(seconds, 2),
+            "movesPerSecond": round(moves / seconds) if seconds else 0,
+        }
+
+
+class RowWriter:
+    """Streams annotation rows as CSV or JSON lines (chosen by file extension)"""
+
+    def __init__(self, path: str):
+        self.file = sys.stdout if path == "-" else open(path, "w", newline="")
+        self.jsonl = path.endswith((".jsonl", ".ndjson"))
+        if not self.jsonl:
+            self.csv = csv.writer(self.file)
+            self.csv.writerow(FIELDS)
+
+    def write(self, rows: List[tuple]):
+        if self.jsonl:
+            self.file.writelines(json.dumps(dict(zip(FIELDS, row))) + "\n" for row in rows)
+        else:
+            self.csv.writerows(rows)
+
+    def close(self):
+        if self.file is not sys.stdout:
+            self.file.close()
+
+
+def _bounded_imap(pool, function, tasks, window: int) -> Iterator[Any]:
+    """Like pool.imap, but with at most window tasks in flight (imap reads all tasks ahead)"""
+    from collections import deque
+
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.apply_async(function, (task,)))
+        if len(pending) >= window:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def annotate(path: str, out: Optional[str] = None, workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE,
+             verbose: bool = True) -> Dict[str, Any]:
+    """
+    Annotate every game in a database or archive.
+
+    Args:
+        path: Game database or game_archive.py archive
+        out: CSV file (or .jsonl) for the per-move rows, "-" for stdout,
+            None for the summary only
+        workers: Worker processes; 1 annotates in this process
+        chunk_size: Games per task for database input (archives use one
+            task per block)
+
+    Returns:
+        The summary (see Summary.to_dict)
+    """
+    import multiprocessing
+
+    if is_archive(path):
+        with ArchiveReader(path) as reader:
+            tasks = [(path, block) for block in range(len(reader.blocks))]
+        function = _annotate_block
+    else:
+        tasks = _database_chunks(path, chunk_size)
+        function = _annotate_games
+
+    summary = Summary()
+    writer = RowWriter(out) if out else None
+    started = time.perf_counter()
+    last_report = started
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    try:
+        results = _bounded_imap(pool, function, tasks, 2 * workers) if pool else map(function, tasks)
+        for rows, stats in results:
+            summary.add(rows, stats)
+            if writer:
+                writer.write(rows)
+            if verbose and time.perf_counter() - last_report >= 5.0:
+                last_report = time.perf_counter()
+                moves = sum(summary.moves_by_source.values())
+                print(f"[Annotator] {summary.stats['games']:,} games, {moves:,} moves "
+                      f"({moves / (last_report - started):,.0f} moves/s)", file=sys.stderr)
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+        if writer:
+            writer.close()
+    return summary.to_dict(time.perf_counter() - started)
+
+
+def main():
+    """Main entry point for the game annotator"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Annotate recorded games with perfect-play evaluations")
+    parser.add_argument("input", help="Game database (GAME_DB_PATH) or game_archive.py archive")
+    parser.add_argument("--out", "-o", default=None,
+                        help="Per-move annotations: CSV, or JSON lines for .jsonl; '-' for stdout")
+    parser.add_argument("--workers", "-w", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Games per task for database input (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the summary as JSON")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="No progress messages")
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"Error: {args.input} not found", file=sys.stderr)
+        sys.exit(1)
+
+    summary = annotate(args.input, args.out, args.workers, args.chunk_size, verbose=not args.quiet)
+
+    if args.json:
+        print(json.dumps(summary, indent=2), file=sys.stderr if args.out == "-" else sys.stdout)
+        return
+
+    file = sys.stderr if args.out == "-" else sys.stdout
+    print(f"Games: {summary['games']:,}  Moves: {summary['moves']:,}  Blunders: {summary['blunders']:,}  "
+          f"Malformed games: {summary['malformedGames']:,}", file=file)
+    print("\nBlunder rate by source", file=file)
+    for source, rate in summary["blunderRateBySource"].items():
+        print(f"  {source:<12} {100 * rate:>6.2f}%", file=file)
+    print("\nBlunders by ply", file=file)
+    for ply, count in summary["blundersByPly"].items():
+        print(f"  {ply:>2} {count:>10}", file=file)
+    print(f"\n{summary['moves']:,} moves in {summary['seconds']}s ({summary['movesPerSecond']:,} moves/s), "
+          f"memo hit rate {100 * summary['memoHitRate']:.2f}%", file=file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,711 @@
+#!/usr/bin/env python3
+"""
+Compressed Game Archive for Tic-Tac-Toe MCP Game
+
+A compact, append-only file format for large numbers of recorded games
+(production databases, self-play runs). A game costs a few dozen bytes
+before compression instead of a games row plus one moves row per move.
+
+Each game is one record:
+
+    byte 0      move count (bits 0-3), status (bits 4-5, STATUS_CODES),
+                human player is O (bit 6), first mover is O (bit 7)
+    byte 1      flags: FLAG_UUID, FLAG_TEXT_ID, FLAG_SOURCES,
+                FLAG_TIMESTAMPS, FLAG_PLAYERS
+    id          16 bytes if FLAG_UUID, or varint length + UTF-8 if FLAG_TEXT_ID
+    created_at  zigzag varint, delta from the block's base time
+    updated_at  zigzag varint, delta from created_at
+    moves       one 4-bit cell index (row * 3 + col) per move, two per byte
+    sources     2 bits per move (SOURCE_CODES), if FLAG_SOURCES
+    timestamps  zigzag varints, deltas from created_at then from the
+                previous move, if FLAG_TIMESTAMPS
+    players     1 bit per move (1 = O), only if FLAG_PLAYERS, i.e. when the
+                moves do not simply alternate from the first mover
+
+Records are grouped into blocks of a fixed number of games (the last block
+may be short). A block starts with the record count, a base time (the first
+game's created_at) and the offset of every record, and is compressed with
+zlib. The file ends with a block index and a
+trailer, so game i is found with one seek: block i // games_per_block, then
+its record offset. Every block is also length-prefixed, so the index can be
+rebuilt by scanning if a writer died before closing the file.
+
+    header   b"TTTARCH\\0", version u32, games per block u32
+    block    compressed length u32, game count u32, zlib data
+    ...
+    index    per block: file offset u64, compressed length u32, game count u32
+    trailer  index offset u64, total games u64, b"TTTAIDX\\0"
+
+Taunts are not archived; the converters cover the games and moves tables.
+
+Usage:
+    python3 scripts/game_archive.py pack game.db games.ttta
+    python3 scripts/game_archive.py pack new.db games.ttta --append
+    python3 scripts/game_archive.py info games.ttta
+    python3 scripts/game_archive.py show games.ttta 0 123456
+    python3 scripts/game_archive.py unpack games.ttta restored.db
+
+    # In Python
+    from game_archive import ArchiveReader, ArchiveWriter, ArchivedGame
+    with ArchiveWriter("selfplay.ttta") as archive:
+        archive.append(ArchivedGame.from_cells([4, 0, 8, 2, 1, 7, 6, 3, 5], status="Draw"))
+    game = ArchiveReader("selfplay.ttta")[0]
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import struct
+import sqlite3
+import uuid
+from typing import Optional, Dict, Any, List, Tuple, Iterator, NamedTuple, Sequence
+
+from game_stats import connect, iter_rows, INDEXES, DEFAULT_CHUNK_SIZE
+
+FORMAT_VERSION = 1
+MAGIC = b"TTTARCH\0"
+INDEX_MAGIC = b"TTTAIDX\0"
+DEFAULT_GAMES_PER_BLOCK = 4096
+
+# Same codes as export_columns.py
+STATUS_CODES = {"InProgress": 0, "Won_X": 1, "Won_O": 2, "Draw": 3}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+SOURCE_CODES = {None: 0, "UI": 1, "MCP": 2}
+SOURCE_NAMES = {code: name for name, code in SOURCE_CODES.items()}
+
+FLAG_UUID = 0x01
+FLAG_TEXT_ID = 0x02
+FLAG_SOURCES = 0x04
+FLAG_TIMESTAMPS = 0x08
+FLAG_PLAYERS = 0x10
+
+HEADER = struct.Struct("<8sII")
+BLOCK_HEADER = struct.Struct("<II")
+INDEX_ENTRY = struct.Struct("<QII")
+TRAILER = struct.Struct("<QQ8s")
+
+
+def _opponent(player: str) -> str:
+    return "O" if player == "X" else "X"
+
+
+class ArchivedGame(NamedTuple):
+    """One game: metadata plus its moves as cell indexes (row * 3 + col)"""
+    id: Optional[str]
+    status: str
+    human_player: str
+    first_player: str
+    created_at: int
+    updated_at: int
+    cells: Tuple[int, ...]
+    players: Tuple[str, ...]
+    sources: Optional[Tuple[Optional[str], ...]] = None
+    timestamps: Optional[Tuple[int, ...]] = None
+
+    @classmethod
+    def from_cells(cls, cells: Sequence[int], status: str = "InProgress", first_player: str = "X",
+                   human_player: str = "X", id: Optional[str] = None, created_at: int = 0,
+                   updated_at: Optional[int] = None) -> "ArchivedGame":
+        """A game whose players alternate, e.g. from self-play"""
+        players = tuple(first_player if ply % 2 == 0 else _opponent(first_player) for ply in range(len(cells)))
+        return cls(id, status, human_player, first_player, created_at,
+                   created_at if updated_at is None else updated_at, tuple(cells), players)
+
+    @property
+    def ai_player(self) -> str:
+        return _opponent(self.human_player)
+
+    @property
+    def current_turn(self) -> str:
+        """Whose turn the server would report (the last mover once the game is over)"""
+        if not self.players:
+            return self.first_player
+        if self.status == "InProgress":
+            return _opponent(self.players[-1])
+        return self.players[-1]
+
+    def moves(self) -> Iterator[Tuple[str, int, int, Optional[int], Optional[str]]]:
+        """(player, row, col, timestamp, source) per move, in play order"""
+        for ply, cell in enumerate(self.cells):
+            yield (self.players[ply], cell // 3, cell % 3,
+                   self.timestamps[ply] if self.timestamps is not None else None,
+                   self.sources[ply] if self.sources is not None else None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "humanPlayer": self.human_player,
+            "createdAt": self.created_at,
+            "updatedAt": self.updated_at,
+            "moves": [{"player": player, "row": row, "col": col, "timestamp": timestamp, "source": source}
+                      for player, row, col, timestamp, source in self.moves()],
+        }
+
+
+# ---------------------------------------------------------------------------
+# Record encoding
+# ---------------------------------------------------------------------------
+
+def _put_varint(out: bytearray, value: int):
+    """Append a zigzag-encoded signed varint"""
+    value = (value << 1) ^ (value >> 63)
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _get_varint(data, pos: int) -> Tuple[int, int]:
+    """Read a zigzag-encoded signed varint; return (value, new position)"""
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return (result >> 1) ^ -(result & 1), pos
+        shift += 7
+
+
+def encode_game(game: ArchivedGame, base_time: int = 0) -> bytes:
+    """Encode one record; created_at is stored relative to the block's base_time"""
+    count = len(game.cells)
+    if count > 9 or any(not 0 <= cell <= 8 for cell in game.cells):
+        raise ValueError(f"game {game.id}: invalid moves {game.cells}")
+    if game.status not in STATUS_CODES:
+        raise ValueError(f"game {game.id}: unknown status {game.status!r}")
+
+    out = bytearray(2)
+    out[0] = (count | STATUS_CODES[game.status] << 4 | (game.human_player == "O") << 6
+              | (game.first_player == "O") << 7)
+    flags = 0
+
+    if game.id is not None:
+        try:
+            raw_id = uuid.UUID(game.id).bytes
+            if str(uuid.UUID(bytes=raw_id)) != game.id:
+                raise ValueError
+            flags |= FLAG_UUID
+            out += raw_id
+        except ValueError:
+            text = game.id.encode()
+            flags |= FLAG_TEXT_ID
+            _put_varint(out, len(text))
+            out += text
+
+    _put_varint(out, game.created_at - base_time)
+    _put_varint(out, game.updated_at - game.created_at)
+
+    for ply in range(0, count, 2):
+        out.append(game.cells[ply] | (game.cells[ply + 1] << 4 if ply + 1 < count else 0))
+
+    if game.sources is not None:
+        flags |= FLAG_SOURCES
+        for ply in range(0, count, 4):
+            byte = 0
+            for shift, source in enumerate(game.sources[ply:ply + 4]):
+                byte |= SOURCE_CODES.get(source, 0) << (2 * shift)
+            out.append(byte)
+
+    if game.timestamps is not None:
+        flags |= FLAG_TIMESTAMPS
+        previous = game.created_at
+        for timestamp in game.timestamps:
+            _put_varint(out, timestamp - previous)
+            previous = timestamp
+
+    alternating = all(player == (game.first_player if ply % 2 == 0 else _opponent(game.first_player))
+                      for ply, player in enumerate(game.players))
+    if not alternating:
+        flags |= FLAG_PLAYERS
+        bits = sum(1 << ply for ply, player in enumerate(game.players) if player == "O")
+        out += bits.to_bytes(2, "little")
+
+    out[1] = flags
+    return bytes(out)
+
+
+def decode_game(data, pos: int, base_time: int = 0) -> Tuple[ArchivedGame, int]:
+    """Decode the record at pos; return (game, position after it)"""
+    head, flags = data[pos], data[pos + 1]
+    pos += 2
+    count = head & 0x0f
+    status = STATUS_NAMES[(head >> 4) & 0x03]
+    human_player = "O" if head & 0x40 else "X"
+    first_player = "O" if head & 0x80 else "X"
+
+    game_id = None
+    if flags & FLAG_UUID:
+        game_id = str(uuid.UUID(bytes=bytes(data[pos:pos + 16])))
+        pos += 16
+    elif flags & FLAG_TEXT_ID:
+        length, pos = _get_varint(data, pos)
+        game_id = bytes(data[pos:pos + length]).decode()
+        pos += length
+
+    delta, pos = _get_varint(data, pos)
+    created_at = base_time + delta
+    delta, pos = _get_varint(data, pos)
+    updated_at = created_at + delta
+
+    cells = []
+    for ply in range(0, count, 2):
+        byte = data[pos]
+        pos += 1
+        cells.append(byte & 0x0f)
+        if ply + 1 < count:
+            cells.append(byte >> 4)
+
+    sources = None
+    if flags & FLAG_SOURCES:
+        sources = []
+        for ply in range(0, count, 4):
+            byte = data[pos]
+            pos += 1
+            for shift in range(min(4, count - ply)):
+                sources.append(SOURCE_NAMES[(byte >> (2 * shift)) & 0x03])
+        sources = tuple(sources)
+
+    timestamps = None
+    if flags & FLAG_TIMESTAMPS:
+        timestamps = []
+        previous = created_at
+        for _ in range(count):
+            delta, pos = _get_varint(data, pos)
+            previous += delta
+            timestamps.append(previous)
+        timestamps = tuple(timestamps)
+
+    if flags & FLAG_PLAYERS:
+        bits = data[pos] | data[pos + 1] << 8
+        pos += 2
+        players = tuple("O" if bits >> ply & 1 else "X" for ply in range(count))
+    else:
+        second = _opponent(first_player)
+        players = tuple(first_player if ply % 2 == 0 else second for ply in range(count))
+
+    return ArchivedGame(game_id, status, human_player, first_player, created_at, updated_at,
+                        tuple(cells), players, sources, timestamps), pos
+
+
+def _encode_block(records: List[bytes], base_time: int) -> bytes:
+    offsets, position = [], 0
+    for record in records:
+        offsets.append(position)
+        position += len(record)
+    return struct.pack(f"<Iq{len(records)}I", len(records), base_time, *offsets) + b"".join(records)
+
+
+def _block_header(payload: bytes) -> Tuple[int, int]:
+    """(record count, base time) of a decompressed block"""
+    return struct.unpack_from("<Iq", payload)
+
+
+def _record_offset(payload: bytes, index: int) -> int:
+    count = struct.unpack_from("<I", payload)[0]
+    if not 0 <= index < count:
+        raise IndexError(index)
+    return 12 + 4 * count + struct.unpack_from("<I", payload, 12 + 4 * index)[0]
+
+
+# ---------------------------------------------------------------------------
+# Writer and reader
+# ---------------------------------------------------------------------------
+
+class ArchiveWriter:
+    """Appends games to an archive file, creating it if needed"""
+
+    def __init__(self, path: str, games_per_block: int = DEFAULT_GAMES_PER_BLOCK, level: int = 6):
+        """
+        Args:
+            path: Archive file; an existing archive is appended to (its
+                games_per_block wins)
+            games_per_block: Games per compressed block; larger blocks
+                compress better, smaller ones make random access cheaper
+            level: zlib compression level
+        """
+        self.path = path
+        self.level = level
+        self.blocks: List[Tuple[int, int, int]] = []
+        self.games = 0
+        self._records: List[bytes] = []
+        self._base_time = 0
+        self._rewrite_offset: Optional[int] = None
+
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            self._file = open(path, "r+b")
+            reader = ArchiveReader(path)
+            self.games_per_block = reader.games_per_block
+            self.blocks = list(reader.blocks)
+            self.games = len(reader)
+            # Reopen a short last block so every block but the last stays full;
+            # it stays on disk until its replacement is written
+            if self.blocks and self.blocks[-1][2] < self.games_per_block:
+                offset, _, count = self.blocks.pop()
+                payload = reader.block_payload(len(self.blocks))
+                self._records = [payload[_record_offset(payload, i):
+                                         _record_offset(payload, i + 1) if i + 1 < count else len(payload)]
+                                 for i in range(count)]
+                self._base_time = _block_header(payload)[1]
+                self.games -= count
+                self._rewrite_offset = offset
+            self._file.seek(reader.data_end)
+            self._file.truncate()
+            reader.close()
+        else:
+            self.games_per_block = games_per_block
+            self._file = open(path, "wb")
+            self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION, games_per_block))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, game: ArchivedGame):
+        if not self._records:
+            self._base_time = game.created_at
+        self._records.append(encode_game(game, self._base_time))
+        if len(self._records) == self.games_per_block:
+            self._flush_block()
+
+    def _flush_block(self):
+        if not self._records:
+            return
+        data = zlib.compress(_encode_block(self._records, self._base_time), self.level)
+        if self._rewrite_offset is not None:
+            self._file.seek(self._rewrite_offset)
+            self._file.truncate()
+            self._rewrite_offset = None
+        offset = self._file.tell()
+        self._file.write(BLOCK_HEADER.pack(len(data), len(self._records)))
+        self._file.write(data)
+        self.blocks.append((offset, len(data), len(self._records)))
+        self.games += len(self._records)
+        self._records = []
+
+    def close(self):
+        """Write the last block, the index and the trailer"""
+        if self._file.closed:
+            return
+        self._flush_block()
+        index_offset = self._file.tell()
+        for entry in self.blocks:
+            self._file.write(INDEX_ENTRY.pack(*entry))
+        self._file.write(TRAILER.pack(index_offset, self.games, INDEX_MAGIC))
+        self._file.close()
+
+
+class ArchiveReader:
+    """Random access and streaming over an archive file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        magic, version, self.games_per_block = HEADER.unpack(self._file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a game archive")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"{path}: archive version {version} is newer than this reader ({FORMAT_VERSION})")
+
+        self.blocks: List[Tuple[int, int, int]] = []
+        self._cached: Tuple[int, Optional[bytes]] = (-1, None)
+
+        size = os.fstat(self._file.fileno()).st_size
+        trailer = None
+        if size >= HEADER.size + TRAILER.size:
+            self._file.seek(size - TRAILER.size)
+            trailer = TRAILER.unpack(self._file.read(TRAILER.size))
+        if trailer is not None and trailer[2] == INDEX_MAGIC:
+            index_offset, self.total, _ = trailer
+            self._file.seek(index_offset)
+            raw = self._file.read(size - TRAILER.size - index_offset)
+            self.blocks = [entry for entry in INDEX_ENTRY.iter_unpack(raw)]
+            self.data_end = index_offset
+        else:
+            print(f"Warning: {path} has no index (writer not closed?); rebuilding it by scanning",
+                  file=sys.stderr)
+            self._scan(size)
+
+    def _scan(self, size: int):
+        position = HEADER.size
+        self.total = 0
+        while position + BLOCK_HEADER.size <= size:
+            self._file.seek(position)
+            length, count = BLOCK_HEADER.unpack(self._file.read(BLOCK_HEADER.size))
+            if position + BLOCK_HEADER.size + length > size:
+                break  # torn final block
+            self.blocks.append((position, length, count))
+            self.total += count
+            position += BLOCK_HEADER.size + length
+        self.data_end = position
+
+    def __len__(self) -> int:
+        return self.total
+
+    def block_payload(self, block: int) -> bytes:
+        """The decompressed payload of a block (the last one is cached)"""
+        if self._cached[0] != block:
+            offset, length, _ = self.blocks[block]
+            self._file.seek(offset + BLOCK_HEADER.size)
+            self._cached = (block, zlib.decompress(self._file.read(length)))
+        return self._cached[1]
+
+    def get(self, index: int) -> ArchivedGame:
+        """Game number index, with one seek and one block decompression"""
+        if index < 0:
+            index += self.total
+        if not 0 <= index < self.total:
+            raise IndexError(f"game {index} out of range (archive has {self.total})")
+        block, position = divmod(index, self.games_per_block)
+        payload = self.block_payload(block)
+        return decode_game(payload, _record_offset(payload, position), _block_header(payload)[1])[0]
+
+    __getitem__ = get
+
+    def __iter__(self) -> Iterator[ArchivedGame]:
+        """Stream every game in order, holding one block at a time"""
+        for block in range(len(self.blocks)):
+            yield from self.iter_block(block)
+
+    def iter_block(self, block: int) -> Iterator[ArchivedGame]:
+        payload = self.block_payload(block)
+        count, base_time = _block_header(payload)
+        pos = 12 + 4 * count
+        for _ in range(count):
+            game, pos = decode_game(payload, pos, base_time)
+            yield game
+
+    def info(self) -> Dict[str, Any]:
+        data_bytes = sum(BLOCK_HEADER.size + length for _, length, _ in self.blocks)
+        file_bytes = os.path.getsize(self.path)
+        return {
+            "games": self.total,
+            "blocks": len(self.blocks),
+            "gamesPerBlock": self.games_per_block,
+            "fileBytes": file_bytes,
+            "blockBytes": data_bytes,
+            "bytesPerGame": round(file_bytes / self.total, 2) if self.total else 0.0,
+        }
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ---------------------------------------------------------------------------
+# Converters
+# ---------------------------------------------------------------------------
+
+# m.id breaks ties between moves made within the same second; SQLite sorts
+# only within each game for it, the rest is served by idx_moves_game
+DATABASE_QUERY = """
+    SELECT g.id, g.human_player, g.current_turn, g.status, g.created_at, g.updated_at,
+           m.player, m.row, m.col, m.timestamp, m.source
+    FROM games g LEFT JOIN moves m ON m.game_id = g.id
+    ORDER BY g.rowid, m.timestamp, m.id
+"""
+
+# Keep in sync with backend/src/db/schema.rs
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS games (
+        id TEXT PRIMARY KEY,
+        human_player TEXT NOT NULL,
+        ai_player TEXT NOT NULL,
+        current_turn TEXT NOT NULL,
+        status TEXT NOT NULL,
+        created_at INTEGER NOT NULL,
+        updated_at INTEGER NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS moves (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        game_id TEXT NOT NULL,
+        player TEXT NOT NULL,
+        row INTEGER NOT NULL,
+        col INTEGER NOT NULL,
+        timestamp INTEGER NOT NULL,
+        source TEXT,
+        FOREIGN KEY (game_id) REFERENCES games(id)
+    )""",
+)
+
+
+def iter_database(db_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[ArchivedGame]:
+    """Stream the games of a game-mcp-server database, oldest first"""
+    conn = connect(db_path)
+    try:
+        row_group: List[tuple] = []
+        for row in iter_rows(conn.execute(DATABASE_QUERY), chunk_size):
+            if row_group and row[0] != row_group[0][0]:
+                yield _game_from_rows(row_group)
+                row_group = []
+            row_group.append(row)
+        if row_group:
+            yield _game_from_rows(row_group)
+    finally:
+        conn.close()
+
+
+def _game_from_rows(rows: List[tuple]) -> ArchivedGame:
+    game_id, human_player, current_turn, status, created_at, updated_at = rows[0][:6]
+    moves = [row[6:] for row in rows if row[6] is not None]
+    for player, row, col, _, _ in moves:
+        if not (0 <= row <= 2 and 0 <= col <= 2):
+            raise ValueError(f"game {game_id}: move ({row}, {col}) is off the board")
+    players = tuple(move[0] for move in moves)
+    return ArchivedGame(
+        id=game_id,
+        status=status,
+        human_player=human_player,
+        # With no moves the first mover is whoever is to move
+        first_player=players[0] if players else current_turn,
+        created_at=created_at,
+        updated_at=updated_at,
+        cells=tuple(row * 3 + col for _, row, col, _, _ in moves),
+        players=players,
+        sources=tuple(move[4] for move in moves),
+        timestamps=tuple(move[3] for move in moves),
+    )
+
+
+def pack(db_path: str, archive_path: str, games_per_block: int = DEFAULT_GAMES_PER_BLOCK,
+         level: int = 6, progress_every: int = 0) -> int:
+    """Append every game in a database to an archive; returns the number of games"""
+    count = 0
+    with ArchiveWriter(archive_path, games_per_block, level) as writer:
+        for game in iter_database(db_path):
+            writer.append(game)
+            count += 1
+            if progress_every and count % progress_every == 0:
+                print(f"[Archive] packed {count:,} games", file=sys.stderr)
+    return count
+
+
+def unpack(archive_path: str, db_path: str, batch_games: int = 10_000) -> int:
+    """
+    Insert every archived game into a database (created if needed).
+
+    Games whose id is already present fail with sqlite3.IntegrityError;
+    archived games without an id get a fresh UUID.
+    """
+    conn = sqlite3.connect(db_path)
+    count = 0
+    try:
+        for sql in SCHEMA:
+            conn.execute(sql)
+        conn.execute(INDEXES["idx_moves_game"])
+        games_batch, moves_batch = [], []
+
+        def flush():
+            conn.executemany("INSERT INTO games (id, human_player, ai_player, current_turn, status, created_at, "
+                             "updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)", games_batch)
+            conn.executemany("INSERT INTO moves (game_id, player, row, col, timestamp, source) "
+                             "VALUES (?, ?, ?, ?, ?, ?)", moves_batch)
+            conn.commit()
+            games_batch.clear()
+            moves_batch.clear()
+
+        with ArchiveReader(archive_path) as reader:
+            for game in reader:
+                game_id = game.id or str(uuid.uuid4())
+                games_batch.append((game_id, game.human_player, game.ai_player, game.current_turn, game.status,
+                                    game.created_at, game.updated_at))
+                for player, row, col, timestamp, source in game.moves():
+                    moves_batch.append((game_id, player, row, col,
+                                        game.updated_at if timestamp is None else timestamp, source))
+                count += 1
+                if len(games_batch) >= batch_games:
+                    flush()
+        flush()
+    finally:
+        conn.close()
+    return count
+
+
+def main():
+    """Main entry point for the game archive tool"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compressed, indexed archive of recorded games")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    pack_parser = commands.add_parser("pack", help="Archive the games of a database")
+    pack_parser.add_argument("db", help="Path to the game database (GAME_DB_PATH)")
+    pack_parser.add_argument("archive", help="Archive file to write")
+    pack_parser.add_argument("--append", action="store_true",
+                             help="Add to an existing archive instead of refusing to overwrite it")
+    pack_parser.add_argument("--block-size", type=int, default=DEFAULT_GAMES_PER_BLOCK,
+                             help=f"Games per compressed block (default: {DEFAULT_GAMES_PER_BLOCK})")
+    pack_parser.add_argument("--level", type=int, default=6, choices=range(1, 10), metavar="1-9",
+                             help="zlib compression level (default: 6)")
+
+    unpack_parser = commands.add_parser("unpack", help="Load an archive into a database")
+    unpack_parser.add_argument("archive", help="Archive file to read")
+    unpack_parser.add_argument("db", help="Game database to insert into (created if missing)")
+
+    info_parser = commands.add_parser("info", help="Summarize an archive")
+    info_parser.add_argument("archive", help="Archive file to read")
+    info_parser.add_argument("--scan", action="store_true",
+                             help="Also decode every game and report the scan rate")
+    info_parser.add_argument("--json", action="store_true", help="Print as JSON")
+
+    show_parser = commands.add_parser("show", help="Print games by number")
+    show_parser.add_argument("archive", help="Archive file to read")
+    show_parser.add_argument("index", type=int, nargs="+", help="Game numbers (0-based, negative from the end)")
+
+    args = parser.parse_args()
+
+    if args.command == "pack":
+        if os.path.exists(args.archive) and not args.append:
+            print(f"Error: {args.archive} exists (use --append to add to it)", file=sys.stderr)
+            sys.exit(1)
+        started = time.perf_counter()
+        count = pack(args.db, args.archive, args.block_size, args.level, progress_every=1_000_000)
+        seconds = time.perf_counter() - started
+        with ArchiveReader(args.archive) as reader:
+            info = reader.info()
+        print(f"Packed {count:,} games in {seconds:.1f}s; archive holds {info['games']:,} games in "
+              f"{info['fileBytes']:,} bytes ({info['bytesPerGame']} bytes/game, database "
+              f"{os.path.getsize(args.db):,} bytes)")
+
+    elif args.command == "unpack":
+        started = time.perf_counter()
+        count = unpack(args.archive, args.db)
+        print(f"Inserted {count:,} games into {args.db} in {time.perf_counter() - started:.1f}s")
+
+    elif args.command == "info":
+        with ArchiveReader(args.archive) as reader:
+            info = reader.info()
+            if args.scan:
+                started = time.perf_counter()
+                moves = sum(len(game.cells) for game in reader)
+                seconds = time.perf_counter() - started
+                info.update(moves=moves, scanSeconds=round(seconds, 3),
+                            gamesPerSecond=round(info["games"] / seconds) if seconds else 0)
+        if args.json:
+            print(json.dumps(info, indent=2))
+        else:
+            for key, value in info.items():
+                print(f"{key:<16} {value:,}" if isinstance(value, int) else f"{key:<16} {value}")
+
+    elif args.command == "show":
+        with ArchiveReader(args.archive) as reader:
+            for index in args.index:
+                try:
+                    print(json.dumps({"index": index, **reader[index].to_dict()}))
+                except IndexError as e:
+                    print(f"Error: {e}", file=sys.stderr)
+                    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Game Database Analytics for Tic-Tac-Toe MCP Game
+
+Answers basic questions about the games stored in a game-mcp-server database
+(GAME_DB_PATH) without loading it into memory:
+
+- How games ended (status breakdown)
+- Win rate by move source (UI vs MCP)
+- Opening frequencies (the first N moves of each game)
+- Game length distribution
+- Taunts by source
+
+The database is opened read-only, so it is safe to run against the file a
+live server is using. Moves are streamed in a single pass ordered by game:
+games are scanned in id order and each game's moves are read from the
+covering index on moves(game_id, timestamp, id, ...) without touching the
+table. SQLite still sorts the moves of each game by (timestamp, id) on their
+own (EXPLAIN QUERY PLAN shows "USE TEMP B-TREE FOR RIGHT PART OF ORDER BY"),
+a sort of one game's moves at a time rather than of the whole table; id
+orders moves made within the same second. The server creates that index on
+startup and --create-indexes adds it to databases written by older servers.
+Memory use is bounded by the SQLite page cache and the fetch chunk size, not
+by the number of rows.
+
+Usage:
+    python3 scripts/game_stats.py game.db
+    python3 scripts/game_stats.py game.db --json
+    python3 scripts/game_stats.py game.db --opening-depth 3 --top 20
+
+    # Add the indexes to a database written by an older server (read-write)
+    python3 scripts/game_stats.py game.db --create-indexes
+"""
+
+import sys
+import json
+import sqlite3
+from collections import Counter
+from typing import Optional, Dict, Any, List, Tuple, Iterator, NamedTuple
+from urllib.parse import quote
+
+# Keep in sync with backend/src/db/schema.rs
+INDEXES = {
+    "idx_moves_game": "CREATE INDEX IF NOT EXISTS idx_moves_game "
+                      "ON moves (game_id, timestamp, id, player, row, col, source)",
+    "idx_taunts_game": "CREATE INDEX IF NOT EXISTS idx_taunts_game ON taunts (game_id, timestamp)",
+}
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def connect(db_path: str, cache_mb: int = 16) -> sqlite3.Connection:
+    """
+    Open a game database read-only.
+
+    Args:
+        db_path: Path to the SQLite file
+        cache_mb: SQLite page cache size; together with the fetch chunk size
+            this bounds the memory used by a scan
+    """
+    conn = sqlite3.connect(f"file:{quote(db_path)}?mode=ro", uri=True)
+    conn.execute("PRAGMA query_only = ON")
+    conn.execute(f"PRAGMA cache_size = {-1024 * cache_mb}")
+    # Sorts that no index can serve spill to disk rather than growing in RAM
+    conn.execute("PRAGMA temp_store = FILE")
+    return conn
+
+
+def _columns(sql: str) -> str:
+    """The column list of a CREATE INDEX statement, whitespace-normalized"""
+    return " ".join(sql[sql.index("("):].split())
+
+
+def create_indexes(db_path: str):
+    """Create the analytics indexes (the only write this tool ever makes)"""
+    conn = sqlite3.connect(db_path)
+    try:
+        for name in missing_indexes(conn):
+            # An index with an older column list would shadow the new one
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+        for sql in INDEXES.values():
+            conn.execute(sql)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def missing_indexes(conn: sqlite3.Connection) -> List[str]:
+    """Names of the INDEXES not present in the database, or present with other columns"""
+    present = {name: sql for name, sql in conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'index'")}
+    return [name for name, sql in INDEXES.items()
+            if name not in present or _columns(present[name] or "") != _columns(sql)]
+
+
+def iter_rows(cursor: sqlite3.Cursor, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[tuple]:
+    """Yield a cursor's rows, fetching chunk_size at a time"""
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            return
+        yield from rows
+
+
+class GameRecord(NamedTuple):
+    """One game and its moves as (player, row, col, source), in play order"""
+    id: str
+    status: str
+    created_at: int
+    moves: List[Tuple[str, int, int, Optional[str]]]
+
+
+GAMES_QUERY = """
+    SELECT g.id, g.status, g.created_at, m.player, m.row, m.col, m.source
+    FROM games g LEFT JOIN moves m ON m.game_id = g.id
+    ORDER BY g.id, m.timestamp, m.id
+"""
+
+
+def iter_games(conn: sqlite3.Connection, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[GameRecord]:
+    """Stream every game with its moves; only one game is held at a time"""
+    cursor = conn.execute(GAMES_QUERY)
+    game: Optional[GameRecord] = None
+
+    for game_id, status, created_at, player, row, col, source in iter_rows(cursor, chunk_size):
+        if game is None or game.id != game_id:
+            if game is not None:
+                yield game
+            game = GameRecord(game_id, status, created_at, [])
+        if player is not None:
+            game.moves.append((player, row, col, source))
+
+    if game is not None:
+        yield game
+
+
+class GameStats:
+    """Aggregates over a stream of games, in constant memory"""
+
+    def __init__(self, opening_depth: int = 2):
+        self.opening_depth = opening_depth
+        self.games = 0
+        self.moves = 0
+        self.statuses: Counter = Counter()
+        self.lengths: Counter = Counter()
+        self.openings: Counter = Counter()
+        self.played_by_source: Counter = Counter()
+        self.won_by_source: Counter = Counter()
+        self.taunts_by_source: Counter = Counter()
+
+    def add(self, game: GameRecord):
+        self.games += 1
+        self.moves += len(game.moves)
+        self.statuses[game.status] += 1
+        self.lengths[len(game.moves)] += 1
+
+        if len(game.moves) >= self.opening_depth:
+            self.openings[" ".join(f"({row},{col})" for _, row, col, _ in game.moves[:self.opening_depth])] += 1
+
+        # Each side is credited to the source of its first move
+        sides: Dict[str, str] = {}
+        for player, _, _, source in game.moves:
+            sides.setdefault(player, source or "unknown")
+        for source in sides.values():
+            self.played_by_source[source] += 1
+        if game.status.startswith("Won_"):
+            winner = sides.get(game.status[len("Won_"):])
+            if winner is not None:
+                self.won_by_source[winner] += 1
+
+    def win_rates(self) -> Dict[str, float]:
+        return {source: self.won_by_source[source] / played
+                for source, played in sorted(self.played_by_source.items())}
+
+    def to_dict(self, top: int = 10) -> Dict[str, Any]:
+        return {
+            "games": self.games,
+            "moves": self.moves,
+            "statuses": dict(self.statuses.most_common()),
+            "winRateBySource": {source: round(rate, 4) for source, rate in self.win_rates().items()},
+            "gamesBySource": dict(sorted(self.played_by_source.items())),
+            "openings": dict(self.openings.most_common(top)),
+            "lengths": {str(length): count for length, count in sorted(self.lengths.items())},
+            "tauntsBySource": dict(sorted(self.taunts_by_source.items())),
+        }
+
+    def report(self, top: int = 10, file=sys.stdout):
+        """Print the aggregates as plain text tables"""
+        print(f"Games: {self.games}  Moves: {self.moves}", file=file)
+
+        print("\nStatus", file=file)
+        for status, count in self.statuses.most_common():
+            print(f"  {status:<12} {count:>10} {self._share(count):>6.1f}%", file=file)
+
+        print("\nWin rate by source", file=file)
+        for source, rate in self.win_rates().items():
+            print(f"  {source:<12} {100 * rate:>6.1f}% of {self.played_by_source[source]} games", file=file)
+
+        print(f"\nTop {top} openings (first {self.opening_depth} moves)", file=file)
+        for opening, count in self.openings.most_common(top):
+            print(f"  {opening:<24} {count:>10} {self._share(count):>6.1f}%", file=file)
+
+        print("\nGame length (moves)", file=file)
+        for length, count in sorted(self.lengths.items()):
+            print(f"  {length:>2} {count:>10} {self._share(count):>6.1f}%", file=file)
+
+        print("\nTaunts by source", file=file)
+        for source, count in sorted(self.taunts_by_source.items()):
+            print(f"  {source:<12} {count:>10}", file=file)
+
+    def _share(self, count: int) -> float:
+        return 100.0 * count / self.games if self.games else 0.0
+
+
+def analyze(conn: sqlite3.Connection, opening_depth: int = 2,
+            chunk_size: int = DEFAULT_CHUNK_SIZE) -> GameStats:
+    """Compute GameStats over the whole database in one streaming pass"""
+    stats = GameStats(opening_depth)
+    for game in iter_games(conn, chunk_size):
+        stats.add(game)
+
+    for source, count in conn.execute("SELECT COALESCE(source, 'unknown'), COUNT(*) FROM taunts GROUP BY 1"):
+        stats.taunts_by_source[source] = count
+    return stats
+
+
+def main():
+    """Main entry point for the analytics tool"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Read-only analytics over a Tic-Tac-Toe game database")
+    parser.add_argument("db_path", help="Path to the SQLite database (GAME_DB_PATH)")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the aggregates as JSON")
+    parser.add_argument("--opening-depth", type=int, default=2,
+                        help="Number of moves that make up an opening (default: 2)")
+    parser.add_argument("--top", type=int, default=10,
+                        help="Number of openings to show (default: 10)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Rows fetched per round trip (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--cache-mb", type=int, default=16,
+                        help="SQLite page cache size in MB (default: 16)")
+    parser.add_argument("--create-indexes", action="store_true",
+                        help="Create the covering indexes first (opens the database read-write)")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="Show the query plan")
+
+    args = parser.parse_args()
+
+    if args.create_indexes:
+        create_indexes(args.db_path)
+
+    conn = connect(args.db_path, cache_mb=args.cache_mb)
+    try:
+        missing = missing_indexes(conn)
+        if missing:
+            print(f"Warning: missing or outdated {', '.join(missing)}; SQLite will build a temporary index on every run. "
+                  f"Run with --create-indexes to add them.", file=sys.stderr)
+        if args.verbose:
+            for row in conn.execute(f"EXPLAIN QUERY PLAN {GAMES_QUERY}"):
+                print(f"[Plan] {row[-1]}", file=sys.stderr)
+
+        stats = analyze(conn, opening_depth=args.opening_depth, chunk_size=args.chunk_size)
+    finally:
+        conn.close()
+
+    if args.json:
+        print(json.dumps(stats.to_dict(args.top), indent=2))
+    else:
+        stats.report(args.top)
+
+
+if __name__ == "__main__":
+    main()
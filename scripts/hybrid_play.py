@@ -0,0 +1,169 @@
+"""
+Hybrid play for the LLM agents: a local strategy moves, the model taunts.
+
+When the model picks every move, each move costs several model round trips
+(view the board, think, call make_move) and the play is weak. In hybrid mode
+one of ai_agent.py's strategies picks the move and submits it right away;
+the model is only asked, on a background thread, for a taunt about that
+move, which is posted through taunt_player whenever it is ready. A move
+takes milliseconds and a game costs one short model call per AI move.
+
+HybridPlayer does not know about any provider: it takes the function that
+calls MCP tools and a function that turns a prompt into a line of text.
+
+Usage (through the example agents):
+    python3 examples/openai_agent.py --hybrid
+    python3 examples/gemini_agent.py --hybrid --strategy random
+"""
+
+import sys
+import time
+import random
+from typing import Optional, Dict, Any, List, Callable
+
+from ai_agent import MoveSearch, Strategy, decode_board, minimax_strategy
+from profiling import phase, memory_checkpoint
+
+# Longer replies are cut; the UI shows taunts in a speech bubble
+MAX_TAUNT_LENGTH = 200
+
+
+class HybridPlayer:
+    """Plays one game: moves from a local strategy, taunts from an LLM"""
+
+    def __init__(self, call_tool: Callable[[str, Optional[Dict[str, Any]]], Dict[str, Any]],
+                 write_taunt: Callable[[str], str], strategy: Strategy = minimax_strategy,
+                 poll_interval: float = 0.5, verbose: bool = True):
+        """
+        Args:
+            call_tool: Calls an MCP tool and returns its result; taunts are posted
+                from a background thread, so it must be thread-safe
+            write_taunt: Sends a prompt to the model and returns its reply
+            strategy: Move selection strategy (see ai_agent.STRATEGIES)
+            poll_interval: Seconds between checks while the opponent moves
+            verbose: Log to stderr
+        """
+        self.call_tool = call_tool
+        self.write_taunt = write_taunt
+        self.strategy = strategy
+        self.poll_interval = poll_interval
+        self.verbose = verbose
+        self.move_seconds: List[float] = []
+        self.taunt_seconds: List[float] = []
+        self.taunts_skipped = 0
+        self.status: Optional[str] = None
+
+    def log(self, message: str):
+        """Log a message if verbose mode is enabled"""
+        if self.verbose:
+            with phase("logging"):
+                print(f"[Hybrid] {message}", file=sys.stderr)
+
+    @staticmethod
+    def taunt_prompt(cells: str, move: Dict[str, int], player: str, status: str) -> str:
+        """The prompt asking the model for a taunt about the move just played"""
+        rows = "\n".join(cells[i:i + 3] for i in (0, 3, 6))
+        if status == "InProgress":
+            outcome = "The game goes on."
+        elif status == f"Won_{player}":
+            outcome = "That move won the game."
+        else:
+            outcome = "The game ended in a draw."
+        return (
+            f"You are playing tic-tac-toe as {player} and love trash talk. "
+            f"You just played row {move['row']}, column {move['col']}. "
+            f"The board is now ('.' is empty):\n{rows}\n{outcome} "
+            f"Reply with a single short taunt for your opponent (at most 20 words), nothing else."
+        )
+
+    def _taunt(self, prompt: str):
+        started = time.perf_counter()
+        try:
+            with phase("llm_wait"):
+                message = self.write_taunt(prompt)
+            message = (message or "").strip().strip('"')[:MAX_TAUNT_LENGTH]
+            if message:
+                self.call_tool("taunt_player", {"message": message})
+                self.taunt_seconds.append(time.perf_counter() - started)
+                self.log(f"Taunt posted after {self.taunt_seconds[-1]:.2f}s: {message}")
+        except Exception as e:
+            self.log(f"Taunt failed: {e}")
+
+    def _choose(self, cells: str, player: str) -> Dict[str, int]:
+        search = MoveSearch()
+        with phase("strategy"):
+            move = self.strategy(cells, player, search) or search.result()[0]
+        empty = [index for index, cell in enumerate(cells) if cell == "."]
+        if move is None or cells[move[0] * 3 + move[1]] != ".":
+            move = divmod(random.choice(empty), 3)
+        return {"row": move[0], "col": move[1]}
+
+    def play(self, max_polls: int = 1000, taunt_timeout: float = 30.0) -> Optional[str]:
+        """
+        Play until the game is over.
+
+        Returns:
+            The final game status, or None if max_polls ran out first
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="taunt")
+        pending = None
+        since = {"sinceMove": 0, "sinceTaunt": 0}
+
+        try:
+            for _ in range(max_polls):
+                # Only the turn and status matter; skip the history we already saw
+                state = self.call_tool("view_game_state", dict(since))
+                since = {"sinceMove": state.get("moveCount", 0), "sinceTaunt": state.get("tauntCount", 0)}
+
+                if state.get("status", "InProgress") != "InProgress":
+                    self.status = state.get("status")
+                    break
+
+                player = state.get("aiPlayer")
+                if state.get("currentTurn") != player:
+                    with phase("idle"):
+                        time.sleep(self.poll_interval)
+                    continue
+
+                started = time.perf_counter()
+                move = self._choose(decode_board(state.get("board")), player)
+                result = self.call_tool("make_move", move)
+                self.move_seconds.append(time.perf_counter() - started)
+
+                game_state = result.get("gameState", {})
+                status = game_state.get("status", "InProgress")
+                self.log(f"Played ({move['row']}, {move['col']}) in {self.move_seconds[-1] * 1000:.1f} ms")
+
+                # One taunt in flight at a time so the model never falls behind the
+                # game, except that the game-ending move always gets its taunt
+                if pending is None or pending.done() or status != "InProgress":
+                    prompt = self.taunt_prompt(decode_board(game_state.get("board")), move, player, status)
+                    pending = executor.submit(self._taunt, prompt)
+                else:
+                    self.taunts_skipped += 1
+
+                if status != "InProgress":
+                    self.status = status
+                    break
+        finally:
+            if pending is not None:
+                try:
+                    pending.result(timeout=taunt_timeout)
+                except Exception:
+                    self.log("Gave up waiting for the last taunt")
+            executor.shutdown(wait=False)
+
+        self.log(self.summary())
+        memory_checkpoint()
+        return self.status
+
+    def summary(self) -> str:
+        def average_ms(values: List[float]) -> str:
+            return f"{sum(values) / len(values) * 1000:.1f} ms" if values else "-"
+
+        return (f"Game over ({self.status}): {len(self.move_seconds)} moves, "
+                f"avg move {average_ms(self.move_seconds)}, "
+                f"{len(self.taunt_seconds)} taunts (avg {average_ms(self.taunt_seconds)}), "
+                f"{self.taunts_skipped} skipped")
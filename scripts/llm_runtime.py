@@ -0,0 +1,773 @@
+#!/usr/bin/env python3
+"""
+Concurrent LLM Agent Runtime for Tic-Tac-Toe MCP Game
+
+The example agents each run one blocking game per process and duplicate the
+same chat/tool loop per provider. This runtime runs many LLM-driven sessions
+concurrently on one asyncio event loop:
+
+- Provider adapters (OpenAI, Gemini) translate between a provider's chat API
+  and one neutral tool-calling loop; a simulated provider exercises the
+  runtime without API keys.
+- One ToolExecutor runs the MCP tool calls of every session over HTTP.
+- A per-provider RateScheduler keeps requests/min and tokens/min under the
+  account's limits with token buckets. Waiting requests are served by fair
+  queuing over sessions, weighted by token cost, so a session with a long
+  conversation cannot starve the others. Queue depth, wait times and time
+  spent throttled are reported at the end (backpressure metrics).
+
+The MCP server keeps one current game, so every session needs its own
+server (e.g. PORT=3001 ./target/release/backend): pass one --mcp-url per
+session. --sessions defaults to the number of URLs and may not exceed it.
+
+Usage:
+    export OPENAI_API_KEY="..."
+    python3 scripts/llm_runtime.py --provider openai \\
+        --mcp-url http://localhost:3000/mcp --mcp-url http://localhost:3001/mcp \\
+        --rpm 500 --tpm 30000
+
+    # Exercise the scheduler without an API key
+    python3 scripts/llm_runtime.py --provider simulated --rpm 60 \\
+        --mcp-url http://localhost:3000/mcp --mcp-url http://localhost:3001/mcp
+"""
+
+import os
+import abc
+import sys
+import json
+import time
+import random
+import heapq
+import asyncio
+from typing import Optional, Dict, Any, List, Tuple
+
+from mcp_codec import get_codec
+from agent_tools import COMPACT_BOARD_TOOLS
+
+DEFAULT_MCP_URL = "http://localhost:3000/mcp"
+
+# Default (requests/min, tokens/min) per provider; override with --rpm/--tpm
+DEFAULT_LIMITS = {
+    "openai": (500, 30_000),
+    "gemini": (60, 32_000),
+    "simulated": (120, 40_000),
+}
+
+SYSTEM_PROMPT = (
+    "You are a competitive tic-tac-toe player who loves trash talk. "
+    "Play strategically and taunt your opponent with creative messages. "
+    "Always check the game state first, then make your move, then taunt."
+)
+START_PROMPT = "Let's play tic-tac-toe! Make your first move and trash talk me!"
+CONTINUE_PROMPT = "Continue playing."
+
+# Bound on the conversation sent with every request: past this many entries
+# the oldest turns are dropped (the system and opening prompts are kept)
+MAX_HISTORY_MESSAGES = 24
+
+# Neutral tool definitions (JSON Schema parameters); adapters convert them
+TOOLS = [
+    {
+        "name": "view_game_state",
+        "description": "View the current tic-tac-toe game state including board, turn, status, and move history. "
+                       "The board is a 9-character row-major string of 'X', 'O' and '.' (empty).",
+        "parameters": {"type": "object", "properties": {}, "required": []},
+    },
+    {
+        "name": "get_turn",
+        "description": "Get whose turn it is (X or O)",
+        "parameters": {"type": "object", "properties": {}, "required": []},
+    },
+    {
+        "name": "make_move",
+        "description": "Make a move on the tic-tac-toe board",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "row": {"type": "integer", "description": "Row index (0-2)", "minimum": 0, "maximum": 2},
+                "col": {"type": "integer", "description": "Column index (0-2)", "minimum": 0, "maximum": 2},
+            },
+            "required": ["row", "col"],
+        },
+    },
+    {
+        "name": "taunt_player",
+        "description": "Send a trash talk message to your opponent",
+        "parameters": {
+            "type": "object",
+            "properties": {"message": {"type": "string", "description": "The taunt message to send"}},
+            "required": ["message"],
+        },
+    },
+    {
+        "name": "restart_game",
+        "description": "Restart the game with a fresh board",
+        "parameters": {"type": "object", "properties": {}, "required": []},
+    },
+]
+
+
+class RateLimited(Exception):
+    """Raised by an adapter when the provider rejected a request for rate limits"""
+
+    def __init__(self, retry_after: float = 5.0):
+        super().__init__(f"rate limited, retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+# ---------------------------------------------------------------------------
+# Scheduling
+# ---------------------------------------------------------------------------
+
+class TokenBucket:
+    """
+    A token bucket that never admits more than per_minute units in any
+    60 second window: a burst of burst_fraction of the limit, refilled at
+    the rest of the limit spread over the minute.
+    """
+
+    def __init__(self, per_minute: float, burst_fraction: float = 1 / 6):
+        self.capacity = per_minute * burst_fraction
+        self.rate = (per_minute - self.capacity) / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, amount: float) -> float:
+        """Seconds until amount units are available"""
+        self._refill()
+        missing = min(amount, self.capacity) - self.level
+        if missing <= 1e-9:
+            # Refill rounding can leave the level a hair short of a whole unit
+            return 0.0
+        return missing / self.rate if self.rate > 0 else float("inf")
+
+    def take(self, amount: float):
+        self._refill()
+        self.level -= min(amount, self.capacity)
+
+    def adjust(self, amount: float):
+        """Charge (positive) or refund (negative) units after the fact; may go below zero"""
+        self._refill()
+        self.level = min(self.capacity, self.level - amount)
+
+    def drain(self):
+        """Empty the bucket, e.g. after the provider answered 429"""
+        self._refill()
+        self.level = min(self.level, 0.0)
+
+
+class SchedulerMetrics:
+    """Backpressure and throughput counters for one RateScheduler"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.granted = 0
+        self.tokens_estimated = 0
+        self.tokens_used = 0
+        self.waits: List[float] = []
+        self.throttled_seconds = 0.0
+        self.rate_limited = 0
+        self.max_queue_depth = 0
+        self._depth_area = 0.0
+        self._depth = 0
+        self._depth_since = self.started
+
+    def queue_depth(self, depth: int):
+        """Record a change of the number of waiting requests"""
+        now = time.monotonic()
+        self._depth_area += self._depth * (now - self._depth_since)
+        self._depth, self._depth_since = depth, now
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = max(1e-9, time.monotonic() - self.started)
+        self.queue_depth(self._depth)
+        waits = sorted(self.waits)
+
+        def percentile(p: float) -> float:
+            return waits[min(len(waits) - 1, int(p * len(waits)))] if waits else 0.0
+
+        return {
+            "requests": self.granted,
+            "tokensEstimated": self.tokens_estimated,
+            "tokensUsed": self.tokens_used,
+            "requestsPerMinute": round(60 * self.granted / elapsed, 1),
+            "tokensPerMinute": round(60 * self.tokens_used / elapsed, 1),
+            "waitAvg": round(sum(waits) / len(waits), 3) if waits else 0.0,
+            "waitP95": round(percentile(0.95), 3),
+            "waitMax": round(waits[-1], 3) if waits else 0.0,
+            "avgQueueDepth": round(self._depth_area / elapsed, 2),
+            "maxQueueDepth": self.max_queue_depth,
+            "throttledSeconds": round(self.throttled_seconds, 2),
+            "rateLimited": self.rate_limited,
+        }
+
+
+class RateScheduler:
+    """
+    Admits model requests for one provider under requests/min and tokens/min
+    limits, serving waiting sessions by start-time fair queuing over token
+    cost: every session has a virtual clock that advances by the tokens it
+    is granted, and the waiting request that started earliest on that clock
+    goes next. Sessions send one request at a time, so a session coming
+    back from idle starts at the current virtual time instead of banking
+    credit.
+    """
+
+    def __init__(self, rpm: float, tpm: float, max_concurrency: int = 16):
+        """
+        Args:
+            rpm: Requests per minute
+            tpm: Tokens per minute (prompt and completion)
+            max_concurrency: Requests in flight at once
+        """
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.metrics = SchedulerMetrics()
+        self._in_flight = asyncio.Semaphore(max_concurrency)
+        # Heap of (virtual start, arrival number, cost, enqueued at, future)
+        self._waiting: List[Tuple[float, int, int, float, asyncio.Future]] = []
+        self._finish: Dict[str, float] = {}
+        self._virtual = 0.0
+        self._arrivals = 0
+        self._wakeup = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._pause_until = 0.0
+
+    async def acquire(self, session: str, estimated_tokens: int):
+        """Wait until this session may send a request of about estimated_tokens"""
+        if self._dispatcher is None:
+            self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+
+        future = asyncio.get_running_loop().create_future()
+        cost = min(estimated_tokens, self.tokens.capacity)
+        start = max(self._virtual, self._finish.get(session, 0.0))
+        self._finish[session] = start + cost
+        heapq.heappush(self._waiting, (start, self._arrivals, cost, time.monotonic(), future))
+        self._arrivals += 1
+        self.metrics.queue_depth(len(self._waiting))
+        self._wakeup.set()
+
+        await future
+        await self._in_flight.acquire()
+
+    def release(self, estimated_tokens: int, used_tokens: Optional[int]):
+        """Report a finished request; the token bucket is corrected to the real usage"""
+        self._in_flight.release()
+        if used_tokens is not None:
+            self.tokens.adjust(used_tokens - estimated_tokens)
+            self.metrics.tokens_used += used_tokens
+        else:
+            self.metrics.tokens_used += estimated_tokens
+
+    def rate_limited(self, retry_after: float):
+        """The provider pushed back anyway: stop dispatching for a while"""
+        self.metrics.rate_limited += 1
+        self.requests.drain()
+        self._pause_until = max(self._pause_until, time.monotonic() + retry_after)
+
+    async def _dispatch(self):
+        while True:
+            if not self._waiting:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            start, _, cost, enqueued, future = self._waiting[0]
+            delay = max(self.requests.delay(1), self.tokens.delay(cost),
+                        self._pause_until - time.monotonic())
+            if delay > 0:
+                # Requests that arrive meanwhile may be further behind; choose again after the wait
+                self.metrics.throttled_seconds += delay
+                await asyncio.sleep(delay)
+                continue
+
+            heapq.heappop(self._waiting)
+            self._virtual = start
+            self.requests.take(1)
+            self.tokens.take(cost)
+            self.metrics.granted += 1
+            self.metrics.tokens_estimated += cost
+            self.metrics.waits.append(time.monotonic() - enqueued)
+            self.metrics.queue_depth(len(self._waiting))
+            if not future.cancelled():
+                future.set_result(None)
+
+    def close(self):
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+
+
+# ---------------------------------------------------------------------------
+# Tool execution
+# ---------------------------------------------------------------------------
+
+class ToolExecutor:
+    """Runs MCP tool calls over HTTP for every session"""
+
+    def __init__(self, timeout: float = 10.0):
+        self.timeout = timeout
+        self.codec = get_codec()
+        self.calls = 0
+        self._http = None
+
+    def _session(self):
+        if self._http is None:
+            import requests
+            self._http = requests.Session()
+        return self._http
+
+    def _post(self, url: str, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        if name in COMPACT_BOARD_TOOLS:
+            arguments = {"boardFormat": "compact", **arguments}
+        payload = {"jsonrpc": "2.0", "method": name, "params": arguments, "id": 1}
+        response = self._session().post(url, data=self.codec.dumps(payload), timeout=self.timeout,
+                                        headers={"Content-Type": "application/json"})
+        return self.codec.decode_result(response.content)
+
+    async def execute(self, url: str, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call one tool. Errors are returned to the model as {"error": ...}
+        rather than raised, so it can correct itself.
+        """
+        self.calls += 1
+        try:
+            return await asyncio.to_thread(self._post, url, name, arguments)
+        except Exception as e:
+            return {"error": str(e)}
+
+
+def game_status(name: str, result: Dict[str, Any]) -> Optional[str]:
+    """The game status reported by a tool result, if any"""
+    if name == "view_game_state":
+        return result.get("status")
+    if name in ("make_move", "restart_game"):
+        return result.get("gameState", {}).get("status")
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Provider adapters
+# ---------------------------------------------------------------------------
+
+class ToolCall:
+    __slots__ = ("id", "name", "arguments")
+
+    def __init__(self, id: str, name: str, arguments: Dict[str, Any]):
+        self.id = id
+        self.name = name
+        self.arguments = arguments
+
+
+class Reply:
+    """One model response in provider-neutral form"""
+
+    def __init__(self, text: str = "", tool_calls: Optional[List[ToolCall]] = None,
+                 tokens: Optional[int] = None, raw: Any = None):
+        self.text = text
+        self.tool_calls = tool_calls or []
+        self.tokens = tokens
+        self.raw = raw
+
+
+class ProviderAdapter(abc.ABC):
+    """
+    Translates between a provider's chat API and the runtime's loop.
+
+    A conversation is whatever the adapter needs to continue a chat; the
+    runtime only passes it back to the same adapter. Subclasses must
+    implement every abstract method, or they fail when constructed.
+    """
+
+    name = "base"
+
+    @abc.abstractmethod
+    def new_conversation(self) -> Any:
+        """A conversation holding the system and start prompts"""
+
+    def estimate_tokens(self, conversation: Any) -> int:
+        """Rough prompt plus completion size, used before the real count is known"""
+        return len(json.dumps(conversation, default=str)) // 4 + 200
+
+    @abc.abstractmethod
+    async def complete(self, conversation: Any) -> Reply:
+        """Send the conversation and return the model's reply"""
+
+    @abc.abstractmethod
+    def add_reply(self, conversation: Any, reply: Reply, results: List[Dict[str, Any]]):
+        """Append the model's reply and the results of its tool calls"""
+
+    @abc.abstractmethod
+    def add_assistant_message(self, conversation: Any, text: str):
+        """Append a text-only model reply (one without tool calls)"""
+
+    @abc.abstractmethod
+    def add_user_message(self, conversation: Any, text: str):
+        """Append a user turn"""
+
+    # Opening entries trim_conversation always keeps
+    pinned = 2
+
+    def trim_conversation(self, conversation: Any):
+        """
+        Drop the oldest turns once the conversation has more than
+        MAX_HISTORY_MESSAGES entries. This default is for a list of role
+        dicts: the first `pinned` entries are kept, and the kept tail starts
+        at an assistant entry so no tool result is left without its call.
+        """
+        if len(conversation) <= MAX_HISTORY_MESSAGES:
+            return
+        start = len(conversation) - (MAX_HISTORY_MESSAGES - self.pinned)
+        while start < len(conversation) and conversation[start].get("role") != "assistant":
+            start += 1
+        del conversation[self.pinned:start]
+
+
+class OpenAIAdapter(ProviderAdapter):
+    """OpenAI chat completions with tool calls"""
+
+    name = "openai"
+
+    def __init__(self, model: str = "gpt-4"):
+        import openai
+
+        self.model = model
+        self.client = openai.AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        self._rate_limit_error = openai.RateLimitError
+        self.tools = [{"type": "function", "function": tool} for tool in TOOLS]
+
+    def new_conversation(self) -> List[Dict[str, Any]]:
+        return [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": START_PROMPT},
+        ]
+
+    async def complete(self, conversation: List[Dict[str, Any]]) -> Reply:
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model, messages=conversation, tools=self.tools, tool_choice="auto")
+        except self._rate_limit_error as e:
+            retry_after = float(getattr(e, "response", None) and e.response.headers.get("retry-after") or 5.0)
+            raise RateLimited(retry_after) from e
+
+        message = response.choices[0].message
+        tool_calls = [ToolCall(call.id, call.function.name, json.loads(call.function.arguments or "{}"))
+                      for call in message.tool_calls or []]
+        tokens = response.usage.total_tokens if response.usage else None
+        return Reply(message.content or "", tool_calls, tokens, message)
+
+    def add_reply(self, conversation, reply: Reply, results: List[Dict[str, Any]]):
+        conversation.append(reply.raw.model_dump(exclude_none=True))
+        for call, result in zip(reply.tool_calls, results):
+            conversation.append({"role": "tool", "tool_call_id": call.id, "content": json.dumps(result)})
+
+    def add_assistant_message(self, conversation, text: str):
+        conversation.append({"role": "assistant", "content": text})
+
+    def add_user_message(self, conversation, text: str):
+        conversation.append({"role": "user", "content": text})
+
+
+class GeminiAdapter(ProviderAdapter):
+    """Google Gemini chat with function calling"""
+
+    name = "gemini"
+
+    def __init__(self, model: str = "gemini-pro"):
+        import google.generativeai as genai
+
+        self.genai = genai
+        genai.configure(api_key=os.environ.get("GOOGLE_API_KEY"))
+        # Gemini's schema subset has no minimum/maximum
+        declarations = []
+        for tool in TOOLS:
+            properties = {name: {key: value for key, value in schema.items() if key in ("type", "description")}
+                          for name, schema in tool["parameters"]["properties"].items()}
+            parameters = {"type": "object", "properties": properties}
+            if tool["parameters"].get("required"):
+                parameters["required"] = tool["parameters"]["required"]
+            declarations.append({"name": tool["name"], "description": tool["description"],
+                                 "parameters": parameters})
+        self.model = genai.GenerativeModel(model, tools=declarations, system_instruction=SYSTEM_PROMPT)
+
+    def new_conversation(self) -> Dict[str, Any]:
+        return {"chat": self.model.start_chat(), "next": START_PROMPT}
+
+    def estimate_tokens(self, conversation) -> int:
+        history = conversation["chat"].history
+        return sum(len(str(content)) for content in history) // 4 + 200
+
+    async def complete(self, conversation) -> Reply:
+        try:
+            response = await conversation["chat"].send_message_async(conversation["next"])
+        except Exception as e:
+            if "429" in str(e) or "ResourceExhausted" in type(e).__name__:
+                raise RateLimited() from e
+            raise
+
+        text, tool_calls = [], []
+        for index, part in enumerate(response.candidates[0].content.parts if response.candidates else []):
+            if part.function_call.name:
+                tool_calls.append(ToolCall(str(index), part.function_call.name, dict(part.function_call.args)))
+            elif part.text:
+                text.append(part.text)
+        usage = getattr(response, "usage_metadata", None)
+        tokens = usage.total_token_count if usage else None
+        return Reply("".join(text), tool_calls, tokens, response)
+
+    def add_reply(self, conversation, reply: Reply, results: List[Dict[str, Any]]):
+        protos = self.genai.protos
+        conversation["next"] = protos.Content(parts=[
+            protos.Part(function_response=protos.FunctionResponse(name=call.name, response={"result": result}))
+            for call, result in zip(reply.tool_calls, results)
+        ])
+
+    def add_assistant_message(self, conversation, text: str):
+        pass  # the chat session records the model's replies itself
+
+    def add_user_message(self, conversation, text: str):
+        conversation["next"] = text
+
+    def trim_conversation(self, conversation):
+        """Keep the opening prompt and a tail that starts at a model entry"""
+        chat = conversation["chat"]
+        history = chat.history
+        if len(history) <= MAX_HISTORY_MESSAGES:
+            return
+        start = len(history) - (MAX_HISTORY_MESSAGES - 1)
+        while start < len(history) and history[start].role != "model":
+            start += 1
+        chat.history = history[:1] + history[start:]
+
+
+class SimulatedAdapter(ProviderAdapter):
+    """
+    A stand-in model for exercising the runtime without API keys: it takes
+    a random 0.2-1.0 s per reply, views the board, plays a random empty cell
+    and taunts now and then.
+    """
+
+    name = "simulated"
+
+    def __init__(self, latency: Tuple[float, float] = (0.2, 1.0)):
+        self.latency = latency
+
+    def new_conversation(self) -> List[Dict[str, Any]]:
+        return [{"role": "user", "content": START_PROMPT}]
+
+    async def complete(self, conversation) -> Reply:
+        await asyncio.sleep(random.uniform(*self.latency))
+        last = conversation[-1]
+        tokens = self.estimate_tokens(conversation)
+
+        if last.get("tool") == "view_game_state" and isinstance(last.get("result"), dict):
+            state = last["result"]
+            cells = state.get("board", "")
+            empty = [index for index, cell in enumerate(cells) if cell == "."]
+            if state.get("currentTurn") == state.get("aiPlayer") and empty:
+                row, col = divmod(random.choice(empty), 3)
+                return Reply("", [ToolCall("1", "make_move", {"row": row, "col": col})], tokens)
+            return Reply("Your move.", [], tokens)
+        if last.get("tool") == "make_move" and random.random() < 0.3:
+            return Reply("", [ToolCall("1", "taunt_player", {"message": "Is that the best you can do?"})], tokens)
+        return Reply("", [ToolCall("1", "view_game_state", {})], tokens)
+
+    pinned = 1
+
+    def add_reply(self, conversation, reply: Reply, results: List[Dict[str, Any]]):
+        conversation.append({"role": "assistant", "content": reply.text,
+                             "calls": [call.name for call in reply.tool_calls]})
+        for call, result in zip(reply.tool_calls, results):
+            conversation.append({"tool": call.name, "result": result})
+
+    def add_assistant_message(self, conversation, text: str):
+        conversation.append({"role": "assistant", "content": text})
+
+    def add_user_message(self, conversation, text: str):
+        conversation.append({"role": "user", "content": text})
+
+
+ADAPTERS = {
+    "openai": OpenAIAdapter,
+    "gemini": GeminiAdapter,
+    "simulated": SimulatedAdapter,
+}
+
+
+# ---------------------------------------------------------------------------
+# Sessions
+# ---------------------------------------------------------------------------
+
+class AgentSession:
+    """One LLM-driven game: the chat loop, shared by every provider"""
+
+    def __init__(self, session_id: str, adapter: ProviderAdapter, scheduler: RateScheduler,
+                 tools: ToolExecutor, mcp_url: str, max_turns: int = 30, poll_interval: float = 1.0,
+                 verbose: bool = False):
+        self.id = session_id
+        self.adapter = adapter
+        self.scheduler = scheduler
+        self.tools = tools
+        self.mcp_url = mcp_url
+        self.max_turns = max_turns
+        self.poll_interval = poll_interval
+        self.verbose = verbose
+        self.status: Optional[str] = None
+        self.turns = 0
+        self.error: Optional[str] = None
+        self.conversation: Any = None
+
+    def log(self, message: str):
+        """Log a message if verbose mode is enabled"""
+        if self.verbose:
+            print(f"[{self.id}] {message}", file=sys.stderr)
+
+    async def run(self):
+        self.conversation = conversation = self.adapter.new_conversation()
+
+        while self.turns < self.max_turns and self.status in (None, "InProgress"):
+            estimate = self.adapter.estimate_tokens(conversation)
+            await self.scheduler.acquire(self.id, estimate)
+            try:
+                reply = await self.adapter.complete(conversation)
+            except RateLimited as e:
+                self.scheduler.release(estimate, 0)
+                self.scheduler.rate_limited(e.retry_after)
+                self.log(str(e))
+                continue
+            except Exception as e:
+                self.scheduler.release(estimate, None)
+                self.error = str(e)
+                self.log(f"Model call failed: {e}")
+                return
+            self.scheduler.release(estimate, reply.tokens)
+            self.turns += 1
+
+            if reply.text:
+                self.log(f"Says: {reply.text}")
+
+            if reply.tool_calls:
+                results = []
+                for call in reply.tool_calls:
+                    result = await self.tools.execute(self.mcp_url, call.name, call.arguments)
+                    self.log(f"{call.name}({call.arguments}) -> {result}")
+                    self.status = game_status(call.name, result) or self.status
+                    results.append(result)
+                self.adapter.add_reply(conversation, reply, results)
+            else:
+                # The model is waiting on the opponent; don't spend quota polling
+                await asyncio.sleep(self.poll_interval)
+                self.adapter.add_assistant_message(conversation, reply.text)
+                self.adapter.add_user_message(conversation, CONTINUE_PROMPT)
+            self.adapter.trim_conversation(conversation)
+
+
+async def run_sessions(provider: str, sessions: int, urls: List[str], rpm: float, tpm: float,
+                       max_turns: int = 30, max_concurrency: int = 16, poll_interval: float = 1.0,
+                       restart: bool = True, verbose: bool = False) -> Dict[str, Any]:
+    """
+    Run the sessions to completion and return per-session results and
+    scheduler metrics. Each session needs its own MCP server (urls), since a
+    server has only one current game.
+    """
+    if sessions > len(urls):
+        raise ValueError(f"{sessions} sessions need as many MCP servers, got {len(urls)} URL(s)")
+    adapter = ADAPTERS[provider]()
+    scheduler = RateScheduler(rpm, tpm, max_concurrency=max_concurrency)
+    tools = ToolExecutor()
+
+    agents = [AgentSession(f"session-{i}", adapter, scheduler, tools, urls[i],
+                           max_turns=max_turns, poll_interval=poll_interval, verbose=verbose)
+              for i in range(sessions)]
+
+    if restart:
+        for url in urls:
+            await tools.execute(url, "restart_game", {})
+
+    started = time.monotonic()
+    try:
+        await asyncio.gather(*(agent.run() for agent in agents))
+    finally:
+        scheduler.close()
+
+    return {
+        "provider": provider,
+        "seconds": round(time.monotonic() - started, 2),
+        "toolCalls": tools.calls,
+        "sessions": [{"id": agent.id, "status": agent.status, "turns": agent.turns, "error": agent.error}
+                     for agent in agents],
+        "scheduler": scheduler.metrics.to_dict(),
+    }
+
+
+def print_report(report: Dict[str, Any], file=sys.stdout):
+    """Print a run report as plain text"""
+    print(f"Provider: {report['provider']}  Wall: {report['seconds']}s  Tool calls: {report['toolCalls']}",
+          file=file)
+    for session in report["sessions"]:
+        outcome = session["error"] or session["status"] or "unfinished"
+        print(f"  {session['id']:<12} {session['turns']:>3} model calls  {outcome}", file=file)
+
+    metrics = report["scheduler"]
+    print("\nScheduler", file=file)
+    for key, value in metrics.items():
+        print(f"  {key:<18} {value}", file=file)
+
+
+def main():
+    """Main entry point for the LLM agent runtime"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run many LLM agent sessions under provider rate limits")
+    parser.add_argument("--provider", choices=sorted(ADAPTERS), default="openai",
+                        help="Model provider (default: openai)")
+    parser.add_argument("--sessions", "-n", type=int, default=None,
+                        help="Concurrent sessions, at most one per --mcp-url (default: one per --mcp-url)")
+    parser.add_argument("--mcp-url", action="append", default=None,
+                        help=f"MCP endpoint; repeat for one server per game (default: {DEFAULT_MCP_URL})")
+    parser.add_argument("--rpm", type=float, default=None,
+                        help="Requests per minute (default: per provider)")
+    parser.add_argument("--tpm", type=float, default=None,
+                        help="Tokens per minute (default: per provider)")
+    parser.add_argument("--max-concurrency", type=int, default=16,
+                        help="Model requests in flight at once (default: 16)")
+    parser.add_argument("--max-turns", "-m", type=int, default=30,
+                        help="Model calls per session (default: 30)")
+    parser.add_argument("--poll-interval", "-p", type=float, default=1.0,
+                        help="Pause before re-prompting a model that is waiting (default: 1.0)")
+    parser.add_argument("--no-restart", action="store_true",
+                        help="Continue the current games instead of restarting them")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the report as JSON")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="Log every model reply and tool call")
+
+    args = parser.parse_args()
+
+    urls = args.mcp_url or [DEFAULT_MCP_URL]
+    sessions = len(urls) if args.sessions is None else args.sessions
+    if sessions > len(urls):
+        # Sessions sharing a server would all play (and restart) its one current game
+        parser.error(f"--sessions {sessions} needs {sessions} servers; pass one --mcp-url per session")
+
+    default_rpm, default_tpm = DEFAULT_LIMITS[args.provider]
+    report = asyncio.run(run_sessions(
+        args.provider, sessions, urls,
+        rpm=args.rpm or default_rpm, tpm=args.tpm or default_tpm,
+        max_turns=args.max_turns, max_concurrency=args.max_concurrency,
+        poll_interval=args.poll_interval, restart=not args.no_restart, verbose=args.verbose,
+    ))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
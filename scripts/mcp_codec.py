@@ -0,0 +1,308 @@
+"""
+JSON codecs and typed game objects for the Python MCP clients.
+
+Every MCP round trip encodes a request and decodes a response. With the
+standard library that means building a dict for every cell, move and taunt,
+only for the agent to look at the board. This module provides:
+
+- A pluggable codec: msgspec or orjson when installed, the standard library
+  json module otherwise. get_codec() picks the fastest available one; set
+  MCP_CODEC=json|orjson|msgspec to force a choice.
+- Move, Taunt and GameState objects with __slots__. GameState.board is
+  always the compact 9-character string, whichever format the server sent.
+- Lazy history: moveHistory and taunts are only turned into objects when
+  first accessed. With msgspec they are not even parsed until then.
+
+Usage:
+    codec = get_codec()
+    state = codec.decode_game_state(response_line)
+    state.board           # "X.O......"
+    state.move_history    # parsed on first access
+"""
+
+import os
+import json
+from typing import Any, Callable, Dict, List, Optional, Union
+
+EMPTY_BOARD = "." * 9
+
+
+def decode_board(board: Any) -> str:
+    """Decode a board in either wire format into the compact 9-character form"""
+    if isinstance(board, str):
+        return board
+
+    cells = []
+    for row in board:
+        for cell in row:
+            if isinstance(cell, dict) and "Occupied" in cell:
+                cells.append(cell["Occupied"])
+            else:
+                cells.append(".")
+    return "".join(cells)
+
+
+class Move:
+    """A move from moveHistory or get_game_history"""
+
+    __slots__ = ("player", "row", "col", "timestamp", "source")
+
+    def __init__(self, player: str, row: int, col: int, timestamp: int = 0, source: Optional[str] = None):
+        self.player = player
+        self.row = row
+        self.col = col
+        self.timestamp = timestamp
+        self.source = source
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Move":
+        return cls(data["player"], data["row"], data["col"], data.get("timestamp", 0), data.get("source"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"player": self.player, "row": self.row, "col": self.col,
+                "timestamp": self.timestamp, "source": self.source}
+
+    def __repr__(self):
+        return f"Move({self.player} at ({self.row}, {self.col}), source={self.source})"
+
+
+class Taunt:
+    """A taunt from the taunts list or get_game_history"""
+
+    __slots__ = ("message", "timestamp", "source")
+
+    def __init__(self, message: str, timestamp: int = 0, source: Optional[str] = None):
+        self.message = message
+        self.timestamp = timestamp
+        self.source = source
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Taunt":
+        return cls(data["message"], data.get("timestamp", 0), data.get("source"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"message": self.message, "timestamp": self.timestamp, "source": self.source}
+
+    def __repr__(self):
+        return f"Taunt({self.message!r}, source={self.source})"
+
+
+# Raw history is either already-parsed JSON (a list of dicts) or undecoded
+# JSON bytes, plus the function that parses those bytes
+RawHistory = Union[List[Dict[str, Any]], bytes]
+
+
+class GameState:
+    """
+    A view_game_state result.
+
+    move_history and taunts are decoded on first access. move_count and
+    taunt_count come from the server and are None for servers that predate
+    delta responses (the history is then always complete).
+    """
+
+    __slots__ = ("id", "board", "current_turn", "human_player", "ai_player", "status",
+                 "move_count", "taunt_count", "_raw_moves", "_raw_taunts", "_moves", "_taunts", "_loads")
+
+    def __init__(self, id: str, board: str, current_turn: str, human_player: str, ai_player: str,
+                 status: str, move_count: Optional[int] = None, taunt_count: Optional[int] = None,
+                 raw_moves: RawHistory = (), raw_taunts: RawHistory = (),
+                 loads: Callable[[bytes], Any] = json.loads):
+        self.id = id
+        self.board = board
+        self.current_turn = current_turn
+        self.human_player = human_player
+        self.ai_player = ai_player
+        self.status = status
+        self.move_count = move_count
+        self.taunt_count = taunt_count
+        self._raw_moves = raw_moves
+        self._raw_taunts = raw_taunts
+        self._moves: Optional[List[Move]] = None
+        self._taunts: Optional[List[Taunt]] = None
+        self._loads = loads
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GameState":
+        return cls(
+            id=data.get("id"),
+            board=decode_board(data.get("board", EMPTY_BOARD)),
+            current_turn=data.get("currentTurn"),
+            human_player=data.get("humanPlayer"),
+            ai_player=data.get("aiPlayer"),
+            status=data.get("status", "InProgress"),
+            move_count=data.get("moveCount"),
+            taunt_count=data.get("tauntCount"),
+            raw_moves=data.get("moveHistory", []),
+            raw_taunts=data.get("taunts", []),
+        )
+
+    @property
+    def is_delta_capable(self) -> bool:
+        """True if the server honours sinceMove/sinceTaunt"""
+        return self.move_count is not None
+
+    @property
+    def move_history(self) -> List[Move]:
+        if self._moves is None:
+            raw = self._raw_moves
+            if isinstance(raw, (bytes, bytearray, memoryview)):
+                raw = self._loads(raw)
+            self._moves = [Move.from_dict(item) for item in raw]
+            self._raw_moves = ()
+        return self._moves
+
+    @property
+    def taunts(self) -> List[Taunt]:
+        if self._taunts is None:
+            raw = self._raw_taunts
+            if isinstance(raw, (bytes, bytearray, memoryview)):
+                raw = self._loads(raw)
+            self._taunts = [Taunt.from_dict(item) for item in raw]
+            self._raw_taunts = ()
+        return self._taunts
+
+    def __repr__(self):
+        return f"GameState({self.id}, board={self.board!r}, turn={self.current_turn}, status={self.status})"
+
+
+def _raise_rpc_error(error: Dict[str, Any]):
+    raise Exception(f"MCP Error ({error.get('code')}): {error.get('message')}")
+
+
+class Codec:
+    """Standard library codec; always available"""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def decode_result(self, line: Union[str, bytes]) -> Any:
+        """Decode a JSON-RPC response line, returning its result or raising its error"""
+        response = self.loads(line)
+        if "error" in response:
+            _raise_rpc_error(response["error"])
+        return response.get("result", {})
+
+    def decode_game_state(self, line: Union[str, bytes]) -> GameState:
+        """Decode a view_game_state response line into a GameState"""
+        return GameState.from_dict(self.decode_result(line))
+
+
+class OrjsonCodec(Codec):
+    """orjson: the same dicts as the standard library, several times faster"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> str:
+        return self._orjson.dumps(obj).decode()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(Codec):
+    """
+    msgspec: decodes view_game_state straight into typed fields and leaves
+    moveHistory and taunts as raw JSON until GameState needs them.
+    """
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        class StateResult(msgspec.Struct, rename="camel"):
+            id: str
+            board: Any
+            current_turn: str
+            human_player: str
+            ai_player: str
+            status: str
+            move_history: msgspec.Raw = msgspec.Raw(b"[]")
+            taunts: msgspec.Raw = msgspec.Raw(b"[]")
+            move_count: Optional[int] = None
+            taunt_count: Optional[int] = None
+
+        class StateResponse(msgspec.Struct):
+            result: Optional[StateResult] = None
+            error: Optional[Dict[str, Any]] = None
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._state_decoder = msgspec.json.Decoder(StateResponse)
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._decoder.decode(data)
+
+    def decode_game_state(self, line: Union[str, bytes]) -> GameState:
+        response = self._state_decoder.decode(line)
+        if response.error is not None:
+            _raise_rpc_error(response.error)
+
+        result = response.result
+        return GameState(
+            id=result.id,
+            board=decode_board(result.board),
+            current_turn=result.current_turn,
+            human_player=result.human_player,
+            ai_player=result.ai_player,
+            status=result.status,
+            move_count=result.move_count,
+            taunt_count=result.taunt_count,
+            raw_moves=bytes(result.move_history),
+            raw_taunts=bytes(result.taunts),
+            loads=self._decoder.decode,
+        )
+
+
+CODECS = {
+    "msgspec": MsgspecCodec,
+    "orjson": OrjsonCodec,
+    "json": Codec,
+}
+
+# Codecs are stateless once built and building one sets up its encoder and
+# decoders, so get_codec() hands out one shared instance per name
+_instances: Dict[str, Codec] = {}
+_default: Optional[Codec] = None
+
+
+def get_codec(name: Optional[str] = None) -> Codec:
+    """
+    Return a codec by name, or the fastest installed one.
+
+    Args:
+        name: "msgspec", "orjson" or "json" (default: $MCP_CODEC, then the
+            first of those that imports)
+    """
+    global _default
+
+    name = name or os.environ.get("MCP_CODEC")
+    if name:
+        if name not in CODECS:
+            raise ValueError(f"Unknown codec: {name} (expected one of {', '.join(CODECS)})")
+        codec = _instances.get(name)
+        if codec is None:
+            codec = _instances[name] = CODECS[name]()
+        return codec
+
+    if _default is None:
+        for codec_class in CODECS.values():
+            try:
+                _default = codec_class()
+                break
+            except ImportError:
+                continue
+    return _default
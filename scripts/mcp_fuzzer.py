@@ -0,0 +1,556 @@
+#!/usr/bin/env python3
+"""
+JSON-RPC Protocol Fuzzer for the Tic-Tac-Toe MCP Server
+
+Streams generated JSON-RPC messages into game-mcp-server over a pipe as fast
+as the server answers them, and checks every response. The message mix
+(--weights) is:
+
+- valid:       well-formed calls to every tool and MCP method
+- range:       make_move with out-of-range or mistyped row/col (256, -1, 1.5, "0", ...)
+- malformed:   truncated or garbage JSON, invalid UTF-8, missing fields, wrong
+               jsonrpc version, deep nesting, duplicate keys
+- unknown:     unknown or near-miss method names
+- oversized:   taunt_player with messages up to --max-taunt-bytes
+
+Invariants checked on every response:
+
+- exactly one JSON line per request line, in order
+- "jsonrpc" is "2.0", exactly one of "result"/"error", and the request id
+  echoed back (null for requests that could not be parsed)
+- errors carry an integer code and a message, never an internal error
+- invalid input is never accepted, and each kind of bad input gets its
+  JSON-RPC error code (-32700, -32600, -32601 or -32602)
+
+When the server crashes, hangs or breaks an invariant, the messages leading
+up to it are replayed against fresh servers and reduced (delta debugging) to
+a minimal reproducer, saved under --crash-dir as a file that can be piped
+straight into the server.
+
+Usage:
+    python3 scripts/mcp_fuzzer.py --messages 1000000
+    python3 scripts/mcp_fuzzer.py --duration 60 --weights valid=1,malformed=1
+    ./target/release/game-mcp-server < fuzz-crashes/failure-1.jsonl
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import string
+import threading
+from collections import deque, Counter
+from typing import Optional, Dict, Any, List, Tuple, NamedTuple, FrozenSet
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPTS_DIR)
+DEFAULT_SERVER = os.path.join(REPO_ROOT, "target", "release", "game-mcp-server")
+
+# JSON-RPC error codes (backend/src/mcp/protocol.rs)
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+DEFAULT_WEIGHTS = {"valid": 60, "range": 15, "malformed": 15, "unknown": 9, "oversized": 1}
+
+
+class Case(NamedTuple):
+    """One generated request line and what its response must look like"""
+    category: str
+    line: bytes                       # without the trailing newline
+    id: Any                           # id the response must carry (None: null)
+    codes: FrozenSet[int]             # acceptable error codes
+    result_ok: bool                   # whether a successful result is acceptable
+
+
+def check(case: Case, line: bytes) -> Optional[str]:
+    """The invariant a response breaks, or None"""
+    try:
+        response = json.loads(line)
+    except ValueError:
+        return "response is not JSON"
+    if not isinstance(response, dict):
+        return "response is not an object"
+    if response.get("jsonrpc") != "2.0":
+        return "jsonrpc is not 2.0"
+    if ("result" in response) == ("error" in response):
+        return "not exactly one of result/error"
+    if response.get("id") != case.id:
+        return "wrong id"
+
+    error = response.get("error")
+    if error is None:
+        return None if case.result_ok else "invalid input accepted"
+    if not isinstance(error, dict) or not isinstance(error.get("code"), int) \
+            or not isinstance(error.get("message"), str):
+        return "malformed error object"
+    if error["code"] == INTERNAL_ERROR:
+        return "internal error"
+    if error["code"] not in case.codes:
+        return f"unexpected error code {error['code']}"
+    return None
+
+
+class MessageGenerator:
+    """Generates request lines for each category from one random stream"""
+
+    OUT_OF_RANGE = [-1, 3, 4, 255, 256, 257, 511, 65536, 2 ** 32, 2 ** 63, 2 ** 64 - 1, 2 ** 64,
+                    1.5, 0.0, -0.0, "0", "1", None, True, [], {}]
+    UNKNOWN_METHODS = ["tools/call", "make_moves", "Make_Move", "make_move ", " get_turn", "get_turn\u0000",
+                       "view-game-state", "__proto__", "constructor", "restart", "resources/list",
+                       "mäke_move", "\U0001F600", "rpc.discover"]
+
+    def __init__(self, rng: random.Random, weights: Dict[str, float], max_taunt_bytes: int = 256 * 1024):
+        self.rng = rng
+        self.max_taunt_bytes = max_taunt_bytes
+        self.categories = [name for name, weight in weights.items() if weight > 0]
+        self.cumulative = []
+        total = 0.0
+        for name in self.categories:
+            total += weights[name]
+            self.cumulative.append(total)
+        self.next_id = 0
+        self.makers = {
+            "valid": self.valid,
+            "range": self.out_of_range,
+            "malformed": self.malformed,
+            "unknown": self.unknown,
+            "oversized": self.oversized,
+        }
+
+    def __call__(self) -> Case:
+        self.next_id += 1
+        pick = self.rng.random() * self.cumulative[-1]
+        for name, bound in zip(self.categories, self.cumulative):
+            if pick < bound:
+                return self.makers[name](self.next_id)
+        return self.makers[self.categories[-1]](self.next_id)
+
+    @staticmethod
+    def request(request_id: Any, method: str, params: Any) -> bytes:
+        return json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params},
+                          separators=(",", ":")).encode()
+
+    def valid(self, request_id: int) -> Case:
+        rng = self.rng
+        roll = rng.random()
+        if roll < 0.35:
+            method, params = "make_move", {"row": rng.randrange(3), "col": rng.randrange(3)}
+        elif roll < 0.55:
+            method, params = "view_game_state", {}
+            if rng.random() < 0.5:
+                params["boardFormat"] = rng.choice(["cells", "compact"])
+            if rng.random() < 0.3:
+                params["sinceMove"] = rng.randrange(12)
+        elif roll < 0.65:
+            method, params = "get_turn", {}
+        elif roll < 0.75:
+            method, params = "taunt_player", {"message": "".join(rng.choices(string.printable, k=rng.randrange(1, 80)))}
+        elif roll < 0.85:
+            method, params = "get_game_history", {"kind": rng.choice(["moves", "taunts"]),
+                                                  "cursor": rng.randrange(20), "limit": rng.randrange(1, 50)}
+        elif roll < 0.95:
+            method, params = "restart_game", {}
+        else:
+            method, params = rng.choice(["initialize", "tools/list"]), {}
+        # make_move may hit an occupied cell or a finished game
+        return Case("valid", self.request(request_id, method, params), request_id,
+                    frozenset({INVALID_PARAMS}), True)
+
+    def out_of_range(self, request_id: int) -> Case:
+        rng = self.rng
+        params: Dict[str, Any] = {"row": rng.randrange(3), "col": rng.randrange(3)}
+        bad = rng.choice(["row", "col", "both", "missing"])
+        if bad == "missing":
+            del params[rng.choice(["row", "col"])]
+        for name in (["row", "col"] if bad == "both" else [bad] if bad != "missing" else []):
+            params[name] = rng.choice(self.OUT_OF_RANGE)
+        return Case("range", self.request(request_id, "make_move", params), request_id,
+                    frozenset({INVALID_PARAMS}), False)
+
+    def malformed(self, request_id: int) -> Case:
+        rng = self.rng
+        valid = self.request(request_id, "get_turn", {})
+        kind = rng.randrange(10)
+
+        if kind == 0:      # truncated
+            line = valid[:rng.randrange(len(valid))]
+        elif kind == 1:    # printable garbage
+            line = "".join(rng.choices(string.printable.replace("\n", "").replace("\r", ""),
+                                       k=rng.randrange(1, 200))).encode()
+        elif kind == 2:    # invalid UTF-8 inside a string
+            line = valid.replace(b"get_turn", bytes([0xff, 0xfe, rng.randrange(0x80, 0xc0)]))
+        elif kind == 3:    # missing field
+            field = rng.choice(["id", "method", "params", "jsonrpc"])
+            message = {"jsonrpc": "2.0", "id": request_id, "method": "get_turn", "params": {}}
+            del message[field]
+            line = json.dumps(message).encode()
+        elif kind == 4:    # wrong field types
+            line = json.dumps({"jsonrpc": "2.0", "id": request_id, "method": rng.choice([1, None, [], {}]),
+                               "params": {}}).encode()
+        elif kind == 5:    # deep nesting
+            depth = rng.randrange(200, 2000)
+            line = b'{"jsonrpc":"2.0","id":1,"method":"get_turn","params":' + b"[" * depth + b"]" * depth + b"}"
+        elif kind == 6:    # duplicate keys
+            line = valid[:-1] + b',"method":"make_move"}'
+        elif kind == 7:    # not an object
+            line = rng.choice([b"[]", b"null", b"42", b'"get_turn"', b"", b" ", b"\t{}",
+                               b"[" + valid + b"]"])
+        elif kind == 8:    # wrong jsonrpc version
+            line = valid.replace(b'"2.0"', rng.choice([b'"1.0"', b'"2"', b'""', b'"2.0 "']))
+            return Case("malformed", line, request_id, frozenset({INVALID_REQUEST}), False)
+        else:              # empty method
+            return Case("malformed", self.request(request_id, "", {}), request_id,
+                        frozenset({INVALID_REQUEST}), False)
+
+        return Case("malformed", line, None, frozenset({PARSE_ERROR}), False)
+
+    def unknown(self, request_id: int) -> Case:
+        rng = self.rng
+        if rng.random() < 0.5:
+            method = rng.choice(self.UNKNOWN_METHODS)
+        else:
+            method = "".join(rng.choices(string.ascii_letters + "_/", k=rng.choice([1, 8, 64, 10_000])))
+        return Case("unknown", self.request(request_id, method, {}), request_id,
+                    frozenset({METHOD_NOT_FOUND}), False)
+
+    def oversized(self, request_id: int) -> Case:
+        # Log-uniform sizes from 4 KB up to the limit
+        size = int(math.exp(self.rng.uniform(math.log(4096), math.log(max(4097, self.max_taunt_bytes)))))
+        message = self.rng.choice(string.ascii_letters) * size
+        return Case("oversized", self.request(request_id, "taunt_player", {"message": message}), request_id,
+                    frozenset({INVALID_PARAMS}), True)
+
+
+class Failure(NamedTuple):
+    """A crash, hang or broken invariant and the messages that led to it"""
+    kind: str                         # "crash", "hang" or the broken invariant
+    case: Case
+    context: List[Case]
+
+
+class Fuzzer:
+    """Runs the message stream against game-mcp-server processes"""
+
+    def __init__(self, server_path: str, generator: MessageGenerator, db_path: str = ":memory:",
+                 timeout: float = 10.0, window: int = 64, verbose: bool = False):
+        """
+        Args:
+            server_path: Path to the game-mcp-server binary
+            generator: Source of request lines
+            db_path: GAME_DB_PATH for every server started
+            timeout: Seconds without a response before the server counts as hung
+            window: Messages before a failure that are kept for minimization
+        """
+        self.server_path = server_path
+        self.generator = generator
+        self.env = dict(os.environ, GAME_DB_PATH=db_path, RUST_LOG=os.environ.get("RUST_LOG", "error"))
+        self.timeout = timeout
+        self.window = window
+        self.verbose = verbose
+        self.messages = 0
+        self.bytes_sent = 0
+        self.by_category: Counter = Counter()
+        self.error_codes: Counter = Counter()
+        self.servers_started = 0
+
+    def log(self, message: str):
+        """Log a message if verbose mode is enabled"""
+        if self.verbose:
+            print(f"[Fuzzer] {message}", file=sys.stderr)
+
+    def _start(self):
+        import subprocess
+
+        self.servers_started += 1
+        return subprocess.Popen([self.server_path], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, env=self.env, bufsize=0)
+
+    def segment(self, budget: int, deadline: float) -> Optional[Failure]:
+        """
+        Pipe up to budget messages through one fresh server.
+
+        A writer thread generates and streams requests while this thread
+        reads and checks the responses in order. The server answers requests
+        one at a time, so when it dies the oldest unanswered request is the
+        one it died on.
+        """
+        process = self._start()
+        pending: deque = deque()
+        history: deque = deque(maxlen=self.window)
+        stop = threading.Event()
+        answered = [0]
+        hung = threading.Event()
+
+        def write():
+            sent = 0
+            try:
+                while sent < budget and not stop.is_set() and time.monotonic() < deadline:
+                    batch = []
+                    for _ in range(min(256, budget - sent)):
+                        case = self.generator()
+                        pending.append(case)
+                        batch.append(case.line + b"\n")
+                    data = b"".join(batch)
+                    process.stdin.write(data)
+                    self.bytes_sent += len(data)
+                    sent += len(batch)
+            except (BrokenPipeError, OSError, ValueError):
+                pass  # the server died; the reader reports it
+            finally:
+                try:
+                    process.stdin.close()
+                except OSError:
+                    pass
+
+        def watch():
+            last = -1
+            while not stop.wait(self.timeout):
+                if answered[0] == last and pending:
+                    hung.set()
+                    process.kill()
+                    return
+                last = answered[0]
+
+        writer = threading.Thread(target=write, name="fuzz-writer", daemon=True)
+        watchdog = threading.Thread(target=watch, name="fuzz-watchdog", daemon=True)
+        writer.start()
+        watchdog.start()
+
+        failure = None
+        try:
+            for line in process.stdout:
+                case = pending.popleft()
+                answered[0] += 1
+                self.messages += 1
+                self.by_category[case.category] += 1
+                if b'"error"' in line:
+                    try:
+                        self.error_codes[json.loads(line)["error"]["code"]] += 1
+                    except (ValueError, KeyError, TypeError):
+                        pass
+
+                broken = check(case, line)
+                if broken is not None:
+                    failure = Failure(broken, case, list(history))
+                    break
+                history.append(case)
+
+            if failure is None and pending:
+                failure = Failure("hang" if hung.is_set() else "crash", pending[0], list(history))
+        finally:
+            stop.set()
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+            writer.join()
+            process.stdout.close()
+
+        return failure
+
+    def replay(self, cases: List[Case]) -> Optional[str]:
+        """Feed cases to a fresh server; return the first failure kind, if any"""
+        import subprocess
+
+        try:
+            completed = subprocess.run([self.server_path], input=b"".join(case.line + b"\n" for case in cases),
+                                       stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=self.env,
+                                       timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            return "hang"
+
+        lines = completed.stdout.splitlines()
+        for case, line in zip(cases, lines):
+            broken = check(case, line)
+            if broken is not None:
+                return broken
+        if len(lines) < len(cases):
+            return "crash"
+        return None
+
+    def minimize(self, failure: Failure) -> List[Case]:
+        """
+        Reduce the messages leading to a failure to a small set that still
+        reproduces it (ddmin). Returns them in their original order; if the
+        failure does not reproduce, the whole window is returned.
+        """
+        def fails(cases: List[Case]) -> bool:
+            return bool(cases) and self.replay(cases) == failure.kind
+
+        if fails([failure.case]):
+            return [failure.case]
+
+        cases = failure.context + [failure.case]
+        if not fails(cases):
+            self.log(f"{failure.kind} did not reproduce with {len(cases)} messages")
+            return cases
+
+        parts = 2
+        while len(cases) >= 2:
+            size = math.ceil(len(cases) / parts)
+            chunks = [cases[i:i + size] for i in range(0, len(cases), size)]
+            for index, chunk in enumerate(chunks):
+                if fails(chunk):
+                    cases, parts = chunk, 2
+                    break
+                complement = [case for other, part in enumerate(chunks) if other != index for case in part]
+                if len(chunks) > 2 and fails(complement):
+                    cases, parts = complement, max(parts - 1, 2)
+                    break
+            else:
+                if parts >= len(cases):
+                    break
+                parts = min(len(cases), parts * 2)
+        return cases
+
+    def run(self, messages: int, duration: Optional[float] = None, recycle: int = 100_000,
+            max_failures: int = 10, crash_dir: str = "fuzz-crashes") -> Dict[str, Any]:
+        """
+        Fuzz until messages have been answered or duration has passed.
+
+        The server is restarted every recycle messages (so the in-memory
+        database does not grow without bound) and after every failure.
+        """
+        started = time.monotonic()
+        deadline = started + duration if duration else float("inf")
+        failures = []
+
+        while self.messages < messages and time.monotonic() < deadline and len(failures) < max_failures:
+            budget = min(recycle, messages - self.messages)
+            failure = self.segment(budget, deadline)
+            self.log(f"{self.messages} messages, {self.messages / (time.monotonic() - started):,.0f}/s")
+            if failure is None:
+                continue
+
+            self.log(f"{failure.kind} on a {failure.case.category} message; minimizing")
+            reduced = self.minimize(failure)
+            path = self.save(crash_dir, len(failures) + 1, reduced)
+            failures.append({"kind": failure.kind, "category": failure.case.category,
+                             "messages": len(reduced), "file": path,
+                             "reproducer": [case.line[:200].decode("utf-8", "replace") for case in reduced[:5]]})
+
+        seconds = time.monotonic() - started
+        return {
+            "messages": self.messages,
+            "seconds": round(seconds, 2),
+            "messagesPerSecond": round(self.messages / seconds, 1) if seconds else 0.0,
+            "megabytesPerSecond": round(self.bytes_sent / seconds / 1e6, 2) if seconds else 0.0,
+            "serversStarted": self.servers_started,
+            "byCategory": dict(self.by_category),
+            "errorCodes": {str(code): count for code, count in sorted(self.error_codes.items())},
+            "failures": failures,
+        }
+
+    @staticmethod
+    def save(crash_dir: str, number: int, cases: List[Case]) -> str:
+        """Write a reproducer that can be piped into the server as is"""
+        os.makedirs(crash_dir, exist_ok=True)
+        path = os.path.join(crash_dir, f"failure-{number}.jsonl")
+        with open(path, "wb") as f:
+            for case in cases:
+                f.write(case.line + b"\n")
+        return path
+
+
+def parse_weights(text: str) -> Dict[str, float]:
+    """Parse "valid=60,malformed=20" on top of the defaults; unnamed categories become 0"""
+    weights = dict.fromkeys(DEFAULT_WEIGHTS, 0.0)
+    for item in text.split(","):
+        name, _, value = item.partition("=")
+        if name.strip() not in weights:
+            raise ValueError(f"unknown category '{name.strip()}'")
+        weights[name.strip()] = float(value or 1)
+    return weights
+
+
+def print_report(report: Dict[str, Any], file=sys.stdout):
+    """Print a fuzzing report as plain text"""
+    print(f"Messages: {report['messages']:,} in {report['seconds']}s "
+          f"({report['messagesPerSecond']:,.0f} msg/s, {report['megabytesPerSecond']} MB/s), "
+          f"{report['serversStarted']} server(s)", file=file)
+
+    print("\nBy category", file=file)
+    for category, count in sorted(report["byCategory"].items()):
+        print(f"  {category:<10} {count:>12,}", file=file)
+
+    print("\nError codes", file=file)
+    for code, count in report["errorCodes"].items():
+        print(f"  {code:<10} {count:>12,}", file=file)
+
+    print(f"\nFailures: {len(report['failures'])}", file=file)
+    for failure in report["failures"]:
+        print(f"  {failure['kind']} ({failure['category']}), {failure['messages']} message(s) -> {failure['file']}",
+              file=file)
+        for line in failure["reproducer"]:
+            print(f"    {line}", file=file)
+
+
+def main():
+    """Main entry point for the protocol fuzzer"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="High-rate JSON-RPC fuzzer for game-mcp-server")
+    parser.add_argument("--server", default=DEFAULT_SERVER,
+                        help="Path to the game-mcp-server binary")
+    parser.add_argument("--messages", "-n", type=int, default=1_000_000,
+                        help="Messages to send (default: 1000000)")
+    parser.add_argument("--duration", "-d", type=float, default=None,
+                        help="Stop after this many seconds")
+    parser.add_argument("--weights", default=None,
+                        help="Category mix, e.g. valid=60,range=15,malformed=15,unknown=9,oversized=1 "
+                             "(the default); categories not named are skipped")
+    parser.add_argument("--max-taunt-bytes", type=int, default=256 * 1024,
+                        help="Largest oversized taunt (default: 262144)")
+    parser.add_argument("--db-path", default=":memory:",
+                        help="GAME_DB_PATH for the fuzzed servers (default: :memory:)")
+    parser.add_argument("--recycle", type=int, default=100_000,
+                        help="Restart the server every N messages (default: 100000)")
+    parser.add_argument("--timeout", type=float, default=10.0,
+                        help="Seconds without a response before the server counts as hung (default: 10)")
+    parser.add_argument("--window", type=int, default=64,
+                        help="Messages before a failure used for minimization (default: 64)")
+    parser.add_argument("--max-failures", type=int, default=10,
+                        help="Stop after this many failures (default: 10)")
+    parser.add_argument("--crash-dir", default="fuzz-crashes",
+                        help="Where reproducers are written (default: fuzz-crashes)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Random seed (default: random, printed)")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the report as JSON")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="Log progress")
+
+    args = parser.parse_args()
+
+    try:
+        weights = parse_weights(args.weights) if args.weights else dict(DEFAULT_WEIGHTS)
+    except ValueError as e:
+        parser.error(str(e))
+    if not os.path.exists(args.server):
+        print(f"Error: MCP server not found at {args.server} (cargo build --release)", file=sys.stderr)
+        sys.exit(1)
+
+    seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+    print(f"[Fuzzer] seed {seed}", file=sys.stderr)
+
+    generator = MessageGenerator(random.Random(seed), weights, args.max_taunt_bytes)
+    fuzzer = Fuzzer(args.server, generator, db_path=args.db_path, timeout=args.timeout,
+                    window=args.window, verbose=args.verbose)
+    report = fuzzer.run(args.messages, args.duration, recycle=args.recycle,
+                        max_failures=args.max_failures, crash_dir=args.crash_dir)
+    report["seed"] = seed
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    sys.exit(1 if report["failures"] else 0)
+
+
+if __name__ == "__main__":
+    main()
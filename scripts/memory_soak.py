@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Memory Soak Benchmark for the Tic-Tac-Toe Agent
+
+Plays many consecutive games with one warm TicTacToeAgent against one
+game-mcp-server, the way agent_daemon.py keeps an agent between jobs, with
+restart_game between games. This script plays the opponent's moves (and
+sends some taunts) over the same connection.
+
+RSS is sampled every --sample-every games. The first --warmup games are not
+judged: module imports, caches and allocator arenas settle there. After
+that, RSS must stay within --max-growth-mb of the first post-warm-up
+sample. If it does not, the benchmark prints the samples and exits with
+code 1, so it can run in CI.
+
+--memory-every N also traces allocations (see profiling.MemoryTracker) and
+lists the allocation sites that grew. Tracing slows the agent down, and
+tracemalloc's own bookkeeping shows up in RSS, so judge RSS without it.
+
+Usage:
+    python3 scripts/memory_soak.py
+    python3 scripts/memory_soak.py --games 10000 --strategy minimax --ponder
+    python3 scripts/memory_soak.py --games 2000 --memory-every 500
+"""
+
+import os
+import sys
+import json
+import time
+import random
+from typing import Optional, Dict, Any, List
+
+from ai_agent import STRATEGIES, MCPClient, TicTacToeAgent
+from profiling import current_rss, memory_checkpoint, memory_run
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPTS_DIR)
+DEFAULT_SERVER = os.path.join(REPO_ROOT, "target", "release", "game-mcp-server")
+
+OPPONENT_TAUNTS = ("Lucky move.", "Is that all?", "I saw that coming.")
+
+
+def log(message: str):
+    print(f"[Soak] {message}", file=sys.stderr)
+
+
+def start_server(server_path: str, db_path: str):
+    import subprocess
+
+    env = dict(os.environ, GAME_DB_PATH=db_path, RUST_LOG=os.environ.get("RUST_LOG", "error"))
+    return subprocess.Popen(
+        [server_path],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=env,
+        text=True,
+        bufsize=1,
+    )
+
+
+def play_game(agent: TicTacToeAgent, rng: random.Random, taunt_rate: float, max_steps: int = 40) -> Optional[str]:
+    """Restart the game and play it to the end; the agent plays one side, rng the other"""
+    agent.restart_game()
+    agent.ai_player = None
+    agent.last_status = None
+
+    for _ in range(max_steps):
+        # The agent moves on its turn (or ponders while it waits)
+        if not agent.play_turn():
+            break
+        state = agent.get_game_state()
+        if state.status != "InProgress":
+            agent.last_status = state.status
+            break
+        if state.current_turn == state.ai_player:
+            continue
+
+        empty = [index for index, cell in enumerate(agent.view.board) if cell == "."]
+        row, col = divmod(rng.choice(empty), 3)
+        agent.client.call_tool("make_move", {"row": row, "col": col, "boardFormat": "compact"})
+        if rng.random() < taunt_rate:
+            agent.client.call_tool("taunt_player", {"message": rng.choice(OPPONENT_TAUNTS)})
+
+    memory_checkpoint()
+    return agent.last_status
+
+
+def judge(samples: List[Dict[str, Any]], warmup: int, max_growth: int) -> Dict[str, Any]:
+    """Compare post-warm-up RSS samples with the first of them"""
+    steady = [sample for sample in samples if sample["games"] >= warmup]
+    if len(steady) < 2:
+        return {"ok": False, "reason": "not enough samples after the warm-up"}
+    baseline = steady[0]["rss"]
+    peak = max(sample["rss"] for sample in steady)
+    games = steady[-1]["games"] - steady[0]["games"]
+    verdict = {
+        "ok": peak - baseline <= max_growth,
+        "baselineRss": baseline,
+        "peakRss": peak,
+        "finalRss": steady[-1]["rss"],
+        "growth": peak - baseline,
+        "bytesPerGame": round((steady[-1]["rss"] - baseline) / games, 2) if games else 0.0,
+    }
+    if not verdict["ok"]:
+        verdict["reason"] = f"RSS grew {(peak - baseline) / 1024:,.0f} KiB after the warm-up"
+    return verdict
+
+
+def soak(server_path: str, games: int, sample_every: int, strategy: str = "random", ponder: bool = False,
+         taunt_rate: float = 0.3, seed: int = 0, db_path: str = ":memory:") -> List[Dict[str, Any]]:
+    """Play the games and return the RSS samples"""
+    random.seed(seed)  # the agent's random choices
+    rng = random.Random(seed + 1)
+    process = start_server(server_path, db_path)
+    client = MCPClient(reader=process.stdout, writer=process.stdin)
+    agent = TicTacToeAgent(verbose=False, client=client, strategy=STRATEGIES[strategy], ponder=ponder)
+
+    samples = [{"games": 0, "rss": current_rss(), "seconds": 0.0}]
+    statuses: Dict[str, int] = {}
+    started = time.perf_counter()
+    try:
+        for game in range(1, games + 1):
+            status = play_game(agent, rng, taunt_rate) or "unfinished"
+            statuses[status] = statuses.get(status, 0) + 1
+            if game % sample_every == 0 or game == games:
+                seconds = time.perf_counter() - started
+                samples.append({"games": game, "rss": current_rss(), "seconds": round(seconds, 2)})
+                log(f"{game} games, RSS {samples[-1]['rss'] / (1024 * 1024):.2f} MB "
+                    f"({game / seconds:,.0f} games/s)")
+    finally:
+        if agent.ponderer is not None:
+            agent.ponderer.stop()
+        process.stdin.close()
+        process.wait(timeout=30)
+
+    log(f"Results: {statuses}")
+    return samples
+
+
+def main():
+    """Main entry point for the memory soak benchmark"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check that a long-running agent's RSS reaches a steady state")
+    parser.add_argument("--server", default=DEFAULT_SERVER,
+                        help="Path to the game-mcp-server binary")
+    parser.add_argument("--games", "-n", type=int, default=10_000,
+                        help="Consecutive games to play (default: 10000)")
+    parser.add_argument("--warmup", type=int, default=None,
+                        help="Games before RSS is judged (default: 10%% of --games)")
+    parser.add_argument("--sample-every", type=int, default=500,
+                        help="Games between RSS samples (default: 500)")
+    parser.add_argument("--max-growth-mb", type=float, default=2.0,
+                        help="Allowed RSS growth after the warm-up in MB (default: 2)")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="random",
+                        help="Agent strategy (default: random)")
+    parser.add_argument("--ponder", action="store_true",
+                        help="Let the agent ponder while the opponent moves")
+    parser.add_argument("--taunt-rate", type=float, default=0.3,
+                        help="Chance that the opponent taunts after each of its moves (default: 0.3)")
+    parser.add_argument("--db-path", default=":memory:",
+                        help="GAME_DB_PATH for the MCP server (default: :memory:)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Random seed (default: 0)")
+    parser.add_argument("--memory-every", metavar="N", type=int, default=None,
+                        help="Also trace allocations and report growth every N games")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the samples and verdict as JSON")
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.server):
+        print(f"Error: MCP server not found at {args.server} (cargo build --release)", file=sys.stderr)
+        sys.exit(1)
+
+    warmup = args.games // 10 if args.warmup is None else args.warmup
+    with memory_run(args.memory_every):
+        samples = soak(args.server, args.games, args.sample_every, args.strategy, args.ponder,
+                       args.taunt_rate, args.seed, args.db_path)
+    verdict = judge(samples, warmup, int(args.max_growth_mb * 1024 * 1024))
+
+    if args.json:
+        print(json.dumps({"samples": samples, "warmup": warmup, **verdict}, indent=2))
+    elif "baselineRss" in verdict:
+        print(f"RSS after {warmup} warm-up games: {verdict['baselineRss'] / (1024 * 1024):.2f} MB, "
+              f"peak {verdict['peakRss'] / (1024 * 1024):.2f} MB, "
+              f"final {verdict['finalRss'] / (1024 * 1024):.2f} MB "
+              f"({verdict['bytesPerGame']:+,.1f} B/game)")
+
+    if not verdict["ok"]:
+        print(f"FAIL: {verdict['reason']} (allowed {args.max_growth_mb} MB)", file=sys.stderr)
+        if not args.json:
+            for sample in samples:
+                print(f"  {sample['games']:>8} games  {sample['rss'] / (1024 * 1024):>8.2f} MB", file=sys.stderr)
+        sys.exit(1)
+    print("PASS: RSS is steady")
+
+
+if __name__ == "__main__":
+    main()
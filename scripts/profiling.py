@@ -0,0 +1,421 @@
+"""
+Run profiling for the Tic-Tac-Toe agents.
+
+Instrumented code marks what it is doing with phase():
+
+    with phase("mcp_io"):
+        response_line = reader.readline()
+
+Phases are free when profiling is off. With --profile PREFIX the agents wrap
+their whole run in profile_run(), which:
+
+- breaks wall time down by phase (mcp_io, json, strategy, llm_wait,
+  logging, idle; anything unmarked is reported as "other") and prints the
+  table to stderr
+- writes PREFIX.folded: stack samples in collapsed format, one
+  "frame;frame;frame count" line per stack, with the thread and phase as
+  the root frames. Feed it to flamegraph.pl, inferno or speedscope.
+- with mode="cprofile", also writes PREFIX.pstats for pstats/snakeviz.
+  cProfile only sees the main thread and inflates the cost of small calls,
+  so the phase table is more trustworthy with the default sampling mode.
+
+Memory is tracked separately. Agents call memory_checkpoint() after every
+game; with --memory-every N, memory_run() traces allocations with
+tracemalloc and every N games logs traced memory, RSS and the growth per
+game since the previous snapshot. At the end it prints the allocation sites
+that grew the most since the first snapshot, which is where a leak in a
+long-running agent shows up.
+
+Usage:
+    python3 scripts/ai_agent.py --profile /tmp/agent
+    flamegraph.pl /tmp/agent.folded > /tmp/agent.svg
+
+    python3 scripts/agent_daemon.py serve --memory-every 100
+"""
+
+import os
+import sys
+import time
+import threading
+from collections import Counter
+from typing import Optional, Dict, List
+
+PHASES = ("mcp_io", "json", "strategy", "llm_wait", "logging", "idle")
+
+
+class _NullPhase:
+    """Phase marker used when profiling is off"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+_active: Optional["RunProfiler"] = None
+_memory: Optional["MemoryTracker"] = None
+
+
+def phase(name: str):
+    """Attribute the wall time of a `with` block to the named phase"""
+    if _active is None:
+        return _NULL_PHASE
+    return _Phase(_active, name)
+
+
+class _Phase:
+    """Phase marker that records time into the active profiler"""
+
+    __slots__ = ("profiler", "name", "started")
+
+    def __init__(self, profiler: "RunProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        now = time.perf_counter()
+        ident = threading.get_ident()
+        stack = self.profiler.stacks.setdefault(ident, [])
+        # Nested phases are exclusive: pause the enclosing one
+        if stack:
+            self.profiler.add(stack[-1].name, now - stack[-1].started)
+        stack.append(self)
+        self.profiler.current[ident] = self.name
+        self.started = now
+        return self
+
+    def __exit__(self, *exc):
+        now = time.perf_counter()
+        ident = threading.get_ident()
+        stack = self.profiler.stacks[ident]
+        self.profiler.add(self.name, now - self.started)
+        stack.pop()
+        if stack:
+            stack[-1].started = now
+            self.profiler.current[ident] = stack[-1].name
+        else:
+            self.profiler.current.pop(ident, None)
+        return False
+
+
+class RunProfiler:
+    """Profiles one agent run; use as a context manager around the run"""
+
+    def __init__(self, prefix: str, mode: str = "sample", interval: float = 0.001):
+        """
+        Args:
+            prefix: Output path prefix (PREFIX.folded, PREFIX.pstats)
+            mode: "sample" (stack sampling only) or "cprofile" (also cProfile)
+            interval: Seconds between stack samples
+        """
+        if mode not in ("sample", "cprofile"):
+            raise ValueError(f"Unknown profile mode: {mode}")
+
+        self.prefix = prefix
+        self.mode = mode
+        self.interval = interval
+        self.totals: Dict[str, float] = {}
+        self.main_totals: Dict[str, float] = {}
+        self.stacks: Dict[int, List[_Phase]] = {}
+        self.current: Dict[int, str] = {}
+        self.samples: Counter = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._cprofile = None
+        self._main_ident = threading.get_ident()
+        self._started = 0.0
+        self.wall = 0.0
+
+    def add(self, name: str, seconds: float):
+        with self._lock:
+            self.totals[name] = self.totals.get(name, 0.0) + seconds
+            if threading.get_ident() == self._main_ident:
+                self.main_totals[name] = self.main_totals.get(name, 0.0) + seconds
+
+    def _sample_loop(self):
+        own = threading.get_ident()
+        names = {}
+        while not self._stop.wait(self.interval):
+            for thread in threading.enumerate():
+                names[thread.ident] = thread.name
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)})")
+                    frame = frame.f_back
+                stack.append(f"phase:{self.current.get(ident, 'other')}")
+                stack.append(names.get(ident, f"thread-{ident}"))
+                self.samples[";".join(reversed(stack))] += 1
+
+    def __enter__(self):
+        global _active
+        _active = self
+        self._started = time.perf_counter()
+
+        self._sampler = threading.Thread(target=self._sample_loop, name="profiler", daemon=True)
+        self._sampler.start()
+
+        if self.mode == "cprofile":
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        return self
+
+    def __exit__(self, *exc):
+        global _active
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        self._stop.set()
+        self._sampler.join()
+        self.wall = time.perf_counter() - self._started
+        _active = None
+
+        self.write()
+        self.report()
+        return False
+
+    def write(self):
+        """Write the collapsed stacks (and cProfile stats)"""
+        with open(f"{self.prefix}.folded", "w") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+        if self._cprofile is not None:
+            self._cprofile.dump_stats(f"{self.prefix}.pstats")
+
+    def report(self, file=sys.stderr):
+        """Print wall time by phase for the main thread"""
+        names = list(PHASES) + sorted(set(self.main_totals) - set(PHASES))
+        attributed = sum(self.main_totals.values())
+
+        print(f"\n{'Phase':<12} {'Seconds':>10} {'Share':>7}", file=file)
+        for name in names:
+            seconds = self.main_totals.get(name, 0.0)
+            print(f"{name:<12} {seconds:>10.4f} {self._share(seconds):>6.1f}%", file=file)
+        other = max(0.0, self.wall - attributed)
+        print(f"{'other':<12} {other:>10.4f} {self._share(other):>6.1f}%", file=file)
+        print(f"{'wall':<12} {self.wall:>10.4f}", file=file)
+
+        background = {name: seconds - self.main_totals.get(name, 0.0)
+                      for name, seconds in self.totals.items()}
+        background = {name: seconds for name, seconds in background.items() if seconds > 0}
+        if background:
+            summary = ", ".join(f"{name} {seconds:.4f}s" for name, seconds in sorted(background.items()))
+            print(f"Background threads (overlap the above): {summary}", file=file)
+
+        print(f"Stack samples: {sum(self.samples.values())} -> {self.prefix}.folded", file=file)
+        if self._cprofile is not None:
+            print(f"cProfile stats -> {self.prefix}.pstats", file=file)
+
+    def _share(self, seconds: float) -> float:
+        return 100.0 * seconds / self.wall if self.wall else 0.0
+
+
+class TurnTimer:
+    """
+    Latency milestones of one streamed LLM turn, in seconds from its start.
+
+    first_token: the first streamed chunk arrived
+    dispatched: the tool call was handed to the MCP server
+    finished: the stream ended and the tool result was in
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.first_token: Optional[float] = None
+        self.dispatched: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    def _elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def token(self):
+        if self.first_token is None:
+            self.first_token = self._elapsed()
+
+    def dispatch(self):
+        if self.dispatched is None:
+            self.dispatched = self._elapsed()
+
+    def finish(self):
+        self.finished = self._elapsed()
+
+    def summary(self) -> str:
+        def ms(value: Optional[float]) -> str:
+            return "-" if value is None else f"{value * 1000:.0f} ms"
+
+        return (f"first token {ms(self.first_token)}, tool dispatch {ms(self.dispatched)}, "
+                f"done {ms(self.finished)}")
+
+
+def summarize_turns(timers: List[TurnTimer]) -> str:
+    """Average time to first token and to tool dispatch over several turns"""
+    def average(values: List[float]) -> str:
+        return f"{sum(values) / len(values) * 1000:.0f} ms" if values else "-"
+
+    first_tokens = [timer.first_token for timer in timers if timer.first_token is not None]
+    dispatches = [timer.dispatched for timer in timers if timer.dispatched is not None]
+    return (f"{len(timers)} turns, avg first token {average(first_tokens)}, "
+            f"avg tool dispatch {average(dispatches)} ({len(dispatches)} tool calls)")
+
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes (peak RSS where /proc is unavailable)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _mb(size: float) -> str:
+    return f"{size / (1024 * 1024):.2f} MB"
+
+
+class MemoryTracker:
+    """Traces allocations with tracemalloc and snapshots them every N games"""
+
+    def __init__(self, every: int, top: int = 10, frames: int = 1, file=sys.stderr):
+        """
+        Args:
+            every: Games between snapshots
+            top: Allocation sites to list in each report
+            frames: Stack frames recorded per allocation (more is slower)
+        """
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.every = every
+        self.top = top
+        self.frames = frames
+        self.file = file
+        self.games = 0
+        # (games, traced bytes, RSS bytes) per snapshot
+        self.points: List[tuple] = []
+        self._first = None
+        self._previous = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        import tracemalloc
+        global _memory
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        _memory = self
+        return self
+
+    def __exit__(self, *exc):
+        import tracemalloc
+        global _memory
+        _memory = None
+        if self._first is not None:
+            self.report()
+        tracemalloc.stop()
+        self._first = self._previous = None
+        return False
+
+    def game_finished(self):
+        with self._lock:
+            self.games += 1
+            if self.games % self.every == 0:
+                self.snapshot()
+
+    def _take(self):
+        import tracemalloc
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+
+    def snapshot(self):
+        """Record traced memory and RSS now, and log the growth since the previous snapshot"""
+        import tracemalloc
+        snapshot = self._take()
+        traced = tracemalloc.get_traced_memory()[0]
+        rss = current_rss()
+        line = f"[Memory] {self.games} games: traced {_mb(traced)}, RSS {_mb(rss)}"
+        if self.points:
+            games, previous_traced, previous_rss = self.points[-1]
+            played = self.games - games
+            line += (f", {(traced - previous_traced) / played:+,.0f} B/game traced, "
+                     f"{(rss - previous_rss) / played:+,.0f} B/game RSS")
+        print(line, file=self.file)
+        self.points.append((self.games, traced, rss))
+        if self._first is None:
+            self._first = snapshot
+        self._previous = snapshot
+
+    def growth_rate(self) -> Optional[float]:
+        """Least-squares traced bytes per game over the snapshots after the first"""
+        points = self.points[1:]
+        if len(points) < 2:
+            return None
+        mean_games = sum(p[0] for p in points) / len(points)
+        mean_bytes = sum(p[1] for p in points) / len(points)
+        spread = sum((p[0] - mean_games) ** 2 for p in points)
+        return sum((p[0] - mean_games) * (p[1] - mean_bytes) for p in points) / spread
+
+    def top_growth(self, limit: Optional[int] = None) -> List[str]:
+        """The allocation sites that grew most between the first and last snapshots"""
+        if self._first is None or self._previous is self._first:
+            return []
+        stats = self._previous.compare_to(self._first, "lineno")
+        lines = []
+        for stat in stats[:limit or self.top]:
+            if stat.size_diff <= 0:
+                break
+            frame = stat.traceback[0]
+            lines.append(f"{stat.size_diff:>+12,} B {stat.count_diff:>+8,} blocks  "
+                         f"{frame.filename}:{frame.lineno}")
+        return lines
+
+    def report(self):
+        """Print the growth rate and top growing allocation sites"""
+        rate = self.growth_rate()
+        print(f"\n[Memory] {self.games} games, {len(self.points)} snapshots every {self.every} games", file=self.file)
+        if rate is not None:
+            print(f"[Memory] Growth after the first snapshot: {rate:+,.1f} B/game traced", file=self.file)
+        growth = self.top_growth()
+        if growth:
+            print(f"[Memory] Top {len(growth)} growing allocation sites since game {self.points[0][0]}:",
+                  file=self.file)
+            for line in growth:
+                print(f"  {line}", file=self.file)
+
+
+def memory_checkpoint():
+    """Mark the end of a game; snapshots memory every N games when tracking is on"""
+    if _memory is not None:
+        _memory.game_finished()
+
+
+def memory_run(every: Optional[int]):
+    """Context manager that tracks memory every N games if every is given"""
+    if not every:
+        return _NULL_PHASE
+    return MemoryTracker(every)
+
+
+def profile_run(prefix: Optional[str], mode: str = "sample"):
+    """Context manager that profiles the run if a prefix is given"""
+    if prefix is None:
+        return _NULL_PHASE
+    return RunProfiler(prefix, mode)
+
+
+def add_profile_arguments(parser):
+    """Add --profile/--profile-mode to an argparse parser"""
+    parser.add_argument("--profile", metavar="PREFIX", default=None,
+                        help="Profile the run, writing PREFIX.folded (and PREFIX.pstats)")
+    parser.add_argument("--profile-mode", choices=["sample", "cprofile"], default="sample",
+                        help="Stack sampling only, or also cProfile (default: sample)")
+    parser.add_argument("--memory-every", metavar="N", type=int, default=None,
+                        help="Trace allocations and report memory growth every N games")
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Self-Play Trainer for Tic-Tac-Toe MCP Game
+
+Learns a move policy by tabular Q-learning over self-play games and exports
+it in the format ai_agent.py loads with --policy.
+
+The Q table has one row per board as seen by the player to move
+(ai_agent.relative_index, 3**9 rows) and one column per cell. Because both
+sides share the table, the value of a move is the negated value of the
+opponent's best reply (negamax-style Q-learning): +1 for a win, 0 for a
+draw.
+
+The table lives in a multiprocessing.shared_memory block. Every worker
+process maps it as a NumPy array and applies its updates in place without
+locks (Hogwild-style); occasional lost updates between workers do not stop
+the table from converging, and nothing is ever pickled between processes.
+By default one worker runs per CPU.
+
+Requires numpy.
+
+Usage:
+    python3 scripts/selfplay_trainer.py --episodes 2000000 --out policy.json
+    python3 scripts/ai_agent.py --policy policy.json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+from typing import Optional, Dict, Any, List, Tuple
+
+from ai_agent import WIN_LINES, PolicyStrategy, MoveSearch, random_strategy
+from game_annotator import solve
+
+N_CELLS = 9
+N_STATES = 3 ** N_CELLS
+POWERS = [3 ** cell for cell in range(N_CELLS)]
+LINES_THROUGH = [[line for line in WIN_LINES if cell in line] for cell in range(N_CELLS)]
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        print("Error: numpy is required for the self-play trainer (pip install numpy)", file=sys.stderr)
+        sys.exit(1)
+    return numpy
+
+
+def _wins(marks: List[int], cell: int, mark: int) -> bool:
+    """True if the mark just placed on cell completes a line"""
+    return any(marks[a] == marks[b] == marks[c] == mark for a, b, c in LINES_THROUGH[cell])
+
+
+def _train_worker(shm_name: str, worker: int, episodes: int, seed: int, params: Dict[str, float],
+                  progress):
+    """Play self-play episodes, updating the shared Q table in place"""
+    from multiprocessing import shared_memory
+    np = _import_numpy()
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        q = np.ndarray((N_STATES, N_CELLS), dtype=np.float32, buffer=shm.buf)
+        rng = random.Random(seed)
+        alpha = params["alpha"]
+        eps_start, eps_end = params["epsilon_start"], params["epsilon_end"]
+
+        for episode in range(episodes):
+            epsilon = eps_start + (eps_end - eps_start) * episode / max(1, episodes - 1)
+            marks = [0] * N_CELLS          # 0 empty, 1 and 2 the two sides
+            views = [0, 0]                 # relative_index for side 1 and side 2
+            empty = list(range(N_CELLS))
+            side = 0
+
+            while True:
+                state = views[side]
+                if rng.random() < epsilon:
+                    action = rng.choice(empty)
+                else:
+                    row = q[state].tolist()
+                    action = max(empty, key=row.__getitem__)
+
+                marks[action] = side + 1
+                views[side] += POWERS[action]
+                views[1 - side] += 2 * POWERS[action]
+                empty.remove(action)
+
+                done = True
+                if _wins(marks, action, side + 1):
+                    target = 1.0
+                elif not empty:
+                    target = 0.0
+                else:
+                    reply = q[views[1 - side]].tolist()
+                    target = -max(reply[cell] for cell in empty)
+                    done = False
+
+                q[state, action] += alpha * (target - q[state, action])
+
+                if done:
+                    break
+                side = 1 - side
+
+            if episode % 1000 == 999:
+                progress[worker] = episode + 1
+        progress[worker] = episodes
+        del q  # release the view before closing the mapping
+    finally:
+        shm.close()
+
+
+def export_policy(q, path: str, metadata: Optional[Dict[str, Any]] = None):
+    """
+    Write the greedy policy of a Q table in the format PolicyStrategy reads.
+
+    Positions that are unreachable or where the trainer never updated a legal
+    move are written as "-".
+    """
+    moves = []
+    for state in range(N_STATES):
+        marks, rest = [], state
+        for _ in range(N_CELLS):
+            rest, mark = divmod(rest, 3)
+            marks.append(mark)
+        legal = [cell for cell in range(N_CELLS) if marks[cell] == 0]
+        row = q[state].tolist()
+        if not legal or not any(row[cell] for cell in legal):
+            moves.append("-")
+        else:
+            moves.append(str(max(legal, key=row.__getitem__)))
+
+    policy = {
+        "format": PolicyStrategy.FORMAT,
+        "version": 1,
+        "encoding": "relative base-3: cell i adds 3**i * (0 empty, 1 player to move, 2 opponent)",
+        **(metadata or {}),
+        "moves": "".join(moves),
+    }
+    with open(path, "w") as f:
+        json.dump(policy, f)
+
+
+def _play(strategies: Tuple[Any, Any], rng: random.Random) -> Optional[int]:
+    """Play one game between two strategies; return the winning index or None"""
+    cells = "." * N_CELLS
+    players = ("X", "O")
+    turn = 0
+    while "." in cells:
+        strategy = strategies[turn]
+        search = MoveSearch()
+        move = strategy(cells, players[turn], search) or search.result()[0]
+        if move is None or cells[move[0] * 3 + move[1]] != ".":
+            empty = [index for index, cell in enumerate(cells) if cell == "."]
+            move = divmod(rng.choice(empty), 3)
+        index = move[0] * 3 + move[1]
+        cells = cells[:index] + players[turn] + cells[index + 1:]
+        marks = [1 if cell == players[turn] else 0 for cell in cells]
+        if _wins(marks, index, 1):
+            return turn
+        turn = 1 - turn
+    return None
+
+
+def perfect_strategy(rng: random.Random):
+    """
+    Minimax opponent for evaluation: perfect play that picks at random among
+    the moves with the best result, so repeated games differ (minimax_strategy
+    always picks the same move and would replay the same two games).
+    """
+    def strategy(cells: str, player: str, search: MoveSearch) -> Optional[Tuple[int, int]]:
+        opponent = "O" if player == "X" else "X"
+        values = {index: -solve(cells[:index] + player + cells[index + 1:], opponent)[0]
+                  for index, cell in enumerate(cells) if cell == "."}
+        if not values:
+            return None
+        best = max(values.values())
+        return divmod(rng.choice([index for index, value in values.items() if value == best]), 3)
+
+    return strategy
+
+
+def evaluate(policy: PolicyStrategy, games: int, seed: int = 0) -> Dict[str, Dict[str, int]]:
+    """
+    Win/draw/loss counts for the policy against random and minimax (perfect
+    play, see perfect_strategy), games each, moving first and second in turn
+    """
+    rng = random.Random(seed)
+    random.seed(seed)
+    results = {}
+    for name, opponent in (("random", random_strategy), ("minimax", perfect_strategy(rng))):
+        tally = {"win": 0, "draw": 0, "loss": 0}
+        for game in range(games):
+            first = game % 2 == 0
+            winner = _play((policy, opponent) if first else (opponent, policy), rng)
+            if winner is None:
+                tally["draw"] += 1
+            elif (winner == 0) == first:
+                tally["win"] += 1
+            else:
+                tally["loss"] += 1
+        results[name] = tally
+    return results
+
+
+def train(episodes: int, workers: int, params: Dict[str, float], seed: int = 0, verbose: bool = True):
+    """
+    Run the self-play workers and return the trained Q table (a copy).
+
+    Args:
+        episodes: Total self-play games, split evenly between the workers
+        workers: Number of worker processes
+        params: alpha, epsilon_start and epsilon_end
+        seed: Base random seed (worker i uses seed + i)
+    """
+    import multiprocessing
+    from multiprocessing import shared_memory
+    np = _import_numpy()
+
+    shm = shared_memory.SharedMemory(create=True, size=N_STATES * N_CELLS * 4)
+    try:
+        q = np.ndarray((N_STATES, N_CELLS), dtype=np.float32, buffer=shm.buf)
+        q[:] = 0.0
+        progress = multiprocessing.Array("q", workers, lock=False)
+
+        shares = [episodes // workers + (1 if i < episodes % workers else 0) for i in range(workers)]
+        processes = [
+            multiprocessing.Process(target=_train_worker, name=f"selfplay-{i}",
+                                    args=(shm.name, i, shares[i], seed + i, params, progress))
+            for i in range(workers)
+        ]
+
+        started = time.perf_counter()
+        for process in processes:
+            process.start()
+
+        while any(process.is_alive() for process in processes):
+            time.sleep(1.0)
+            if verbose:
+                done = sum(progress)
+                rate = done / (time.perf_counter() - started)
+                print(f"[Trainer] {done}/{episodes} episodes ({rate:,.0f}/s)", file=sys.stderr)
+
+        for process in processes:
+            process.join()
+            if process.exitcode != 0:
+                raise RuntimeError(f"{process.name} exited with code {process.exitcode}")
+
+        if verbose:
+            seconds = time.perf_counter() - started
+            print(f"[Trainer] {episodes} episodes in {seconds:.1f}s with {workers} workers "
+                  f"({episodes / seconds:,.0f}/s)", file=sys.stderr)
+        table = q.copy()
+        del q  # release the view before closing the mapping
+        return table
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def main():
+    """Main entry point for the self-play trainer"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Self-play Q-learning trainer for Tic-Tac-Toe")
+    parser.add_argument("--episodes", "-n", type=int, default=500_000,
+                        help="Total self-play games (default: 500000)")
+    parser.add_argument("--workers", "-w", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: one per CPU)")
+    parser.add_argument("--alpha", type=float, default=0.3,
+                        help="Learning rate (default: 0.3)")
+    parser.add_argument("--epsilon-start", type=float, default=1.0,
+                        help="Exploration rate at the start of each worker's run (default: 1.0)")
+    parser.add_argument("--epsilon-end", type=float, default=0.05,
+                        help="Exploration rate at the end (default: 0.05)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Random seed (default: 0)")
+    parser.add_argument("--out", "-o", default="policy.json",
+                        help="Policy file to write (default: policy.json)")
+    parser.add_argument("--save-table", metavar="FILE", default=None,
+                        help="Also save the raw Q table as a .npy file")
+    parser.add_argument("--eval-games", type=int, default=1000,
+                        help="Games against each of random and minimax after training (default: 1000)")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="Only print the evaluation")
+
+    args = parser.parse_args()
+
+    params = {"alpha": args.alpha, "epsilon_start": args.epsilon_start, "epsilon_end": args.epsilon_end}
+    q = train(args.episodes, args.workers, params, seed=args.seed, verbose=not args.quiet)
+
+    if args.save_table:
+        _import_numpy().save(args.save_table, q)
+
+    export_policy(q, args.out, {"episodes": args.episodes, **params})
+    print(f"Policy written to {args.out}")
+
+    if args.eval_games:
+        for opponent, tally in evaluate(PolicyStrategy(args.out), args.eval_games, args.seed).items():
+            rates = "  ".join(f"{outcome} {100 * tally[outcome] / args.eval_games:5.1f}% ({tally[outcome]})"
+                              for outcome in ("win", "draw", "loss"))
+            print(f"vs {opponent:<8} {rates}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Storage Benchmark for the Tic-Tac-Toe MCP Server
+
+Measures how long each MCP tool takes as the game database grows, for each
+place the database can live (GAME_DB_PATH):
+
+- memory: ":memory:"
+- tmpfs:  a file in a RAM-backed directory (default /dev/shm)
+- disk:   a file in a directory on disk (default: the current directory)
+
+For every variant one game-mcp-server process is started and the database
+is grown in steps (--sizes). At each step the server is filled with random
+games and taunts up to the step's size (requests pipelined over stdio),
+then every tool is timed with sequential round trips while playing a few
+more games. The result is one latency curve per tool and variant, printed as
+a table and optionally charted (--plot, requires matplotlib).
+
+Usage:
+    python3 scripts/storage_benchmark.py
+    python3 scripts/storage_benchmark.py --sizes 0,1000,10000,100000 --plot latency.png
+    python3 scripts/storage_benchmark.py --variants disk --disk-dir /mnt/data --json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import tempfile
+from typing import Optional, Dict, Any, List, Tuple
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPTS_DIR)
+DEFAULT_SERVER = os.path.join(REPO_ROOT, "target", "release", "game-mcp-server")
+
+VARIANTS = ("memory", "tmpfs", "disk")
+TOOLS = ("view_game_state", "get_turn", "make_move", "taunt_player", "get_game_history", "restart_game")
+DEFAULT_SIZES = (0, 1000, 10000)
+
+WIN_LINES = [(0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)]
+
+
+def log(message: str):
+    print(f"[Bench] {message}", file=sys.stderr)
+
+
+def random_game(rng: random.Random) -> List[int]:
+    """Cells of a random game, in play order, up to its end"""
+    cells = list(range(9))
+    rng.shuffle(cells)
+    owner = [None] * 9
+    for ply, cell in enumerate(cells):
+        owner[cell] = ply % 2
+        if any(owner[a] == owner[b] == owner[c] is not None for a, b, c in WIN_LINES if cell in (a, b, c)):
+            return cells[:ply + 1]
+    return cells
+
+
+class BenchServer:
+    """A game-mcp-server subprocess with a given GAME_DB_PATH"""
+
+    def __init__(self, server_path: str, db_path: str):
+        import subprocess
+
+        env = dict(os.environ, GAME_DB_PATH=db_path, RUST_LOG=os.environ.get("RUST_LOG", "error"))
+        self.process = subprocess.Popen(
+            [server_path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            bufsize=0,
+        )
+        self.stdin = self.process.stdin
+        self.stdout = self.process.stdout
+        self.next_id = 0
+        self.games = 0
+        self.taunts = 0
+
+    def _request(self, method: str, params: Dict[str, Any]) -> bytes:
+        self.next_id += 1
+        return (json.dumps({"jsonrpc": "2.0", "method": method, "params": params, "id": self.next_id})
+                + "\n").encode()
+
+    def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Tuple[float, Dict[str, Any]]:
+        """One round trip; returns (seconds, response)"""
+        request = self._request(method, params or {})
+        started = time.perf_counter()
+        self.stdin.write(request)
+        line = self.stdout.readline()
+        elapsed = time.perf_counter() - started
+        if not line:
+            raise Exception(f"MCP server exited (code {self.process.poll()})")
+        return elapsed, json.loads(line)
+
+    def fill(self, games: int, taunts_per_game: int, rng: random.Random) -> float:
+        """
+        Store random games without waiting for each response.
+
+        Requests go out in chunks of 1000 games; a writer thread streams each
+        chunk while this thread drains the responses, so neither side blocks
+        on a full pipe.
+        """
+        import threading
+
+        started = time.perf_counter()
+        errors = 0
+        for start in range(0, games, 1000):
+            # Build a chunk first so the writer thread never touches the RNG or ids
+            batch = []
+            for _ in range(min(1000, games - start)):
+                batch.append(self._request("restart_game", {}))
+                for cell in random_game(rng):
+                    batch.append(self._request("make_move", {"row": cell // 3, "col": cell % 3}))
+                for i in range(taunts_per_game):
+                    batch.append(self._request("taunt_player", {"message": f"Benchmark taunt {i}"}))
+
+            failure: List[BaseException] = []
+
+            def write():
+                try:
+                    self.stdin.write(b"".join(batch))
+                except BaseException as e:
+                    failure.append(e)
+
+            writer = threading.Thread(target=write, name="bench-fill", daemon=True)
+            writer.start()
+            for _ in batch:
+                line = self.stdout.readline()
+                if not line:
+                    raise Exception(f"MCP server exited during fill (code {self.process.poll()})")
+                if b'"error"' in line:
+                    errors += 1
+            writer.join()
+            if failure:
+                raise failure[0]
+
+        if errors:
+            log(f"{errors} fill requests failed")
+
+        self.games += games
+        self.taunts += games * taunts_per_game
+        return time.perf_counter() - started
+
+    def measure(self, rounds: int, rng: random.Random) -> Dict[str, List[float]]:
+        """Time every tool with sequential round trips while playing rounds games"""
+        timings: Dict[str, List[float]] = {tool: [] for tool in TOOLS}
+
+        for _ in range(rounds):
+            seconds, _ = self.call("restart_game")
+            timings["restart_game"].append(seconds)
+            for cell in random_game(rng):
+                for tool, params in (("view_game_state", {}), ("get_turn", {}),
+                                     ("make_move", {"row": cell // 3, "col": cell % 3}),
+                                     ("taunt_player", {"message": "Benchmark taunt"}),
+                                     ("get_game_history", {"kind": "moves", "limit": 50})):
+                    seconds, response = self.call(tool, params)
+                    if "error" in response:
+                        raise Exception(f"{tool} failed: {response['error']}")
+                    timings[tool].append(seconds)
+                self.taunts += 1
+            self.games += 1
+
+        return timings
+
+    def close(self):
+        if self.process.poll() is None:
+            self.stdin.close()
+            self.process.wait(timeout=30)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Mean, median and p95 in milliseconds"""
+    ordered = sorted(samples)
+    count = len(ordered)
+    return {
+        "mean": round(1000 * sum(ordered) / count, 4),
+        "p50": round(1000 * ordered[count // 2], 4),
+        "p95": round(1000 * ordered[min(count - 1, int(0.95 * count))], 4),
+        "samples": count,
+    }
+
+
+def db_path_for(variant: str, directories: Dict[str, str]) -> str:
+    if variant == "memory":
+        return ":memory:"
+    return os.path.join(directories[variant], "bench.db")
+
+
+def run_variant(variant: str, server_path: str, db_path: str, sizes: List[int], rounds: int,
+                taunts_per_game: int, seed: int) -> List[Dict[str, Any]]:
+    """Grow one database through the sizes, timing the tools at each step"""
+    rng = random.Random(seed)
+    server = BenchServer(server_path, db_path)
+    results = []
+    try:
+        # Keep process start-up and schema creation out of the first sample
+        server.call("initialize")
+        for size in sizes:
+            missing = max(0, size - server.games)
+            if missing:
+                seconds = server.fill(missing, taunts_per_game, rng)
+                log(f"{variant}: stored {missing} games in {seconds:.1f}s ({missing / seconds:,.0f} games/s)")
+
+            stored = server.games
+            timings = server.measure(rounds, rng)
+            for tool in TOOLS:
+                results.append({"variant": variant, "games": stored, "taunts": server.taunts, "tool": tool,
+                                **summarize(timings[tool])})
+            log(f"{variant}: {stored} games, view_game_state p50 "
+                f"{summarize(timings['view_game_state'])['p50']:.3f} ms")
+    finally:
+        server.close()
+    return results
+
+
+def print_table(results: List[Dict[str, Any]], file=sys.stdout):
+    """Print p50/p95 per tool, one row per variant and database size"""
+    print(f"{'variant':<8} {'games':>8}  " + "  ".join(f"{tool:>18}" for tool in TOOLS), file=file)
+    rows: Dict[Tuple[str, int], Dict[str, Dict[str, Any]]] = {}
+    for result in results:
+        rows.setdefault((result["variant"], result["games"]), {})[result["tool"]] = result
+    for (variant, games), by_tool in rows.items():
+        cells = [f"{by_tool[tool]['p50']:>8.3f} /{by_tool[tool]['p95']:>8.3f}" for tool in TOOLS]
+        print(f"{variant:<8} {games:>8}  " + "  ".join(f"{cell:>18}" for cell in cells), file=file)
+    print("(p50 / p95 latency in ms per round trip)", file=file)
+
+
+def plot(results: List[Dict[str, Any]], path: str):
+    """Chart p50 latency against stored games, one panel per tool"""
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("Error: matplotlib is required for --plot (pip install matplotlib)", file=sys.stderr)
+        sys.exit(1)
+
+    figure, axes = plt.subplots(2, 3, figsize=(15, 8), sharex=True)
+    for axis, tool in zip(axes.flat, TOOLS):
+        for variant in VARIANTS:
+            points = [(r["games"], r["p50"]) for r in results if r["tool"] == tool and r["variant"] == variant]
+            if points:
+                axis.plot(*zip(*points), marker="o", label=variant)
+        axis.set_title(tool)
+        axis.set_xscale("symlog")
+        axis.set_ylabel("p50 ms")
+        axis.grid(True, alpha=0.3)
+    for axis in axes[-1]:
+        axis.set_xlabel("stored games")
+    axes.flat[0].legend()
+    figure.tight_layout()
+    figure.savefig(path)
+
+
+def main():
+    """Main entry point for the storage benchmark"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Per-tool MCP latency as the game database grows")
+    parser.add_argument("--server", default=DEFAULT_SERVER,
+                        help="Path to the game-mcp-server binary")
+    parser.add_argument("--variants", default=",".join(VARIANTS),
+                        help=f"Comma-separated GAME_DB_PATH variants (default: {','.join(VARIANTS)})")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated numbers of stored games to measure at "
+                             f"(default: {','.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument("--rounds", "-r", type=int, default=20,
+                        help="Games played while timing at each size (default: 20)")
+    parser.add_argument("--taunts-per-game", type=int, default=2,
+                        help="Taunts stored with every filler game (default: 2)")
+    parser.add_argument("--tmpfs-dir", default="/dev/shm",
+                        help="RAM-backed directory for the tmpfs variant (default: /dev/shm)")
+    parser.add_argument("--disk-dir", default=".",
+                        help="Directory on disk for the disk variant (default: current directory)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Random seed (default: 0)")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the results as JSON")
+    parser.add_argument("--plot", metavar="FILE", default=None,
+                        help="Write a latency chart (PNG/SVG, requires matplotlib)")
+
+    args = parser.parse_args()
+
+    variants = [variant.strip() for variant in args.variants.split(",") if variant.strip()]
+    unknown = [variant for variant in variants if variant not in VARIANTS]
+    if unknown:
+        parser.error(f"unknown variant(s): {', '.join(unknown)}")
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+
+    if not os.path.exists(args.server):
+        print(f"Error: MCP server not found at {args.server} (cargo build --release)", file=sys.stderr)
+        sys.exit(1)
+
+    directories = {}
+    results = []
+    try:
+        for variant in variants:
+            if variant != "memory":
+                base = args.tmpfs_dir if variant == "tmpfs" else args.disk_dir
+                directories[variant] = tempfile.mkdtemp(prefix="ttt-bench-", dir=base)
+            results.extend(run_variant(variant, args.server, db_path_for(variant, directories), sizes,
+                                       args.rounds, args.taunts_per_game, args.seed))
+    finally:
+        for directory in directories.values():
+            shutil.rmtree(directory, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_table(results)
+
+    if args.plot:
+        plot(results, args.plot)
+        print(f"Chart written to {args.plot}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Tests for ai_agent.py (python3 -m pytest scripts/test_ai_agent.py)"""
+
+import threading
+import time
+from typing import Dict
+
+from ai_agent import MoveSearch, TicTacToeAgent, minimax_strategy, winner
+from game_annotator import solve
+
+DEADLINE = 0.05
+
+
+def make_agent(strategy) -> TicTacToeAgent:
+    # select_move never talks to the server; the client is not used
+    return TicTacToeAgent(verbose=False, client=object(), strategy=strategy)
+
+
+def reachable_positions() -> Dict[str, str]:
+    """Every position reachable from the empty board that still has a move to play, with the player to move"""
+    positions = {}
+    pending = [("." * 9, "X")]
+    while pending:
+        cells, player = pending.pop()
+        if cells in positions:
+            continue
+        positions[cells] = player
+        if winner(cells) is None and "." in cells:
+            opponent = "O" if player == "X" else "X"
+            pending.extend((cells[:index] + player + cells[index + 1:], opponent)
+                           for index, cell in enumerate(cells) if cell == ".")
+    return {cells: player for cells, player in positions.items() if winner(cells) is None and "." in cells}
+
+
+# Deadlines
+
+def test_deadline_cuts_off_strategy_and_plays_last_offer():
+    release = threading.Event()
+
+    def stubborn(cells, player, search):
+        # Offers a move, then keeps "thinking" without ever polling expired()
+        search.offer((2, 1), depth=3)
+        release.wait(10)
+        return (0, 0)
+
+    agent = make_agent(stubborn)
+    started = time.monotonic()
+    try:
+        move = agent.select_move("X.O......", "X", deadline=started + DEADLINE)
+        elapsed = time.monotonic() - started
+    finally:
+        release.set()
+
+    assert move == (2, 1)
+    assert elapsed < DEADLINE + 0.5
+    assert agent.move_stats[-1]["timedOut"] and agent.move_stats[-1]["depth"] == 3
+
+
+def test_deadline_without_offer_plays_an_empty_cell():
+    release = threading.Event()
+
+    def silent(cells, player, search):
+        release.wait(10)
+
+    agent = make_agent(silent)
+    try:
+        move = agent.select_move("XOXOXO...", "X", deadline=time.monotonic() + DEADLINE)
+    finally:
+        release.set()
+
+    assert move in {(2, 0), (2, 1), (2, 2)}
+    assert agent.move_stats[-1]["timedOut"]
+
+
+def test_minimax_out_of_time_still_returns_a_move():
+    search = MoveSearch(deadline=time.monotonic())
+    assert minimax_strategy("." * 9, "X", search) == (1, 1)
+    assert search.result() == (None, 0)
+
+
+# Playing strength
+
+def test_minimax_is_optimal_in_every_reachable_position():
+    positions = reachable_positions()
+    assert len(positions) == 4520
+
+    for cells, player in positions.items():
+        row, col = minimax_strategy(cells, player, MoveSearch())
+        index = row * 3 + col
+        assert cells[index] == "."
+
+        opponent = "O" if player == "X" else "X"
+        value = -solve(cells[:index] + player + cells[index + 1:], opponent)[0]
+        assert value == solve(cells, player)[0], (cells, player, (row, col))
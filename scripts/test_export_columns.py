@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Tests for export_columns.py (python3 -m pytest scripts/test_export_columns.py)"""
+
+import sqlite3
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from export_columns import ColumnarExporter, load_columns, PLAYER_CODES
+from game_archive import SCHEMA
+
+TAUNTS_TABLE = """CREATE TABLE IF NOT EXISTS taunts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    game_id TEXT NOT NULL,
+    message TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    source TEXT
+)"""
+# As created by older servers: no id after timestamp, so only the query's
+# ORDER BY can keep same-second rows in insertion order
+OLD_INDEXES = (
+    "CREATE INDEX idx_moves_game ON moves (game_id, timestamp, player, row, col, source)",
+    "CREATE INDEX idx_taunts_game ON taunts (game_id, timestamp, message)",
+)
+
+
+def make_database(path, games):
+    """games: {id: (moves as (player, row, col, timestamp), taunts as (message, timestamp))}"""
+    conn = sqlite3.connect(path)
+    for sql in (*SCHEMA, TAUNTS_TABLE, *OLD_INDEXES):
+        conn.execute(sql)
+    for game_id, (moves, taunts) in games.items():
+        conn.execute("INSERT INTO games VALUES (?, 'X', 'O', 'X', 'InProgress', 100, 100)", (game_id,))
+        conn.executemany("INSERT INTO moves (game_id, player, row, col, timestamp, source) "
+                         "VALUES (?, ?, ?, ?, ?, 'UI')", [(game_id, *move) for move in moves])
+        conn.executemany("INSERT INTO taunts (game_id, message, timestamp, source) VALUES (?, ?, ?, 'MCP')",
+                         [(game_id, *taunt) for taunt in taunts])
+    conn.commit()
+    conn.close()
+
+
+def test_same_second_moves_keep_play_order(tmp_path):
+    db_path = str(tmp_path / "game.db")
+    # Played X(2,2) then O(0,0) within one second: the index alone returns
+    # O first (player/row/col order)
+    make_database(db_path, {
+        "game-a": ([("X", 2, 2, 100), ("O", 0, 0, 100), ("X", 1, 1, 101)], [("second", 100), ("first", 99)]),
+        "game-b": ([("X", 0, 1, 100)], [("zz", 100), ("aa", 100)]),
+    })
+    ColumnarExporter(db_path, str(tmp_path / "export")).run()
+    data = load_columns(str(tmp_path / "export"))
+
+    moves = data.game_moves(0)
+    assert data.moves["ply"][moves].tolist() == [0, 1, 2]
+    assert data.moves["cell"][moves].tolist() == [8, 0, 4]
+    assert data.moves["player"][moves].tolist() == [PLAYER_CODES["X"], PLAYER_CODES["O"], PLAYER_CODES["X"]]
+
+    moves = data.game_moves(1)
+    assert data.moves["ply"][moves].tolist() == [0]
+    assert data.moves["cell"][moves].tolist() == [1]
+
+    taunts = data.game_taunts(0)
+    assert [data.taunt_message(i) for i in range(taunts.start, taunts.stop)] == ["first", "second"]
+    taunts = data.game_taunts(1)
+    assert [data.taunt_message(i) for i in range(taunts.start, taunts.stop)] == ["zz", "aa"]
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Tests for game_archive.py (python3 -m pytest scripts/test_game_archive.py)"""
+
+import os
+import sqlite3
+import zlib
+
+import pytest
+
+from game_archive import (ArchiveReader, ArchiveWriter, ArchivedGame, encode_game, decode_game, pack, unpack,
+                          SCHEMA, HEADER, BLOCK_HEADER, INDEX_ENTRY, TRAILER, MAGIC, INDEX_MAGIC, FLAG_PLAYERS)
+
+GAME_ID = "3f2b8c1e-4d5a-4e6f-9a7b-1c2d3e4f5a6b"
+
+
+def make_database(path, games):
+    """games: {id: (status, created_at, moves as (player, row, col, timestamp, source))}"""
+    conn = sqlite3.connect(path)
+    for sql in SCHEMA:
+        conn.execute(sql)
+    for game_id, (status, created_at, moves) in games.items():
+        # In progress: the player after the last mover is to move
+        turn = ("O" if moves[-1][0] == "X" else "X") if moves else "X"
+        conn.execute("INSERT INTO games VALUES (?, 'X', 'O', ?, ?, ?, ?)",
+                     (game_id, turn, status, created_at, moves[-1][3] if moves else created_at))
+        conn.executemany("INSERT INTO moves (game_id, player, row, col, timestamp, source) VALUES (?, ?, ?, ?, ?, ?)",
+                         [(game_id, *move) for move in moves])
+    conn.commit()
+    conn.close()
+
+
+def read_database(path):
+    conn = sqlite3.connect(path)
+    games = conn.execute("SELECT id, human_player, ai_player, current_turn, status, created_at, updated_at "
+                         "FROM games ORDER BY rowid").fetchall()
+    moves = conn.execute("SELECT game_id, player, row, col, timestamp, source FROM moves ORDER BY id").fetchall()
+    conn.close()
+    return games, moves
+
+
+def sample_games(prefix, count, created_at=1_700_000_000):
+    games = {}
+    for number in range(count):
+        start = created_at + 100 * number
+        # Game ids alternate between UUIDs and plain text; move counts
+        # cover odd and even (half-filled last move byte) lengths
+        game_id = f"{GAME_ID[:-4]}{prefix}{number:03d}" if number % 2 else f"{prefix}-game-{number}"
+        cells = [4, 0, 8, 2, 6, 3, 5, 1, 7][:number % 9 + 1]
+        moves = [("X" if ply % 2 == 0 else "O", cell // 3, cell % 3, start + ply, "MCP" if ply % 2 else "UI")
+                 for ply, cell in enumerate(cells)]
+        games[game_id] = ("InProgress", start, moves)
+    return games
+
+
+def test_round_trip_with_append_and_torn_tail(tmp_path, capsys):
+    archive = str(tmp_path / "games.ttta")
+    first, second = str(tmp_path / "first.db"), str(tmp_path / "second.db")
+    make_database(first, sample_games("a", 5))
+    make_database(second, sample_games("b", 3))
+
+    # 5 games in blocks of 2 leave a short last block, which the append reopens
+    assert pack(first, archive, games_per_block=2) == 5
+    assert pack(second, archive, games_per_block=8) == 3
+    with ArchiveReader(archive) as reader:
+        assert reader.games_per_block == 2
+        assert [count for _, _, count in reader.blocks] == [2, 2, 2, 2]
+        assert [game.id for game in reader] == [*sample_games("a", 5), *sample_games("b", 3)]
+        last_block = reader.blocks[-1]
+
+    # A writer that died mid-block: no index, no trailer, half a block
+    os.truncate(archive, last_block[0] + BLOCK_HEADER.size + last_block[1] // 2)
+    reader = ArchiveReader(archive)
+    assert "rebuilding it by scanning" in capsys.readouterr().err
+    assert len(reader) == 6 and len(reader.blocks) == 3
+    assert reader[-1].id == list(sample_games("b", 3))[0]
+    reader.close()
+
+    restored = str(tmp_path / "restored.db")
+    assert unpack(archive, restored) == 6
+    first_games, first_moves = read_database(first)
+    second_games, second_moves = read_database(second)
+    games, moves = read_database(restored)
+    assert games == first_games + second_games[:1]
+    assert moves == first_moves + [move for move in second_moves if move[0] == second_games[0][0]]
+
+    # Reopening for append drops the torn bytes and writes a fresh index
+    ArchiveWriter(archive).close()
+    with ArchiveReader(archive) as reader:
+        assert len(reader) == 6
+        assert reader.data_end + len(reader.blocks) * INDEX_ENTRY.size + TRAILER.size == os.path.getsize(archive)
+
+
+def test_move_packing():
+    # Head byte: 3 moves, InProgress; no flags; zero time deltas; then the
+    # cells two per byte, low nibble first
+    game = ArchivedGame.from_cells([4, 0, 8])
+    assert encode_game(game) == bytes([3, 0, 0, 0, 0x04, 0x08])
+
+    full = ArchivedGame.from_cells([4, 0, 8, 2, 6, 3, 5, 1, 7], status="Draw", first_player="O", created_at=50)
+    decoded, end = decode_game(encode_game(full, base_time=40), 0, base_time=40)
+    assert decoded == full and end == len(encode_game(full, base_time=40))
+
+    # Players that do not alternate are stored explicitly
+    repeated = full._replace(players=("X", "X", "O", "X", "O", "O", "X", "O", "X"))
+    record = encode_game(repeated)
+    assert record[1] & FLAG_PLAYERS
+    assert decode_game(record, 0)[0] == repeated
+
+    with pytest.raises(ValueError):
+        encode_game(ArchivedGame.from_cells([4, 9]))
+
+
+def test_block_framing(tmp_path):
+    archive = str(tmp_path / "games.ttta")
+    games = [ArchivedGame.from_cells([cell], created_at=1000 + cell, id=f"g{cell}") for cell in range(5)]
+    with ArchiveWriter(archive, games_per_block=2) as writer:
+        for game in games:
+            writer.append(game)
+
+    with open(archive, "rb") as f:
+        data = f.read()
+    assert HEADER.unpack_from(data) == (MAGIC, 1, 2)
+
+    position, blocks = HEADER.size, []
+    while len(blocks) < 3:
+        length, count = BLOCK_HEADER.unpack_from(data, position)
+        payload = zlib.decompress(data[position + BLOCK_HEADER.size:position + BLOCK_HEADER.size + length])
+        assert int.from_bytes(payload[:4], "little") == count
+        blocks.append((position, length, count))
+        position += BLOCK_HEADER.size + length
+
+    index_offset, total, magic = TRAILER.unpack_from(data, len(data) - TRAILER.size)
+    assert (index_offset, total, magic) == (position, 5, INDEX_MAGIC)
+    assert list(INDEX_ENTRY.iter_unpack(data[index_offset:-TRAILER.size])) == blocks
+    assert [count for _, _, count in blocks] == [2, 2, 1]
+
+    with ArchiveReader(archive) as reader:
+        assert reader.blocks == blocks
+        assert [reader[i] for i in range(5)] == games
+
+
+def test_unpack_duplicate_id_fails(tmp_path):
+    archive, db = str(tmp_path / "games.ttta"), str(tmp_path / "restored.db")
+    with ArchiveWriter(archive) as writer:
+        writer.append(ArchivedGame.from_cells([4, 0], id=GAME_ID))
+
+    assert unpack(archive, db) == 1
+    with pytest.raises(sqlite3.IntegrityError):
+        unpack(archive, db)
+    assert read_database(db)[0] == [(GAME_ID, "X", "O", "X", "InProgress", 0, 0)]
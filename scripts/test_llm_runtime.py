@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Tests for llm_runtime.py (python3 -m pytest scripts/test_llm_runtime.py)"""
+
+import asyncio
+import types
+from collections import Counter
+from typing import Optional, Dict, Any, List
+
+import pytest
+
+import llm_runtime
+from llm_runtime import (TOOLS, COMPACT_BOARD_TOOLS, START_PROMPT, CONTINUE_PROMPT, MAX_HISTORY_MESSAGES,
+                         ProviderAdapter, RateScheduler, TokenBucket, AgentSession, SimulatedAdapter,
+                         run_sessions)
+
+
+class FakeClock:
+    """Stands in for time.monotonic and asyncio.sleep: sleeping advances the clock instantly"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self._sleep = asyncio.sleep
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float):
+        self.now += max(0.0, delay)
+        await self._sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(llm_runtime, "time", types.SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+    return clock
+
+
+def max_in_window(grants, window: float = 60.0) -> float:
+    """Most units granted within any window seconds; grants are (time, units) in time order"""
+    best = total = 0.0
+    start = 0
+    for time, units in grants:
+        total += units
+        while grants[start][0] <= time - window:
+            total -= grants[start][1]
+            start += 1
+        best = max(best, total)
+    return best
+
+
+def run_grants(scheduler: RateScheduler, clock: FakeClock, sessions: Dict[str, List[int]],
+               join_after: Optional[Dict[str, int]] = None):
+    """
+    Run one task per session that sends its requests (token estimates) one
+    after another, like AgentSession; return (session, time, tokens) in
+    grant order. join_after holds back a session until that many requests
+    have been granted.
+    """
+    granted = []
+
+    async def session(name: str, requests: List[int]):
+        while len(granted) < (join_after or {}).get(name, 0):
+            await clock.sleep(0)
+        for tokens in requests:
+            await scheduler.acquire(name, tokens)
+            granted.append((name, clock.now, tokens))
+            scheduler.release(tokens, tokens)
+
+    async def run():
+        try:
+            await asyncio.gather(*(session(name, requests) for name, requests in sessions.items()))
+        finally:
+            scheduler.close()
+
+    asyncio.run(run())
+    return granted
+
+
+# TokenBucket
+
+def test_token_bucket_never_exceeds_per_minute(clock):
+    bucket = TokenBucket(60)
+    grants = []
+    for _ in range(200):
+        clock.now += bucket.delay(1)
+        bucket.take(1)
+        grants.append((clock.now, 1))
+
+    assert max_in_window(grants) <= 60
+    # The burst is available at once, the rest is spread over the minute
+    assert [time for time, _ in grants[:10]] == [1000.0] * 10
+    assert grants[10][0] == pytest.approx(1001.2)
+
+
+def test_token_bucket_adjust_and_drain(clock):
+    bucket = TokenBucket(600)  # capacity 100, refills 500 per minute
+    bucket.take(100)
+    assert bucket.delay(50) == pytest.approx(6.0)
+
+    bucket.adjust(-40)  # the request used 40 fewer than estimated
+    assert bucket.delay(40) == 0.0
+
+    bucket.drain()
+    assert bucket.delay(1) > 0
+    clock.now += 12
+    assert bucket.delay(100) == 0.0
+
+
+# RateScheduler
+
+def test_scheduler_requests_per_minute(clock):
+    scheduler = RateScheduler(rpm=60, tpm=1_000_000)
+    granted = run_grants(scheduler, clock, {f"s{i}": [1] * 50 for i in range(3)})
+
+    assert len(granted) == 150
+    assert max_in_window([(time, 1) for _, time, _ in granted]) <= 60
+    # Equal costs: the sessions take turns
+    shares = Counter(session for session, _, _ in granted[:60])
+    assert shares == {"s0": 20, "s1": 20, "s2": 20}
+
+
+def test_scheduler_tokens_per_minute(clock):
+    scheduler = RateScheduler(rpm=10_000, tpm=6000)  # burst 1000, then 5000 per minute
+    granted = run_grants(scheduler, clock, {"s": [500] * 30})
+
+    assert max_in_window([(time, tokens) for _, time, tokens in granted]) <= 6000
+    assert granted[-1][1] - 1000.0 == pytest.approx(60 * (30 * 500 - 1000) / 5000)
+
+
+def test_scheduler_fair_by_token_cost(clock):
+    # One session's requests cost 20x the other's; while both are waiting,
+    # they get the same share of the tokens per minute, not of the requests
+    scheduler = RateScheduler(rpm=10_000, tpm=6000)
+    granted = run_grants(scheduler, clock, {"heavy": [1000] * 10, "light": [50] * 400})
+
+    tokens = Counter()
+    for session, time, cost in granted:
+        tokens[session] += cost
+        if tokens["heavy"] < 10 * 1000:
+            assert abs(tokens["heavy"] - tokens["light"]) <= 1000
+    assert tokens["heavy"] == 10 * 1000
+    assert max_in_window([(time, cost) for _, time, cost in granted]) <= 6000
+
+
+def test_scheduler_idle_session_does_not_bank_credit(clock):
+    # The newcomer joins at the current virtual time: it takes turns with
+    # the busy session instead of being served ahead for what it missed
+    scheduler = RateScheduler(rpm=10_000, tpm=6000)
+    granted = run_grants(scheduler, clock, {"busy": [100] * 70, "newcomer": [100] * 20},
+                         join_after={"newcomer": 50})
+
+    assert [session for session, _, _ in granted[:50]] == ["busy"] * 50
+    shares = Counter(session for session, _, _ in granted[50:70])
+    assert abs(shares["busy"] - shares["newcomer"]) <= 1
+
+
+# Adapters and tools
+
+def test_incomplete_adapter_fails_on_construction():
+    class Incomplete(ProviderAdapter):
+        def new_conversation(self):
+            return []
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_compact_board_tools_are_offered():
+    assert COMPACT_BOARD_TOOLS <= {tool["name"] for tool in TOOLS}
+
+
+# Sessions
+
+class FakeTools:
+    """ToolExecutor stand-in: the opponent never moves, so the model keeps waiting"""
+
+    def __init__(self):
+        self.calls = Counter()
+
+    async def execute(self, url: str, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        self.calls[name] += 1
+        return {"board": "X........", "currentTurn": "O", "aiPlayer": "X", "status": "InProgress"}
+
+
+def test_session_keeps_text_replies_and_bounds_history():
+    tools = FakeTools()
+    session = AgentSession("s", SimulatedAdapter(latency=(0.0, 0.0)), RateScheduler(rpm=1e6, tpm=1e9),
+                           tools, "http://unused", max_turns=100, poll_interval=0.0)
+
+    async def run():
+        try:
+            await session.run()
+        finally:
+            session.scheduler.close()
+
+    asyncio.run(run())
+
+    conversation = session.conversation
+    assert session.turns == 100 and tools.calls["view_game_state"] == 50
+    assert conversation[0] == {"role": "user", "content": START_PROMPT}
+    assert len(conversation) <= MAX_HISTORY_MESSAGES
+    # The kept tail starts at a model reply, and every "continue" prompt
+    # follows the text the model answered with
+    assert conversation[1]["role"] == "assistant"
+    for previous, entry in zip(conversation, conversation[1:]):
+        if entry.get("content") == CONTINUE_PROMPT:
+            assert previous == {"role": "assistant", "content": "Your move."}
+
+
+def test_run_sessions_needs_a_server_per_session():
+    with pytest.raises(ValueError):
+        asyncio.run(run_sessions("simulated", 2, ["http://localhost:3000/mcp"], rpm=60, tpm=40_000))